@@ -0,0 +1,71 @@
+"""
+Hackathon source adapters.
+
+SOURCES maps each source name to the "module:function" that fetches it. The module,
+and the scraping libraries it pulls in, is only imported when that source runs, so
+importing fetch_and_store (and the bots) stays cheap. Adapters shipped in other
+packages can register under the "hackradar.adapters" entry point group:
+
+    [project.entry-points."hackradar.adapters"]
+    MySource = "my_package.adapter:fetch_hackathons"
+"""
+
+import logging
+from importlib import import_module
+from importlib.metadata import entry_points
+
+ENTRY_POINT_GROUP = "hackradar.adapters"
+
+
+class SourceNotConfiguredError(Exception):
+    """Raised by an adapter that lacks the credentials or settings it needs to run."""
+
+
+SOURCES = {
+    "MLH": "adapters.mlh:scrape_mlh_events",
+    "Devpost": "adapters.devpost:fetch_devpost_hackathons",
+    "Unstop": "adapters.unstop:fetch_unstop_hackathons",
+    "DoraHacks": "adapters.dorahacks:fetch_dorahacks_hackathons",
+    "Devfolio": "adapters.devfolio:fetch_devfolio_hackathons",
+    "Kaggle": "adapters.kaggle:fetch_kaggle_competitions",
+    "Hack2Skill": "adapters.hack2skill:fetch_hack2skill_hackathons",
+}
+
+# Upstream host (as keyed by adapters.http) of each source; a source whose host has an
+# open circuit breaker is skipped for the run.
+SOURCE_HOSTS = {
+    "MLH": "mlh.io",
+    "Devpost": "devpost.com",
+    "Unstop": "unstop.com",
+    "DoraHacks": "dorahacks.io",
+    "Devfolio": "devfolio.co",
+    "Kaggle": "kaggle.com",
+    "Hack2Skill": "hack2skill.com",
+}
+
+
+def registered_sources() -> dict:
+    """SOURCES plus adapters registered through entry points, as {name: "module:function"}."""
+    sources = dict(SOURCES)
+    try:
+        for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+            sources[entry_point.name] = entry_point.value
+    except Exception as e:
+        logging.error(f"Could not read {ENTRY_POINT_GROUP} entry points: {e}")
+    return sources
+
+
+def load_adapter(target: str):
+    """Import the adapter module of a "module:function" target and return the function."""
+    module_name, _, function_name = target.partition(":")
+    return getattr(import_module(module_name), function_name)
+
+
+def lazy_fetcher(target: str):
+    """A fetch function that imports its adapter on first call."""
+
+    def fetch():
+        return load_adapter(target)()
+
+    fetch.__name__ = target.partition(":")[2]
+    return fetch
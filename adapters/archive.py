@@ -0,0 +1,197 @@
+"""
+Local archive of the raw responses behind every scrape.
+
+fetch_and_store records each source's traffic with recording() and keeps it here,
+so rows can be rebuilt by the current adapters after a parsing fix, without
+touching the live sites (see fetch_and_store.reparse()). Layout under
+PAYLOAD_ARCHIVE_DIR:
+
+    objects/ab/ab12...     response bodies, named by the sha256 of the body and
+                           compressed with zstd (.zst) or, without the optional
+                           zstandard package, gzip (.gz)
+    runs/<Source>/<UTC timestamp>.json.gz
+                           one manifest per fetch: method, URL, status and kept
+                           headers of each response, and the hash of its body
+
+Bodies are content-addressed, so a listing that did not change between runs is
+stored once. Archiving is off unless PAYLOAD_ARCHIVE_DIR is set.
+
+Runs older than PAYLOAD_ARCHIVE_MAX_AGE_DAYS are deleted by prune(), which
+fetch_and_store.run() calls once a day and `python -m fetch_and_store prune` on
+demand. A body is touched whenever a run stores it again, so bodies that were not
+stored within the max age belong to deleted runs only and go with them.
+"""
+
+import gzip
+import hashlib
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from adapters import http, load_adapter, registered_sources
+from adapters.replay import Recorder, Replayer, decode_body, encode_body, load_fixture, save_fixture
+
+try:
+    import zstandard
+except ImportError:  # optional, bodies are gzipped instead
+    zstandard = None
+
+PAYLOAD_ARCHIVE_DIR = os.getenv("PAYLOAD_ARCHIVE_DIR", "")
+# Archived runs are kept this long; 0 keeps them forever
+PAYLOAD_ARCHIVE_MAX_AGE_DAYS = float(os.getenv("PAYLOAD_ARCHIVE_MAX_AGE_DAYS", "30"))
+PRUNE_INTERVAL_SECONDS = 24 * 60 * 60
+ZSTD_LEVEL = 10
+
+RUN_TIMESTAMP = "%Y%m%dT%H%M%S%fZ"
+
+_last_prune = None
+_prune_lock = threading.Lock()
+
+
+def archive_root(root=None) -> Path | None:
+    root = root if root is not None else PAYLOAD_ARCHIVE_DIR
+    return Path(root) if root else None
+
+
+def object_path(root: Path, digest: str, suffix: str) -> Path:
+    return root / "objects" / digest[:2] / f"{digest}{suffix}"
+
+
+def write_atomic(path: Path, data: bytes):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def store_blob(root: Path, content: bytes) -> str:
+    """Store a response body unless it is already archived; returns its sha256."""
+    digest = hashlib.sha256(content).hexdigest()
+    for suffix in (".zst", ".gz"):
+        try:
+            # Touched, so prune() keeps the bodies recent runs still use
+            os.utime(object_path(root, digest, suffix))
+            return digest
+        except FileNotFoundError:
+            continue
+    if zstandard is not None:
+        data = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(content)
+        write_atomic(object_path(root, digest, ".zst"), data)
+    else:
+        write_atomic(object_path(root, digest, ".gz"), gzip.compress(content, mtime=0))
+    return digest
+
+
+def read_blob(root: Path, digest: str) -> bytes:
+    path = object_path(root, digest, ".zst")
+    if path.exists():
+        if zstandard is None:
+            raise RuntimeError(f"{path} is zstd-compressed; install zstandard to read it")
+        return zstandard.ZstdDecompressor().decompress(path.read_bytes())
+    return gzip.decompress(object_path(root, digest, ".gz").read_bytes())
+
+
+def save_run(source: str, exchanges: list[dict], root=None) -> Path | None:
+    """Archive the exchanges of one fetch of source; returns the manifest's path."""
+    root = archive_root(root)
+    if root is None or not exchanges:
+        return None
+    manifest = []
+    for exchange in exchanges:
+        entry = {k: v for k, v in exchange.items() if k not in ("text", "base64")}
+        entry["blob"] = store_blob(root, decode_body(exchange))
+        manifest.append(entry)
+    path = root / "runs" / source / f"{datetime.now(timezone.utc):{RUN_TIMESTAMP}}.json.gz"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    save_fixture(path, manifest, source)
+    return path
+
+
+@contextmanager
+def recording(source: str, root=None):
+    """Archive the responses of the requests made inside the block."""
+    if archive_root(root) is None:
+        yield
+        return
+    recorder = Recorder()
+    try:
+        with http.use_transport(recorder):
+            yield
+    finally:
+        try:
+            save_run(source, recorder.exchanges, root)
+        except OSError as e:
+            # Losing the archive of one run must not lose the run
+            logging.error(f"Could not archive responses from {source}: {e}")
+
+
+def run_time(path: Path) -> datetime:
+    return datetime.strptime(path.name.removesuffix(".json.gz"), RUN_TIMESTAMP).replace(
+        tzinfo=timezone.utc
+    )
+
+
+def find_runs(sources=None, since: datetime = None, root=None) -> list[Path]:
+    """Manifests of the archived runs, oldest first."""
+    root = archive_root(root)
+    if root is None:
+        return []
+    paths = [
+        path
+        for path in (root / "runs").glob("*/*.json.gz")
+        if (sources is None or path.parent.name in sources)
+        and (since is None or run_time(path) >= since)
+    ]
+    return sorted(paths, key=run_time)
+
+
+def prune(max_age_days: float = None, root=None) -> int:
+    """Delete the runs archived more than max_age_days ago and their bodies; returns the runs."""
+    root = archive_root(root)
+    max_age_days = PAYLOAD_ARCHIVE_MAX_AGE_DAYS if max_age_days is None else max_age_days
+    if root is None or max_age_days <= 0:
+        return 0
+    cutoff = datetime.now(timezone.utc) - timedelta(days=max_age_days)
+    expired = [path for path in find_runs(root=root) if run_time(path) < cutoff]
+    for path in expired:
+        path.unlink(missing_ok=True)
+    bodies = 0
+    for path in (root / "objects").glob("*/*"):
+        if path.stat().st_mtime < cutoff.timestamp():
+            path.unlink(missing_ok=True)
+            bodies += 1
+    logging.info(f"Pruned {len(expired)} archived runs and {bodies} response bodies.")
+    return len(expired)
+
+
+def prune_if_due():
+    """prune() at most once per PRUNE_INTERVAL_SECONDS in this process."""
+    global _last_prune
+    with _prune_lock:
+        if _last_prune is not None and time.monotonic() - _last_prune < PRUNE_INTERVAL_SECONDS:
+            return
+        _last_prune = time.monotonic()
+    try:
+        prune()
+    except OSError as e:
+        logging.error(f"Could not prune the payload archive: {e}")
+
+
+def load_run(path: Path, root=None) -> list[dict]:
+    """A manifest's exchanges with their bodies, ready for a Replayer."""
+    root = archive_root(root)
+    return [
+        {**entry, **encode_body(read_blob(root, entry["blob"]))} for entry in load_fixture(path)
+    ]
+
+
+def replay_run(path: Path, root=None) -> list:
+    """Run the source's current adapter against an archived run, offline."""
+    source = path.parent.name
+    fetch = load_adapter(registered_sources()[source])
+    with http.use_transport(Replayer(load_run(path, root))):
+        return fetch()
@@ -1,21 +1,22 @@
-import hashlib
 from datetime import datetime
 
 import requests
 
+from adapters import http, parsing
+from adapters.ids import hackathon_id
 from backend.schemas import Hackathon
 
 
-def fetch_devfolio_hackathons():
+def fetch_devfolio_hackathons() -> list[Hackathon]:
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
     }
 
-    hackathons = []
+    rows = []
     page = 1
     while True:
         try:
-            response = requests.get(
+            response = http.get(
                 "https://api.devfolio.co/api/hackathons",
                 params={"filter": "application_open", "page": page},
                 headers=headers,
@@ -33,7 +34,6 @@ def fetch_devfolio_hackathons():
                 banner_link = item.get("cover_img")
                 start_str = item.get("starts_at")
                 end_str = item.get("ends_at")
-                registation_link = f"{url}/application"
 
                 start_date = None
                 end_date = None
@@ -68,7 +68,7 @@ def fetch_devfolio_hackathons():
                 prize_pool = "See details"
                 try:
                     prizes_url = f"https://api.devfolio.co/api/hackathons/{slug}/prizes"
-                    prizes_resp = requests.get(prizes_url, headers=headers, timeout=5)
+                    prizes_resp = http.get(prizes_url, headers=headers, timeout=5)
                     if prizes_resp.status_code == 200:
                         prizes_data = prizes_resp.json()
                         if prizes_data:
@@ -92,23 +92,23 @@ def fetch_devfolio_hackathons():
                     print(f"Error fetching prizes for {slug}: {e}")
 
                 if title and start_date and end_date and url:
-                    hackathon = Hackathon(
-                        id=hashlib.sha256(title.encode()).hexdigest(),
-                        title=title,
-                        start_date=start_date,
-                        end_date=end_date,
-                        location=item.get("location") or "Everywhere",
-                        url=url,
-                        mode="Online" if item.get("is_online") else "Offline",
-                        status=status,
-                        source="devfolio",
-                        banner_url=banner_link,
-                        registation_link=registation_link,
-                        prize_pool=prize_pool,
-                        team_size=f"{item.get('team_min', 1)}-{item.get('team_size', 4)} members",
-                        eligibility="Open to all",  # Devfolio is generally open, API doesn't specify restrictions clearly in list
+                    rows.append(
+                        dict(
+                            id=hackathon_id("devfolio", slug),
+                            title=title,
+                            start_date=start_date,
+                            end_date=end_date,
+                            location=item.get("location") or "Everywhere",
+                            url=url,
+                            mode="Online" if item.get("is_online") else "Offline",
+                            status=status,
+                            source="devfolio",
+                            banner_url=banner_link,
+                            prize_pool=prize_pool,
+                            team_size=f"{item.get('team_min', 1)}-{item.get('team_size', 4)} members",
+                            eligibility="Open to all",  # Devfolio is generally open, API doesn't specify restrictions clearly in list
+                        )
                     )
-                    hackathons.append(hackathon)
 
             page += 1
 
@@ -116,7 +116,7 @@ def fetch_devfolio_hackathons():
             print(f"Error fetching page {page}: {e}")
             break
 
-    return hackathons
+    return parsing.validate(rows)
 
 
 if __name__ == "__main__":
@@ -1,28 +1,21 @@
 import hashlib
 import json
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import requests
 from bs4 import BeautifulSoup
-from pydantic import ValidationError
 
+from adapters import http, parsing
 from backend.schemas import Hackathon
 
-
-def get_banner_from_page(url: str) -> str | None:
-    if not url:
-        return None
-    try:
-        resp = requests.get(url, timeout=10)
-        resp.raise_for_status()
-        soup = BeautifulSoup(resp.content, "html.parser")
-        script = soup.find("script", type="application/ld+json")
-        if script:
-            data = json.loads(script.string)
-            return data.get("image")
-    except Exception as e:
-        print(f"Error fetching banner from {url}: {e}")
-    return None
+API_URL = "https://devpost.com/api/hackathons"
+# Upper bound on pages per run, in case ended hackathons stop being listed last
+DEVPOST_MAX_PAGES = int(os.getenv("DEVPOST_MAX_PAGES", "20"))
+# Pages requested ahead of the one being parsed
+LOOKAHEAD = 3
 
 
 def parse_hackathon_dates(date_str: str):
@@ -116,67 +109,101 @@ def format_devpost_prizes(item):
     return "\n".join(prizes)
 
 
-def fetch_devpost_hackathons() -> list[Hackathon]:
+def parse_devpost_page(text: str) -> tuple[list[Hackathon], int]:
     """
-    Fetches and validates hackathon data from the first 20 pages of the official Devpost API.
+    Hackathons of one page of the Devpost API, without the ended ones, and the number
+    of open items on the page. Rows failing validation are dropped from the list but
+    still counted, so only 0 means the page had no open hackathon left. Raises
+    ValueError when the page is not JSON.
     """
-    hackathons = []
-    for page in range(1, 4):
-        print(f"Fetching Devpost page {page}...")
-        url = f"https://devpost.com/api/hackathons?page={page}"
-        try:
-            resp = requests.get(url)
-            resp.raise_for_status()
-            hackathon_data = resp.json().get("hackathons", [])
-        except requests.RequestException as e:
-            print(f"Error fetching URL (page {page}): {e}")
-            continue
-        except ValueError:
-            print(f"Error decoding JSON from response on page {page}.")
+    hackathon_data = json.loads(text).get("hackathons", [])
+
+    rows = []
+    for item in hackathon_data:
+        if item.get("open_state") == "ended":
             continue
+        start_date, end_date = parse_hackathon_dates(item.get("submission_period_dates"))
+
+        mode = "Online"
+        location: str
+        if item.get("displayed_location"):
+            location = item["displayed_location"].get("location", "Online")
+        if location != "Online":
+            mode = "Offline"
+        else:
+            location = "Everywhere"
+
+        hackathon_url = item.get("url")
+        banner_url = item.get("thumbnail_url")
+        if banner_url:
+            if banner_url.startswith("//"):
+                banner_url = f"https:{banner_url}"
+            banner_url = banner_url.replace("medium_square", "original")
+
+        rows.append(
+            dict(
+                id=hashlib.sha256(str(item.get("id")).encode()).hexdigest(),
+                title=item.get("title"),
+                start_date=start_date,
+                end_date=end_date,
+                location=location,
+                url=item.get("url"),
+                mode=mode,
+                status=item.get("open_state"),
+                source="devpost",
+                tags=[theme["name"] for theme in item.get("themes", [])],
+                banner_url=banner_url,
+                prize_pool=format_devpost_prizes(item),
+                team_size="See details",
+                eligibility="See details",
+            )
+        )
+    return parsing.validate(rows), len(rows)
+
+
+def fetch_devpost_page(page: int) -> str | None:
+    print(f"Fetching Devpost page {page}...")
+    try:
+        resp = http.get(API_URL, params={"page": page})
+        resp.raise_for_status()
+    except requests.RequestException as e:
+        print(f"Error fetching URL (page {page}): {e}")
+        return None
+    return resp.text
 
-        for item in hackathon_data:
-            if item.get("open_state") == "ended":
-                break
-            start_date, end_date = parse_hackathon_dates(item.get("submission_period_dates"))
-
-            mode = "Online"
-            location: str
-            if item.get("displayed_location"):
-                location = item["displayed_location"].get("location", "Online")
-            if location != "Online":
-                mode = "Offline"
-            else:
-                location = "Everywhere"
-
-            hackathon_url = item.get("url")
-            banner_url = item.get("thumbnail_url")
-            if banner_url:
-                if banner_url.startswith("//"):
-                    banner_url = f"https:{banner_url}"
-                banner_url = banner_url.replace("medium_square", "original")
-
-            try:
-                hackathon = Hackathon(
-                    id=hashlib.sha256(str(item.get("id")).encode()).hexdigest(),
-                    title=item.get("title"),
-                    start_date=start_date,
-                    end_date=end_date,
-                    location=location,
-                    url=item.get("url"),
-                    mode=mode,
-                    status=item.get("open_state"),
-                    source="devpost",
-                    tags=[theme["name"] for theme in item.get("themes", [])],
-                    banner_url=banner_url,
-                    prize_pool=format_devpost_prizes(item),
-                    team_size="See details",
-                    eligibility="See details",
-                )
-                hackathons.append(hackathon)
-            except ValidationError as e:
-                print(f"Skipping hackathon due to validation error: {item.get('title')}")
-                print(e)
+
+def fetch_devpost_hackathons() -> list[Hackathon]:
+    """
+    Fetches and validates open hackathons from the official Devpost API, page by page
+    until the first page without an open one (at most DEVPOST_MAX_PAGES).
+    The next LOOKAHEAD pages download while a page is parsed (see adapters.parsing), so
+    the pages after the last open one cost no extra wait, only a few wasted requests.
+    """
+    hackathons = []
+    with ThreadPoolExecutor(max_workers=LOOKAHEAD) as executor:
+        last_page = min(LOOKAHEAD, DEVPOST_MAX_PAGES)
+        pending = deque(
+            http.submit(executor, fetch_devpost_page, page) for page in range(1, last_page + 1)
+        )
+        while pending:
+            text = pending.popleft().result()
+            if text is not None:
+                try:
+                    page_hackathons, open_count = parsing.result(
+                        parsing.submit(parse_devpost_page, text)
+                    )
+                except ValueError as e:
+                    print(f"Error decoding JSON from a Devpost response: {e}")
+                else:
+                    if not open_count:
+                        break
+                    hackathons.extend(page_hackathons)
+            # A failed page says nothing about the next one, so it does not stop paging
+            if last_page < DEVPOST_MAX_PAGES:
+                last_page += 1
+                pending.append(http.submit(executor, fetch_devpost_page, last_page))
+        for future in pending:
+            future.cancel()
     return hackathons
 
 
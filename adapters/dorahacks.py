@@ -1,99 +1,139 @@
-import hashlib
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime
 
 import requests
 
+from adapters import http, parsing
+from adapters.ids import hackathon_id
 from backend.schemas import Hackathon
 
-
-def fetch_dorahacks_hackathons() -> list[Hackathon]:
-    base_url = "https://dorahacks.io/api/hackathon/"
-
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.36"
-    }
-
+BASE_URL = "https://dorahacks.io/api/hackathon/"
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.36"
+}
+STATUSES = ("upcoming", "ongoing")
+
+# Look up the prize of hackathons whose list entry has none on their detail endpoint
+DORAHACKS_PRIZE_DETAILS = os.getenv("DORAHACKS_PRIZE_DETAILS", "off").lower() == "on"
+DETAIL_CONCURRENCY = 4
+# Prizes rarely change; a detail response is reused by the runs of the next day
+DETAIL_CACHE_SECONDS = 24 * 3600
+
+_prize_cache = {}  # uname -> (fetched_at, detail response)
+_prize_cache_lock = threading.Lock()
+
+
+def format_prize(amount, token) -> str | None:
+    return f"- Total: {amount} {token or 'USD'}" if amount else None
+
+
+def fetch_detail_prize(uname: str) -> str | None:
+    """
+    The prize pool from a hackathon's detail endpoint, cached for DETAIL_CACHE_SECONDS.
+    A cached response is still handed to a recording transport, so archived runs hold
+    every detail a reparse needs. Replays neither read nor fill the cache.
+    """
+    url = f"{BASE_URL}{uname}/"
+    use_cache = not http.is_offline()
+    with _prize_cache_lock:
+        cached = _prize_cache.get(uname) if use_cache else None
+    fresh = cached is not None and time.monotonic() - cached[0] < DETAIL_CACHE_SECONDS
     try:
-        all_hackathons = []
-        # Fetch upcoming and ongoing hackathons with pagination
-        for status in ["upcoming", "ongoing"]:
-            url = base_url
-            params = {"page": 1, "page_size": 24, "status": status}
-
-            while url:
-                response = requests.get(url, params=params, headers=headers)
-                response.raise_for_status()
-                data = response.json()
-
-                all_hackathons.extend(data.get("results", []))
-
-                # Get the next page URL, if it exists
-                url = data.get("next")
-                # Subsequent requests use the full URL from 'next', so we clear params
-                params = None
-
-        hackathons_data = []
-        for hack in all_hackathons:
-            start_date = (
-                datetime.fromtimestamp(hack.get("start_time")) if hack.get("start_time") else None
-            )
-            end_date = (
-                datetime.fromtimestamp(hack.get("end_time")) if hack.get("end_time") else None
-            )
-
-            curr_status = hack.get("status")
-            status = "upcoming" if curr_status == 0 else "ongoing"
-            mode = "Online" if hack.get("participation_form") == "Virtual" else "Offline"
-            location = "Everywhere" if not hack.get("venue_name") else hack.get("venue_name")
-
-            # Fetch prizes
-            prize_pool = "See details"
-            try:
-                # DoraHacks doesn't have a specific prizes endpoint, but the detail endpoint has 'amount' and 'token'
-                # or sometimes it's in the description.
-                # Based on analysis, 'amount' (bonus_price in some contexts) seems to be the total prize pool.
-                # Let's fetch details by ID to be sure, or use the list item if available.
-
-                # The list item 'hack' might already have it?
-                # In the list response (from previous analysis), we didn't see 'amount' directly.
-                # But let's try to fetch details if we want to be accurate.
-                # However, to avoid too many requests, let's check if 'bonus_price' or similar is in 'hack' object first.
-
-                amount = hack.get("bonus_price")
-                token = hack.get("token", "USD")
-
-                if amount:
-                    prize_pool = f"- Total: {amount} {token}"
-                else:
-                    # If not in list, try detail fetch (optional, might slow down)
-                    # For now, let's stick to list data if possible to avoid 20+ requests per run.
-                    # If 'bonus_price' is 0 or missing, we default to "See details".
-                    pass
-
-            except Exception as e:
-                print(f"Error processing prizes for {hack.get('title')}: {e}")
-
-            hackathon = Hackathon(
-                id=hashlib.sha256(hack.get("title").encode()).hexdigest(),
-                title=hack.get("title"),
-                start_date=start_date.date() if start_date else None,
-                end_date=end_date.date() if end_date else None,
-                location=location,
-                url=f"https://dorahacks.io/hackathon/{hack.get('uname')}/detail",
-                mode=mode,
-                status=status,
-                source="dorahacks",
-                tags=hack.get("field"),
-                banner_url=hack.get("image_url"),
-                prize_pool=prize_pool,
-                team_size="See details",
-                eligibility="See details",
-            )
-            hackathons_data.append(hackathon)
-        return hackathons_data
+        if fresh:
+            response = cached[1]
+            http.record_cached("GET", url, response)
+        else:
+            response = http.get(url, headers=HEADERS)
+            response.raise_for_status()
+        detail = response.json()
+    except (requests.exceptions.RequestException, ValueError) as e:
+        print(f"Error fetching DoraHacks prize details for {uname}: {e}")
+        return None
+    if use_cache and not fresh:
+        with _prize_cache_lock:
+            _prize_cache[uname] = (time.monotonic(), response)
+    return format_prize(detail.get("bonus_price") or detail.get("amount"), detail.get("token"))
+
+
+def build_row(hack: dict, prize_pool: str | None) -> dict:
+    start_date = datetime.fromtimestamp(hack.get("start_time")) if hack.get("start_time") else None
+    end_date = datetime.fromtimestamp(hack.get("end_time")) if hack.get("end_time") else None
+
+    status = "upcoming" if hack.get("status") == 0 else "ongoing"
+    mode = "Online" if hack.get("participation_form") == "Virtual" else "Offline"
+    location = "Everywhere" if not hack.get("venue_name") else hack.get("venue_name")
+
+    return dict(
+        id=hackathon_id("dorahacks", hack.get("uname")),
+        title=hack.get("title"),
+        start_date=start_date.date() if start_date else None,
+        end_date=end_date.date() if end_date else None,
+        location=location,
+        url=f"https://dorahacks.io/hackathon/{hack.get('uname')}/detail",
+        mode=mode,
+        status=status,
+        source="dorahacks",
+        tags=hack.get("field"),
+        banner_url=hack.get("image_url"),
+        prize_pool=prize_pool or "See details",
+        team_size="See details",
+        eligibility="See details",
+    )
+
+
+def convert_page(results: list[dict], details: ThreadPoolExecutor | None) -> list[Hackathon]:
+    """Hackathons of one list page, with missing prizes looked up on `details` if given."""
+    prizes = []
+    for hack in results:
+        # The list's bonus_price is the total prize pool, when the organisers set one
+        prize_pool = format_prize(hack.get("bonus_price"), hack.get("token"))
+        if prize_pool is None and details is not None and hack.get("uname"):
+            prize_pool = http.submit(details, fetch_detail_prize, hack["uname"])
+        prizes.append(prize_pool)
+
+    rows = [
+        build_row(hack, prize.result() if isinstance(prize, Future) else prize)
+        for hack, prize in zip(results, prizes)
+    ]
+    return parsing.validate(rows)
+
+
+def fetch_status(status: str, details: ThreadPoolExecutor | None) -> list[Hackathon]:
+    """All pages of one status, each converted as soon as it arrives."""
+    hackathons = []
+    url, params = BASE_URL, {"page": 1, "page_size": 24, "status": status}
+    try:
+        while url:
+            response = http.get(url, params=params, headers=HEADERS)
+            response.raise_for_status()
+            data = response.json()
+            hackathons.extend(convert_page(data.get("results", []), details))
+
+            # Subsequent requests use the full URL from 'next', so we clear params
+            url, params = data.get("next"), None
     except requests.exceptions.RequestException as e:
-        print(f"Error fetching hackathons from DoraHacks: {e}")
-        return []
+        print(f"Error fetching {status} hackathons from DoraHacks: {e}")
+    return hackathons
+
+
+def fetch_dorahacks_hackathons() -> list[Hackathon]:
+    """
+    Fetches upcoming and ongoing hackathons from the DoraHacks API, both lists at once.
+    With DORAHACKS_PRIZE_DETAILS=on, hackathons listed without a prize get it from their
+    detail endpoint (at most DETAIL_CONCURRENCY requests at a time, cached for a day).
+    """
+    detail_pool = (
+        ThreadPoolExecutor(max_workers=DETAIL_CONCURRENCY)
+        if DORAHACKS_PRIZE_DETAILS
+        else nullcontext()
+    )
+    with ThreadPoolExecutor(max_workers=len(STATUSES)) as executor, detail_pool as details:
+        futures = [http.submit(executor, fetch_status, status, details) for status in STATUSES]
+        return [hackathon for future in futures for hackathon in future.result()]
 
 
 if __name__ == "__main__":
@@ -0,0 +1,157 @@
+"""
+Detail-page enrichment: banner and description from a hackathon's own page.
+
+List APIs often give only a small thumbnail and no description. After a run has
+stored its rows, fetch_and_store hands the rows that were not enriched recently to
+enrich(), in a background thread, which fetches their detail pages and reads the
+schema.org JSON-LD block most event pages carry (image and description).
+
+Pages are fetched with the ETag / Last-Modified of the previous fetch, so an
+unchanged page costs a 304 without a body. At most ENRICH_CONCURRENCY pages are
+fetched at a time and at most ENRICH_HOST_BUDGET per host in one pass, so the list
+APIs keep their share of each host's rate limit; the rate limiter and a deadline of
+ENRICH_DEADLINE_SECONDS apply as to any adapter request. Detail pages have circuit
+breakers of their own (breaker_key()), so failing pages never get a source's list
+API skipped.
+"""
+
+import json
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+
+import requests
+from bs4 import BeautifulSoup, SoupStrainer
+
+from adapters import http
+
+ENRICH_CONCURRENCY = int(os.getenv("ENRICH_CONCURRENCY", "4"))
+ENRICH_HOST_BUDGET = int(os.getenv("ENRICH_HOST_BUDGET", "25"))
+ENRICH_DEADLINE_SECONDS = float(os.getenv("ENRICH_DEADLINE_SECONDS", "300"))
+DESCRIPTION_MAX_LENGTH = 2000
+
+JSON_LD_STRAINER = SoupStrainer("script", type="application/ld+json")
+
+
+class DetailPage(NamedTuple):
+    """
+    A stored hackathon's detail page, with the validators of its last fetch and the
+    number of failed fetches since its last successful one.
+    """
+
+    hackathon_id: str
+    url: str
+    etag: str | None = None
+    last_modified: str | None = None
+    failures: int | None = None
+
+
+def breaker_key(url: str) -> str:
+    return f"details:{http.host_key(url)}"
+
+
+def json_ld_objects(html: str):
+    """Every JSON object in the page's JSON-LD blocks, @graph members included."""
+    soup = BeautifulSoup(html, "html.parser", parse_only=JSON_LD_STRAINER)
+    for script in soup.find_all("script"):
+        try:
+            data = json.loads(script.string or "")
+        except ValueError:
+            continue
+        stack = data if isinstance(data, list) else [data]
+        while stack:
+            item = stack.pop(0)
+            if isinstance(item, dict):
+                yield item
+                stack.extend(item.get("@graph") or [])
+
+
+def image_url(image) -> str | None:
+    if isinstance(image, list):
+        image = image[0] if image else None
+    if isinstance(image, dict):
+        image = image.get("url") or image.get("contentUrl")
+    return image if isinstance(image, str) and image.startswith(("http://", "https://")) else None
+
+
+def extract_details(html: str) -> dict:
+    """{"banner_url", "description"} from the page's JSON-LD, None where missing."""
+    banner_url = description = None
+    for item in json_ld_objects(html):
+        banner_url = banner_url or image_url(item.get("image"))
+        if not description and isinstance(item.get("description"), str):
+            description = " ".join(item["description"].split())[:DESCRIPTION_MAX_LENGTH] or None
+        if banner_url and description:
+            break
+    return {"banner_url": banner_url, "description": description}
+
+
+def fetch_details(page: DetailPage) -> dict | None:
+    """
+    Fetch one detail page conditionally. Returns the new validators plus the extracted
+    details, only the validators for a page that did not change, or None if the page
+    failed. Raises RunCancelledError and CircuitOpenError, which say nothing about it.
+    """
+    headers = {}
+    if page.etag:
+        headers["If-None-Match"] = page.etag
+    if page.last_modified:
+        headers["If-Modified-Since"] = page.last_modified
+    try:
+        response = http.get(page.url, headers=headers, breaker_key=breaker_key(page.url))
+        if response.status_code == 304:
+            return {"etag": page.etag, "last_modified": page.last_modified}
+        response.raise_for_status()
+    except (http.RunCancelledError, http.CircuitOpenError):
+        raise
+    except requests.exceptions.RequestException as e:
+        print(f"Error fetching detail page {page.url}: {e}")
+        return None
+    return {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        **extract_details(response.text),
+    }
+
+
+def within_budget(pages: list[DetailPage], budget: int = None) -> list[DetailPage]:
+    """The pages in order, skipping those beyond budget for their host."""
+    budget = ENRICH_HOST_BUDGET if budget is None else budget
+    per_host = Counter()
+    selected = []
+    for page in pages:
+        host = http.host_key(page.url)
+        if per_host[host] < budget:
+            per_host[host] += 1
+            selected.append(page)
+    return selected
+
+
+def enrich(pages: list[DetailPage]) -> dict:
+    """
+    Fetch the detail pages within their host budgets, ENRICH_CONCURRENCY at a time.
+    Returns {hackathon_id: fetch_details() result} for the pages fetched, None for
+    those that failed, however they failed. Pages beyond their budget, the deadline or
+    an open breaker are left out, as they were not tried.
+    """
+    pages = within_budget(pages)
+    if not pages:
+        return {}
+    deadline = http.Deadline(ENRICH_DEADLINE_SECONDS)
+    results = {}
+    with (
+        http.deadline_scope(deadline),
+        ThreadPoolExecutor(max_workers=ENRICH_CONCURRENCY) as executor,
+    ):
+        futures = [(page, http.submit(executor, fetch_details, page)) for page in pages]
+        for page, future in futures:
+            try:
+                results[page.hackathon_id] = future.result()
+            except (http.RunCancelledError, http.CircuitOpenError):
+                continue
+            except Exception as e:
+                # One odd page must not cost the rest of the pass
+                print(f"Error enriching from detail page {page.url}: {e}")
+                results[page.hackathon_id] = None
+    return results
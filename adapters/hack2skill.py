@@ -1,146 +1,188 @@
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import requests
 
+from adapters import http, parsing
 from backend.schemas import Hackathon
 
 BASE_URL = "https://vision.hack2skill.com/api/v1/innovator/public/event/public-list"
+MAX_CONCURRENT_PAGES = 4
+# Most pages read, whatever total the response claims or if it has none
+MAX_PAGES = 40
+
+
+def parse_events(events: list[dict]) -> list[Hackathon]:
+    """Hackathons of the events listed by the API, skipping ended ones."""
+    rows = []
+
+    for event in events:
+        try:
+            # Parse dates
+            registration_start = event.get("registrationStart")
+            registration_end = event.get("registrationEnd")
+            submission_end = event.get("submissionEnd")
+
+            # Use registration dates, fallback to submission dates if needed
+            if registration_start:
+                start_date = datetime.fromisoformat(
+                    registration_start.replace("Z", "+00:00")
+                ).date()
+            else:
+                print(f"Skipping event {event.get('title')} - no registration start date")
+                continue
+
+            # Prefer submission end over registration end for actual deadline
+            if submission_end:
+                end_date = datetime.fromisoformat(submission_end.replace("Z", "+00:00")).date()
+            elif registration_end:
+                end_date = datetime.fromisoformat(registration_end.replace("Z", "+00:00")).date()
+            else:
+                print(f"Skipping event {event.get('title')} - no end date")
+                continue
+
+            # Skip if already ended
+            if end_date < datetime.now().date():
+                continue
+
+            # Determine location based on mode
+            mode = event.get("mode", "VIRTUAL")
+            if mode == "VIRTUAL":
+                location = "Online"
+            elif mode == "HYBRID":
+                location = "Hybrid (Online + Offline)"
+            else:
+                location = "Offline"
+
+            # Build URL
+            event_url = event.get("eventUrl", "")
+            url = f"https://vision.hack2skill.com/event/{event_url}" if event_url else ""
+
+            # Extract tags
+            tags = []
+            ticket_type = event.get("ticket")
+            if ticket_type:
+                tags.append(ticket_type.capitalize())
+
+            flag = event.get("flag")
+            if flag:
+                tags.append(flag.capitalize())
+
+            # Determine team size
+            participation = event.get("participation", "")
+            if participation == "Individual":
+                team_size = "Individual"
+            elif participation == "Team":
+                team_size = "Team (size varies)"
+            else:
+                team_size = "See details"
+
+            # Determine status
+            current_time = datetime.now().date()
+            if start_date > current_time:
+                status = "Upcoming"
+            elif start_date <= current_time <= end_date:
+                status = "Active"
+            else:
+                status = "Ended"
+
+            rows.append(
+                dict(
+                    id=hashlib.sha256(event.get("_id", "").encode()).hexdigest(),
+                    title=event.get("title") or "Untitled Event",
+                    start_date=start_date,
+                    end_date=end_date,
+                    location=location,
+                    url=url,
+                    mode=mode.capitalize(),
+                    status=status,
+                    source="hack2skill",
+                    tags=tags,
+                    banner_url=event.get("thumbnail"),
+                    prize_pool="See event page",  # API doesn't provide prize info
+                    team_size=team_size,
+                    eligibility="See event page",  # API doesn't provide eligibility info
+                )
+            )
+
+        except Exception as e:
+            print(f"Error processing event {event.get('title', 'Unknown')}: {e}")
+            continue
+
+    return parsing.validate(rows)
+
+
+def total_events(data: dict) -> int | None:
+    """Size of the whole result set, if the response says."""
+    for key in ("totalCount", "total", "count"):
+        if isinstance(data.get(key), int):
+            return data[key]
+    return None
 
 
-def fetch_hack2skill_hackathons(page: int = 1, records: int = 50) -> list[Hackathon]:
+def fetch_page(params: dict, page: int) -> dict:
+    response = http.get(BASE_URL, params={**params, "page": page}, timeout=10)
+    response.raise_for_status()
+    return response.json()
+
+
+def fetch_hack2skill_hackathons(records: int = 50) -> list[Hackathon]:
     """
     Fetches hackathons from Hack2Skill platform.
 
+    The first page tells how many events there are; the remaining pages are then
+    fetched concurrently (at most MAX_CONCURRENT_PAGES at a time). Without a total in
+    the response, pages are read one by one until a short page. Either way at most
+    MAX_PAGES pages are read.
+
     Args:
-        page: Page number to fetch (default: 1)
         records: Number of records per page (default: 50)
 
     Returns:
         List of Hackathon objects
     """
     try:
-        # Set date range - from current date to 1 years in the future
+        # Set date range - from current date to 3 years in the future
         current_date = datetime.now()
         end_date = current_date.replace(year=current_date.year + 3)
 
         params = {
-            "page": page,
             "records": records,
             "search": "",
             "start": current_date.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z",
             "end": end_date.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z",
         }
 
-        response = requests.get(BASE_URL, params=params, timeout=10)
-        response.raise_for_status()
-
-        data = response.json()
-
+        data = fetch_page(params, 1)
         if not data.get("success"):
             print(f"API returned success=false: {data.get('message')}")
             return []
-
-        events = data.get("data", [])
-        hackathons = []
-
-        for event in events:
-            try:
-                # Parse dates
-                registration_start = event.get("registrationStart")
-                registration_end = event.get("registrationEnd")
-                submission_end = event.get("submissionEnd")
-
-                # Use registration dates, fallback to submission dates if needed
-                if registration_start:
-                    start_date = datetime.fromisoformat(
-                        registration_start.replace("Z", "+00:00")
-                    ).date()
-                else:
-                    print(f"Skipping event {event.get('title')} - no registration start date")
-                    continue
-
-                # Prefer submission end over registration end for actual deadline
-                if submission_end:
-                    end_date = datetime.fromisoformat(submission_end.replace("Z", "+00:00")).date()
-                elif registration_end:
-                    end_date = datetime.fromisoformat(
-                        registration_end.replace("Z", "+00:00")
-                    ).date()
-                else:
-                    print(f"Skipping event {event.get('title')} - no end date")
-                    continue
-
-                # Skip if already ended
-                if end_date < datetime.now().date():
-                    continue
-
-                # Determine location based on mode
-                mode = event.get("mode", "VIRTUAL")
-                if mode == "VIRTUAL":
-                    location = "Online"
-                elif mode == "HYBRID":
-                    location = "Hybrid (Online + Offline)"
-                else:
-                    location = "Offline"
-
-                # Build URL
-                event_url = event.get("eventUrl", "")
-                url = f"https://vision.hack2skill.com/event/{event_url}" if event_url else ""
-
-                # Extract tags
-                tags = []
-                ticket_type = event.get("ticket")
-                if ticket_type:
-                    tags.append(ticket_type.capitalize())
-
-                flag = event.get("flag")
-                if flag:
-                    tags.append(flag.capitalize())
-
-                # Determine team size
-                participation = event.get("participation", "")
-                if participation == "Individual":
-                    team_size = "Individual"
-                elif participation == "Team":
-                    team_size = "Team (size varies)"
-                else:
-                    team_size = "See details"
-
-                # Determine status
-                current_time = datetime.now().date()
-                if start_date > current_time:
-                    status = "Upcoming"
-                elif start_date <= current_time <= end_date:
-                    status = "Active"
-                else:
-                    status = "Ended"
-
-                # Create hackathon object
-                hackathon = Hackathon(
-                    id=hashlib.sha256(event.get("_id", "").encode()).hexdigest(),
-                    title=event.get("title", "Untitled Event"),
-                    start_date=start_date,
-                    end_date=end_date,
-                    location=location,
-                    url=url,
-                    mode=mode.capitalize(),
-                    status=status,
-                    source="hack2skill",
-                    tags=tags,
-                    banner_url=event.get("thumbnail"),
-                    prize_pool="See event page",  # API doesn't provide prize info
-                    team_size=team_size,
-                    eligibility="See event page",  # API doesn't provide eligibility info
-                )
-
-                hackathons.append(hackathon)
-
-            except Exception as e:
-                print(f"Error processing event {event.get('title', 'Unknown')}: {e}")
-                continue
-
-        return hackathons
+        events = list(data.get("data", []))
+
+        total = total_events(data)
+        if total is not None:
+            # The total comes from an undocumented field, so it is not trusted beyond MAX_PAGES
+            pages = range(2, min(-(-total // records), MAX_PAGES) + 1)
+            with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_PAGES) as executor:
+                futures = [http.submit(executor, fetch_page, params, page) for page in pages]
+                for page, future in zip(pages, futures):
+                    try:
+                        events.extend(future.result().get("data", []))
+                    except (requests.exceptions.RequestException, ValueError) as e:
+                        print(f"Error fetching Hack2Skill page {page}: {e}")
+        else:
+            page, page_events = 1, events
+            while len(page_events) == records and page < MAX_PAGES:
+                page += 1
+                try:
+                    page_events = fetch_page(params, page).get("data", [])
+                except (requests.exceptions.RequestException, ValueError) as e:
+                    print(f"Error fetching Hack2Skill page {page}: {e}")
+                    break
+                events.extend(page_events)
+
+        return parse_events(events)
 
     except requests.exceptions.RequestException as e:
         print(f"Error fetching Hack2Skill hackathons: {e}")
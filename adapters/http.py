@@ -0,0 +1,313 @@
+"""
+Shared HTTP layer for adapters: default timeouts, per-host rate limiting and a
+circuit breaker per host.
+
+Hosts are keyed by their registrable domain ("hackmit.devpost.com" and
+"devpost.com" share "devpost.com"), so detail pages count against the same budget
+as the list API. A host that keeps failing (connection errors, timeouts, 429 or
+5xx) opens its breaker: further requests fail immediately with CircuitOpenError
+until the recovery timeout has passed, after which a single probe request decides
+whether the breaker closes again. fetch_and_store persists breaker state between
+runs with export_breakers() / restore_breakers().
+
+A scrape run sets a Deadline for the requests made under deadline_scope(): each
+request's timeout is capped to the time left, and once the deadline has passed or
+was cancelled no further request is sent (RunCancelledError).
+
+Requests are finally sent by the transport, normally send(). use_transport()
+swaps it for the current context (and the threads started from it with submit()),
+e.g. for adapters.replay to record or replay fixtures, or adapters.archive to keep
+each source's responses.
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from urllib.parse import urlparse
+
+import requests
+
+DEFAULT_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "15"))
+RATE_PER_SECOND = float(os.getenv("HTTP_RATE_PER_SECOND", "2"))
+RATE_BURST = int(os.getenv("HTTP_RATE_BURST", "5"))
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("BREAKER_FAILURE_THRESHOLD", "5"))
+BREAKER_RECOVERY_SECONDS = float(os.getenv("BREAKER_RECOVERY_SECONDS", "600"))
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Raised instead of sending a request to a host whose breaker is open."""
+
+
+class RunCancelledError(requests.exceptions.RequestException):
+    """Raised instead of sending a request after the run's deadline has passed."""
+
+
+class Deadline:
+    """Time budget of a scrape run, shared by the threads working for it."""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set() or self.remaining() <= 0
+
+    def check(self):
+        if self.cancelled:
+            raise RunCancelledError(f"Run deadline of {self.seconds:.0f}s passed")
+
+    def cancel(self):
+        """Cancel the remaining work. Waits for blocks already inside shielded()."""
+        with self._lock:
+            self._cancelled.set()
+
+    @contextmanager
+    def shielded(self):
+        """A block (e.g. a commit) that either completes before cancel() returns or never starts."""
+        with self._lock:
+            self.check()
+            yield
+
+
+_deadline: ContextVar[Deadline | None] = ContextVar("deadline", default=None)
+
+
+def current_deadline() -> Deadline | None:
+    return _deadline.get()
+
+
+@contextmanager
+def deadline_scope(deadline: Deadline | None):
+    """Apply deadline to every request sent from this thread (or context) inside the block."""
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
+
+
+def submit(executor, fn, *args, **kwargs):
+    """executor.submit() that carries the caller's context, so its deadline and transport, along."""
+    return executor.submit(copy_context().run, fn, *args, **kwargs)
+
+
+def host_key(url: str) -> str:
+    host = (urlparse(url).hostname or "").lower()
+    labels = host.split(".")
+    return ".".join(labels[-2:]) if len(labels) >= 2 else host
+
+
+class TokenBucket:
+    """Allows `rate` requests per second on average, with bursts of up to `capacity`."""
+
+    def __init__(self, rate: float = RATE_PER_SECOND, capacity: int = RATE_BURST):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class CircuitBreaker:
+    """closed -> open after `failure_threshold` consecutive failures -> half_open after
+    `recovery_seconds` -> closed on a successful probe, open again on a failed one."""
+
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        recovery_seconds: float = BREAKER_RECOVERY_SECONDS,
+    ):
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = None  # time.time() of the last trip
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self.state == OPEN and time.time() - self.opened_at >= self.recovery_seconds:
+                self.state = HALF_OPEN
+            if self.state == CLOSED:
+                return True
+            if self.state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self.opened_at = None
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = OPEN
+                self.opened_at = time.time()
+            self._probing = False
+
+    def abandon_request(self):
+        """An allowed request was not sent or not judged; let another probe through."""
+        with self._lock:
+            self._probing = False
+
+    def is_open(self) -> bool:
+        with self._lock:
+            return self.state == OPEN and time.time() - self.opened_at < self.recovery_seconds
+
+
+_registry_lock = threading.Lock()
+_limiters = {}
+_breakers = {}
+
+
+def limiter_for(host: str) -> TokenBucket:
+    with _registry_lock:
+        return _limiters.setdefault(host, TokenBucket())
+
+
+def breaker_for(host: str) -> CircuitBreaker:
+    with _registry_lock:
+        return _breakers.setdefault(host, CircuitBreaker())
+
+
+def send(session, method: str, url: str, timeout=None, **kwargs):
+    """The default transport: send the request with session, or plain requests."""
+    return (session or requests).request(method, url, timeout=timeout, **kwargs)
+
+
+_transport = ContextVar("transport", default=None)
+
+
+def current_transport():
+    return _transport.get() or send
+
+
+def is_offline() -> bool:
+    """True while requests are answered without the network, e.g. from a replay."""
+    return getattr(current_transport(), "offline", False)
+
+
+def record_cached(method: str, url: str, response):
+    """
+    Hand a response an adapter served from its own cache to a recording transport
+    (adapters.replay.Recorder), so the recorded traffic still holds it.
+    """
+    keep = getattr(current_transport(), "keep", None)
+    if keep is not None:
+        keep(method, url, response)
+
+
+@contextmanager
+def use_transport(transport):
+    """
+    Send every request through transport(session, method, url, timeout=..., **kwargs)
+    inside the block. Transports with a true `offline` attribute skip rate limiting.
+    """
+    token = _transport.set(transport)
+    try:
+        yield transport
+    finally:
+        _transport.reset(token)
+
+
+def is_failure(response) -> bool:
+    return response.status_code == 429 or response.status_code >= 500
+
+
+def request(
+    method: str, url: str, session=None, timeout=DEFAULT_TIMEOUT, breaker_key=None, **kwargs
+):
+    """
+    Send a request through the host's rate limiter and circuit breaker, within the
+    current deadline if any. A breaker_key gives the request a breaker of its own
+    instead of the host's, so its failures do not stop other requests to the host.
+    Returns the response like requests does; raise_for_status() is left to the caller.
+    """
+    deadline = _deadline.get()
+    if deadline is not None:
+        deadline.check()
+    transport = current_transport()
+    if is_offline():
+        # Replayed responses say nothing about the live host: no breaker, no limiter
+        return transport(session, method, url, timeout=timeout, **kwargs)
+    host = host_key(url)
+    breaker_key = breaker_key or host
+    breaker = breaker_for(breaker_key)
+    if not breaker.allow_request():
+        raise CircuitOpenError(f"Circuit open for {breaker_key}, not requesting {url}")
+    limiter_for(host).acquire()
+    if deadline is not None:
+        try:
+            deadline.check()
+        except RunCancelledError:
+            breaker.abandon_request()
+            raise
+        timeout = min(timeout, deadline.remaining())
+    try:
+        response = transport(session, method, url, timeout=timeout, **kwargs)
+    except requests.exceptions.RequestException:
+        # Running out of the run's time budget says nothing about the host
+        if deadline is not None and deadline.cancelled:
+            breaker.abandon_request()
+        else:
+            breaker.record_failure()
+        raise
+    if is_failure(response):
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+    return response
+
+
+def get(url: str, **kwargs):
+    return request("GET", url, **kwargs)
+
+
+def export_breakers() -> dict:
+    """{host: {"state", "failures", "opened_at"}} for every host seen by this process."""
+    with _registry_lock:
+        breakers = dict(_breakers)
+    return {
+        host: {"state": b.state, "failures": b.failures, "opened_at": b.opened_at}
+        for host, b in breakers.items()
+    }
+
+
+def restore_breakers(states: dict):
+    """Load persisted breaker state, e.g. at the start of a run in a fresh process."""
+    for host, state in states.items():
+        breaker = breaker_for(host)
+        with breaker._lock:
+            breaker.state = state["state"]
+            breaker.failures = state["failures"]
+            breaker.opened_at = state["opened_at"]
+            breaker._probing = False
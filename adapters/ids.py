@@ -0,0 +1,54 @@
+"""
+Stable hackathon ids derived from each platform's own identifier.
+
+Ids used to be sha256(title) for several sources, so a title edit produced a new row
+(and a new announcement). The key is now the platform's native identifier, prefixed
+with the source so identical numeric ids on two platforms cannot collide.
+"""
+
+import hashlib
+import re
+from urllib.parse import urlparse
+
+
+def hackathon_id(source: str, native_key) -> str:
+    return hashlib.sha256(f"{source}:{native_key}".encode()).hexdigest()
+
+
+def normalize_url(url: str) -> str:
+    """host + path, without scheme, query (tracking parameters), fragment or trailing slash."""
+    parsed = urlparse(url.strip())
+    host = (parsed.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    return f"{host}{parsed.path.rstrip('/')}"
+
+
+def native_key_from_url(source: str, url: str) -> str | None:
+    """
+    Recover the native key of a stored hackathon from its URL, for remapping old ids.
+    Returns None when the URL does not carry it.
+    """
+    if not url:
+        return None
+    source = source.lower()
+    parsed = urlparse(url)
+    host = (parsed.hostname or "").lower()
+
+    if source == "devfolio":
+        # https://{slug}.devfolio.co/
+        if host.endswith(".devfolio.co"):
+            return host[: -len(".devfolio.co")]
+    elif source == "dorahacks":
+        # https://dorahacks.io/hackathon/{uname}/detail
+        match = re.match(r"/hackathon/([^/]+)", parsed.path)
+        if match:
+            return match.group(1)
+    elif source == "unstop":
+        # https://unstop.com/hackathons/{title-slug}-{id}
+        match = re.search(r"-(\d+)/?$", parsed.path)
+        if match:
+            return match.group(1)
+    elif source == "mlh":
+        return normalize_url(url)
+    return None
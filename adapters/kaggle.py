@@ -1,111 +1,187 @@
-import hashlib
-from datetime import datetime
+"""
+Kaggle competitions, read from Kaggle's REST API through adapters.http.
+
+The kaggle SDK is not used: importing it is slow, its client authenticated again on
+every call, and its requests bypassed the shared rate limiter, run deadline and
+replay fixtures. Credentials are resolved once per process, from KAGGLE_USERNAME and
+KAGGLE_KEY, else KAGGLE_API_TOKEN (sent as a bearer token), else ~/.kaggle/kaggle.json.
 
-from kaggle.api.kaggle_api_extended import KaggleApi
+Competitions are listed by latest deadline first, so paging stops at the first page
+without an open competition. The result is kept for KAGGLE_CACHE_SECONDS, since the
+list changes slowly and the API's quota is per account.
+"""
 
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from pathlib import Path
+
+import requests
+
+from adapters import SourceNotConfiguredError, http, parsing
 from backend.schemas import Hackathon
 
+API_URL = "https://www.kaggle.com/api/v1/competitions/list"
+PAGE_SIZE = 20
+KAGGLE_MAX_PAGES = int(os.getenv("KAGGLE_MAX_PAGES", "10"))
+KAGGLE_CACHE_SECONDS = float(os.getenv("KAGGLE_CACHE_SECONDS", "3600"))
+# Pages requested ahead of the one being parsed
+LOOKAHEAD = 3
 
-def fetch_kaggle_competitions() -> list[Hackathon]:
-    """
-    Fetches active competitions from Kaggle using the official API.
-    Requires KAGGLE_API_TOKEN environment variable to be set.
+_auth = None
+_auth_lock = threading.Lock()
+_cache = None  # (fetched_at, hackathons)
+_cache_lock = threading.Lock()
 
-    Authentication can be done via:
-    1. KAGGLE_API_TOKEN environment variable
-    2. ~/.kaggle/access_token file
-    3. ~/.kaggle/kaggle.json file (legacy)
-    """
-    try:
-        api = KaggleApi()
-        api.authenticate()
-
-        # Fetch list of competitions
-        # According to the API docs, we can filter by category and sort
-        # Valid categories: all, featured, research, recruitment, gettingStarted, masters, playground
-        # Valid sort options: latestDeadline, earliestDeadline, numberOfTeams, recentlyCreated, prize
-        response = api.competitions_list(category="all", sort_by="latestDeadline", page=1)
-
-        hackathons = []
-        for comp in response.competitions:
-            # Parse dates
-            try:
-                # The deadline field is a datetime string in ISO format
-                deadline_str = comp.deadline
-                if isinstance(deadline_str, str):
-                    end_date = datetime.fromisoformat(deadline_str.replace("Z", "+00:00")).date()
-                else:
-                    end_date = deadline_str.date()
-
-                # enabledDate is when the competition was enabled/started
-                # Not all competitions have this field, so use getattr with default
-                enabled_date_str = getattr(comp, "enabledDate", None)
-                if enabled_date_str:
-                    if isinstance(enabled_date_str, str):
-                        start_date = datetime.fromisoformat(
-                            enabled_date_str.replace("Z", "+00:00")
-                        ).date()
-                    else:
-                        start_date = enabled_date_str.date()
-                else:
-                    start_date = datetime.now().date()
-
-                # Skip if ended
-                if end_date < datetime.now().date():
-                    continue
-
-            except Exception as e:
-                print(f"Error parsing dates for {comp.title}: {e}")
-                continue
-
-            # Extract tags from the tags array
-            tags = []
-
-            for tag in comp.tags:
-                # Each tag is an object with 'name' attribute
-                tags.append(tag.name)
-
-            # Team size from maxTeamSize
-            team_size = "See details"
-            team_size = f"1-{comp.max_team_size} members"
-
-            # URL - use the url field directly
-            url = (
-                comp.url
-                if hasattr(comp, "url")
-                else f"https://www.kaggle.com/competitions/{comp.ref}"
-            )
 
-            # Banner/thumbnail
-            # banner_url = comp.thumbnailImageUrl
+class KaggleAuthError(requests.exceptions.HTTPError):
+    """The API answered 401 or 403: the credentials are wrong or lack access."""
+
 
-            hackathon = Hackathon(
-                id=hashlib.sha256(str(comp.ref).encode()).hexdigest(),
-                title=comp.title,
+def resolve_auth() -> dict | None:
+    """Keyword arguments authenticating a request, or None without credentials."""
+    username, key = os.getenv("KAGGLE_USERNAME"), os.getenv("KAGGLE_KEY")
+    if username and key:
+        return {"auth": (username, key)}
+    token = os.getenv("KAGGLE_API_TOKEN")
+    if token:
+        return {"headers": {"Authorization": f"Bearer {token}"}}
+    config = Path(os.getenv("KAGGLE_CONFIG_DIR", Path.home() / ".kaggle")) / "kaggle.json"
+    try:
+        credentials = json.loads(config.read_text())
+        return {"auth": (credentials["username"], credentials["key"])}
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def get_auth() -> dict | None:
+    global _auth
+    with _auth_lock:
+        if _auth is None:
+            _auth = resolve_auth()
+        return _auth
+
+
+def parse_date(value) -> date | None:
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).date()
+
+
+def parse_competitions(competitions: list[dict]) -> list[Hackathon]:
+    """Hackathons of the open competitions of one page."""
+    today = datetime.now().date()
+    rows = []
+    for comp in competitions:
+        try:
+            end_date = parse_date(comp.get("deadline"))
+            start_date = parse_date(comp.get("enabledDate")) or today
+        except (TypeError, ValueError) as e:
+            print(f"Error parsing dates for {comp.get('title')}: {e}")
+            continue
+        if end_date is None or end_date < today:
+            continue
+
+        ref = comp.get("ref")
+        max_team_size = comp.get("maxTeamSize")
+        rows.append(
+            dict(
+                id=hashlib.sha256(str(ref).encode()).hexdigest(),
+                title=comp.get("title"),
                 start_date=start_date,
                 end_date=end_date,
                 location="Online",
-                url=url,
+                url=comp.get("url") or f"https://www.kaggle.com/competitions/{ref}",
                 mode="Online",
                 status="Active",
-                source="Kaggle",
-                tags=tags,
+                source="kaggle",
+                tags=[tag["name"] for tag in comp.get("tags") or [] if tag.get("name")],
                 banner_url=None,
-                prize_pool=comp.reward,
-                team_size=team_size,
+                prize_pool=comp.get("reward") or "See details",
+                team_size=f"1-{max_team_size} members" if max_team_size else "See details",
                 eligibility="Open to all",
             )
-            print(f"{hackathon} /n")
-            hackathons.append(hackathon)
+        )
+    return parsing.validate(rows)
 
-        return hackathons
 
-    except Exception as e:
-        print(f"Error fetching Kaggle competitions: {e}")
-        import traceback
+def fetch_page(page: int, auth: dict) -> list[dict] | None:
+    """
+    One page of competitions, or None if it failed. Rejected credentials fail every
+    page alike, so a 401 or 403 raises KaggleAuthError to end the fetch.
+    """
+    print(f"Fetching Kaggle page {page}...")
+    params = {"category": "all", "sortBy": "latestDeadline", "page": page}
+    try:
+        response = http.get(API_URL, params=params, **auth)
+    except requests.RequestException as e:
+        print(f"Error fetching Kaggle page {page}: {e}")
+        return None
+    if response.status_code in (401, 403):
+        raise KaggleAuthError(
+            f"Kaggle rejected the credentials (status {response.status_code})", response=response
+        )
+    try:
+        response.raise_for_status()
+        return response.json()
+    except (requests.RequestException, ValueError) as e:
+        print(f"Error fetching Kaggle page {page}: {e}")
+        return None
+
+
+def fetch_all(auth: dict) -> list[Hackathon]:
+    hackathons = []
+    with ThreadPoolExecutor(max_workers=LOOKAHEAD) as executor:
+        last_page = min(LOOKAHEAD, KAGGLE_MAX_PAGES)
+        pending = deque(
+            http.submit(executor, fetch_page, page, auth) for page in range(1, last_page + 1)
+        )
+        try:
+            while pending:
+                competitions = pending.popleft().result()
+                if competitions is not None:
+                    page_hackathons = parse_competitions(competitions)
+                    hackathons.extend(page_hackathons)
+                    if not page_hackathons or len(competitions) < PAGE_SIZE:
+                        break
+                if last_page < KAGGLE_MAX_PAGES:
+                    last_page += 1
+                    pending.append(http.submit(executor, fetch_page, last_page, auth))
+        finally:
+            for future in pending:
+                future.cancel()
+    return hackathons
 
-        traceback.print_exc()
-        return []
+
+def fetch_kaggle_competitions() -> list[Hackathon]:
+    """
+    Fetches open competitions from the Kaggle API, a few pages at a time.
+    Returns the cached list while it is younger than KAGGLE_CACHE_SECONDS; replays
+    neither read nor fill the cache. Raises SourceNotConfiguredError without
+    credentials and KaggleAuthError when they are rejected.
+    """
+    global _cache
+    use_cache = not http.is_offline()
+    with _cache_lock:
+        if use_cache and _cache is not None and time.monotonic() - _cache[0] < KAGGLE_CACHE_SECONDS:
+            return list(_cache[1])
+
+    auth = get_auth()
+    if auth is None:
+        raise SourceNotConfiguredError(
+            "Kaggle credentials missing, set KAGGLE_USERNAME and KAGGLE_KEY or KAGGLE_API_TOKEN."
+        )
+
+    hackathons = fetch_all(auth)
+    if use_cache and hackathons:
+        with _cache_lock:
+            _cache = (time.monotonic(), hackathons)
+    return list(hackathons)
 
 
 if __name__ == "__main__":
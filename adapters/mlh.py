@@ -1,82 +1,254 @@
-import hashlib
+import json
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from pathlib import Path
 
 import cloudscraper
-from bs4 import BeautifulSoup
+import requests
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 
+from adapters import http, parsing
+from adapters.ids import hackathon_id, normalize_url
 from backend.schemas import Hackathon
 
-
-def scrape_mlh_events() -> list[Hackathon]:
-    current_year = date.today().year + 1
-    url = f"https://mlh.io/seasons/{current_year}/events"
-
-    events = []
-    scraper = cloudscraper.create_scraper()
-
-    response = scraper.get(url)
-
+try:
+    import lxml  # noqa: F401
+
+    FAST_PARSER = "lxml"
+except ImportError:
+    FAST_PARSER = "html.parser"
+
+# Cookies and User-Agent of the shared scraper session, kept across restarts so a
+# solved Cloudflare challenge is reused until its clearance cookie expires. They are
+# credentials, so the file is private to the app (mode 0600 in the app's .cache).
+MLH_COOKIE_FILE = os.getenv(
+    "MLH_COOKIE_FILE", str(Path(__file__).resolve().parents[1] / ".cache" / "mlh-cookies.json")
+)
+
+# Only the event cards are needed from the season page
+EVENT_STRAINER = SoupStrainer("div", class_="event")
+
+
+def find_event_divs(html: str, fast: bool = True):
+    """
+    The div.event elements of a season page. The fast path builds a tree of just
+    those divs, with lxml when it is installed; the full html.parser tree is the
+    fallback if that fails or finds nothing.
+    """
+    if fast:
+        try:
+            soup = BeautifulSoup(html, FAST_PARSER, parse_only=EVENT_STRAINER)
+            events = soup.find_all("div", class_="event")
+            if events:
+                return events
+        except Exception as e:
+            print(f"Fast MLH parsing failed, falling back to html.parser: {e}")
+    soup = BeautifulSoup(html, "html.parser")
+    return soup.find_all("div", class_="event")
+
+
+def index_card(event) -> dict:
+    """
+    First tag under an event card for each (tag name, "class", class) and
+    (tag name, "itemprop", itemprop), collected in one walk instead of a find() per field.
+    """
+    tags = {}
+    for tag in event.descendants:
+        if not isinstance(tag, Tag):
+            continue
+        for css_class in tag.get("class") or ():
+            tags.setdefault((tag.name, "class", css_class), tag)
+        itemprop = tag.get("itemprop")
+        if itemprop:
+            tags.setdefault((tag.name, "itemprop", itemprop), tag)
+    return tags
+
+
+def parse_event(event) -> dict | None:
+    """One div.event as a Hackathon row, or None for cards without a name or link."""
+    tags = index_card(event)
+
+    name_tag = tags.get(("h3", "class", "event-name"))
+    name = name_tag.get_text(strip=True) if name_tag else ""
+
+    link_tag = tags.get(("a", "class", "event-link"))
+    link = link_tag.get("href", "") if link_tag else ""
+
+    if not name or not link:
+        return None
+
+    start_date_tag = tags.get(("meta", "itemprop", "startDate"))
+    start_date = start_date_tag["content"] if start_date_tag else ""
+
+    end_date_tag = tags.get(("meta", "itemprop", "endDate"))
+    end_date = end_date_tag["content"] if end_date_tag else ""
+
+    # City and state count only inside the location block, which is small enough to search
+    location_tag = tags.get(("div", "class", "event-location"))
+    city_tag = location_tag.find("span", itemprop="city") if location_tag else None
+    city = city_tag.get_text(strip=True) if city_tag else ""
+
+    state_tag = location_tag.find("span", itemprop="state") if location_tag else None
+    state = state_tag.get_text(strip=True) if state_tag else ""
+
+    format_tag = tags.get(("div", "class", "event-hybrid-notes"))
+    format_type = format_tag.get_text(strip=True) if format_tag else "In-Person"
+
+    location: str = "Everywhere"
+    mode: str = "Online"
+    if format_type == "In-Person Only":
+        mode = "Offline"
+        location = f"{city}, {state}"
+
+    return dict(
+        id=hackathon_id("mlh", normalize_url(link)),
+        title=name,
+        start_date=start_date,
+        end_date=end_date,
+        location=location,
+        url=link,
+        mode=mode,
+        status="Upcoming",
+        source="mlh",
+        prize_pool="See details",
+        team_size="See details",
+        eligibility="Student Only",  # MLH is generally student focused
+    )
+
+
+def parse_season_page(html: str) -> list[Hackathon]:
+    return parsing.validate([row for row in map(parse_event, find_event_divs(html)) if row])
+
+
+def mlh_seasons(today: date = None) -> list[int]:
+    """
+    Seasons whose pages can list upcoming events. A season is named after the year it
+    ends in, so early on the running one (this year) still lists events while the next
+    one (next year) is already being filled.
+    """
+    today = today or date.today()
+    return [today.year, today.year + 1]
+
+
+def load_cookies(scraper, path: str):
+    """Restore the User-Agent and cookies (incl. Cloudflare clearance) saved by a previous run."""
+    try:
+        with open(path) as f:
+            saved = json.load(f)
+    except FileNotFoundError:
+        return
+    except (OSError, ValueError) as e:
+        print(f"Ignoring unreadable MLH cookie file {path}: {e}")
+        return
+    # Clearance cookies are only honoured together with the User-Agent that earned them
+    if saved.get("user_agent"):
+        scraper.headers["User-Agent"] = saved["user_agent"]
+    for cookie in saved.get("cookies", []):
+        scraper.cookies.set(**cookie)
+
+
+def save_cookies(scraper, path: str):
+    cookies = [
+        {
+            "name": c.name,
+            "value": c.value,
+            "domain": c.domain,
+            "path": c.path,
+            "expires": c.expires,
+            "secure": c.secure,
+        }
+        for c in scraper.cookies
+        if not c.is_expired()
+    ]
+    try:
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        # mkstemp creates a new file readable by the owner only and never follows a symlink
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".mlh-cookies-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"user_agent": scraper.headers.get("User-Agent"), "cookies": cookies}, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        print(f"Could not save MLH cookies to {path}: {e}")
+
+
+_scraper = None
+_scraper_lock = threading.Lock()
+
+
+def get_scraper():
+    """The cloudscraper session shared by all runs of this process."""
+    global _scraper
+    with _scraper_lock:
+        if _scraper is None:
+            _scraper = cloudscraper.create_scraper()
+            load_cookies(_scraper, MLH_COOKIE_FILE)
+        return _scraper
+
+
+def season_session(scraper):
+    """
+    A session of its own for one season thread, starting from the shared User-Agent
+    and cookies. Sessions are not safe to share between threads.
+    """
+    session = cloudscraper.create_scraper()
+    session.headers["User-Agent"] = scraper.headers["User-Agent"]
+    session.cookies.update(scraper.cookies)
+    return session
+
+
+def fetch_season(scraper, season: int) -> list[Hackathon]:
+    url = f"https://mlh.io/seasons/{season}/events"
+    response = http.get(url, session=scraper)
     if response.status_code != 200:
-        print(
-            f"Failed to fetch MLH page for season {current_year}. Status code: {response.status_code}"
+        # A Cloudflare challenge page is not an empty season
+        raise requests.exceptions.HTTPError(
+            f"MLH page for season {season} returned status {response.status_code}",
+            response=response,
         )
-        return []
 
-    soup = BeautifulSoup(response.text, "html.parser")
-    event_divs = soup.find_all("div", class_="event")
+    return parsing.result(parsing.submit(parse_season_page, response.text))
 
-    for event in event_divs:
-        name_tag = event.find("h3", class_="event-name")
-        name = name_tag.get_text(strip=True) if name_tag else ""
 
-        link_tag = event.find("a", class_="event-link")
-        link = link_tag.get("href", "") if link_tag else ""
-
-        if not name or not link:
-            continue
-
-        date_tag = event.find("p", class_="event-date")
-        date_str = date_tag.get_text(strip=True) if date_tag else ""
-
-        start_date_tag = event.find("meta", itemprop="startDate")
-        start_date = start_date_tag["content"] if start_date_tag else ""
-
-        end_date_tag = event.find("meta", itemprop="endDate")
-        end_date = end_date_tag["content"] if end_date_tag else ""
-
-        location_tag = event.find("div", class_="event-location")
-        city_tag = location_tag.find("span", itemprop="city") if location_tag else None
-        city = city_tag.get_text(strip=True) if city_tag else ""
-
-        state_tag = location_tag.find("span", itemprop="state") if location_tag else None
-        state = state_tag.get_text(strip=True) if state_tag else ""
-
-        format_tag = event.find("div", class_="event-hybrid-notes")
-        format_type = format_tag.get_text(strip=True) if format_tag else "In-Person"
-
-        location: str = "Everywhere"
-        mode: str = "Online"
-        if format_type == "In-Person Only":
-            mode = "Offline"
-            location = f"{city}, {state}"
-
-        hackathon = Hackathon(
-            id=hashlib.sha256(name.encode()).hexdigest(),
-            title=name,
-            start_date=start_date,
-            end_date=end_date,
-            location=location,
-            url=link,
-            mode=mode,
-            status="Upcoming",
-            source="mlh",
-            prize_pool="See details",
-            team_size="See details",
-            eligibility="Student Only",  # MLH is generally student focused
-        )
-        events.append(hackathon)
-
-    return events
+def scrape_mlh_events() -> list[Hackathon]:
+    scraper = get_scraper()
+    seasons = mlh_seasons()
+    with _scraper_lock:
+        sessions = [season_session(scraper) for _ in seasons]
+
+    results, errors = [], []
+    with ThreadPoolExecutor(max_workers=len(seasons)) as executor:
+        futures = [
+            http.submit(executor, fetch_season, session, season)
+            for session, season in zip(sessions, seasons)
+        ]
+        for season, future in zip(seasons, futures):
+            try:
+                results.append(future.result())
+            except requests.exceptions.RequestException as e:
+                print(f"Error fetching MLH page for season {season}: {e}")
+                errors.append(e)
+    # Keep any clearance a season thread earned for the next run
+    with _scraper_lock:
+        for session in sessions:
+            scraper.cookies.update(session.cookies)
+    save_cookies(scraper, MLH_COOKIE_FILE)
+    # Without any season MLH is down, which the run has to report as a failure
+    if not results:
+        raise errors[0]
+
+    # An event can be listed under both seasons
+    events = {}
+    for hackathon in (h for season_events in results for h in season_events):
+        events.setdefault(hackathon.id, hackathon)
+    return list(events.values())
 
 
 if __name__ == "__main__":
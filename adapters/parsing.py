@@ -0,0 +1,103 @@
+"""
+Optional process pool for the CPU-bound part of scraping.
+
+Fetching stays in the adapters' threads; what a response is turned into (HTML
+parsing, JSON decoding, Hackathon validation) can run in worker processes instead,
+so sources do not take turns on the GIL. Adapters hand a module-level parse
+function and the raw payload to submit() and collect the validated rows later, so a
+page is parsed while the next one downloads.
+
+PARSE_PROCESSES=0 (the default) parses in the calling thread; N > 0 uses a pool of N
+processes, started lazily with "spawn" because the bots run threads. A pool whose
+worker died (OOM, crash) is dropped, the parse is redone in the calling thread and
+the next submit() starts a new pool.
+
+Adapters validate the rows they build with validate(), in one batch.
+"""
+
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+from adapters import http
+from backend.schemas import Hackathon, validate_hackathons
+
+PARSE_PROCESSES = int(os.getenv("PARSE_PROCESSES", "0"))
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def parse_pool() -> ProcessPoolExecutor | None:
+    global _pool
+    if PARSE_PROCESSES <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=PARSE_PROCESSES, mp_context=multiprocessing.get_context("spawn")
+            )
+            atexit.register(_pool.shutdown, cancel_futures=True)
+        return _pool
+
+
+def discard_pool(pool: ProcessPoolExecutor):
+    """Forget a broken pool, so the next submit() starts a new one."""
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def run_here(parse, payload) -> Future:
+    future = Future()
+    try:
+        future.set_result(parse(payload))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+
+def submit(parse, payload) -> Future:
+    """Start parse(payload) in the pool, or run it right away without one."""
+    pool = parse_pool()
+    if pool is None:
+        return run_here(parse, payload)
+    try:
+        future = pool.submit(parse, payload)
+    except BrokenProcessPool:
+        print("Parse pool is broken, parsing in this thread and starting a new pool")
+        discard_pool(pool)
+        return run_here(parse, payload)
+    # Kept so result() can redo the parse if a worker dies before it finishes
+    future.parse_call = (pool, parse, payload)
+    return future
+
+
+def result(future: Future):
+    """Wait for a submitted parse, within the current run deadline."""
+    deadline = http.current_deadline()
+    try:
+        return future.result(timeout=deadline.remaining() if deadline else None)
+    except FutureTimeoutError:
+        future.cancel()
+        raise http.RunCancelledError("Run deadline passed while parsing") from None
+    except BrokenProcessPool:
+        pool, parse, payload = future.parse_call
+        print("A parse worker died, parsing in this thread and starting a new pool")
+        discard_pool(pool)
+        return parse(payload)
+
+
+def validate(rows: list[dict]) -> list[Hackathon]:
+    """Validate an adapter's rows in one batch, reporting and skipping the invalid ones."""
+    hackathons, errors = validate_hackathons(rows)
+    for index, error in errors:
+        print(f"Skipping hackathon due to validation error: {rows[index].get('title')}")
+        print(error)
+    return hackathons
@@ -0,0 +1,201 @@
+"""
+Record and replay upstream HTTP traffic of the adapters.
+
+A Recorder sends requests as usual and keeps every response; a Replayer answers
+requests from a recorded fixture without touching the network. Both plug into
+adapters.http as its transport, so every adapter is covered without changes:
+
+    with http.use_transport(Replayer.load("tests/fixtures/devpost.json.gz")):
+        hackathons = fetch_devpost_hackathons()
+
+Fixtures are gzipped JSON. Record a fresh one from the live site with
+
+    python -m adapters.replay record Devpost tests/fixtures/devpost.json.gz
+
+Replay matches on method and full URL first. A request that was not recorded
+verbatim because its date-window parameters (DATE_WINDOW_PARAMS, like Hack2Skill's
+start and end, which depend on today's date) differ gets the earliest unused
+response recorded for the same path and the same other parameters. Anything else,
+like a page or a detail path that was not recorded, is a miss rather than another
+response.
+"""
+
+import argparse
+import base64
+import gzip
+import json
+import threading
+from collections import defaultdict, deque
+from datetime import datetime, timezone
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from adapters import http, load_adapter, registered_sources
+
+FIXTURE_FORMAT = 1
+# Response headers worth keeping; the rest only adds noise to fixtures
+KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+# Query parameters computed from today's date, ignored when no recorded URL matches
+DATE_WINDOW_PARAMS = frozenset({"start", "end"})
+
+
+class ReplayMissError(requests.exceptions.RequestException):
+    """Raised for a request the fixture has no response for."""
+
+
+def request_url(method: str, url: str, params=None) -> str:
+    """The URL requests would send, with params encoded into the query string."""
+    return requests.Request(method, url, params=params).prepare().url
+
+
+def encode_body(content: bytes) -> dict:
+    try:
+        return {"text": content.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"base64": base64.b64encode(content).decode("ascii")}
+
+
+def decode_body(exchange: dict) -> bytes:
+    if "text" in exchange:
+        return exchange["text"].encode("utf-8")
+    return base64.b64decode(exchange["base64"])
+
+
+def save_fixture(path, exchanges: list[dict], source: str = None):
+    payload = {
+        "format": FIXTURE_FORMAT,
+        "source": source,
+        "recorded_at": datetime.now(timezone.utc).isoformat(),
+        "exchanges": exchanges,
+    }
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        json.dump(payload, f)
+
+
+def load_fixture(path) -> list[dict]:
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        payload = json.load(f)
+    if payload.get("format") != FIXTURE_FORMAT:
+        raise ValueError(f"{path}: unsupported fixture format {payload.get('format')}")
+    return payload["exchanges"]
+
+
+class Recorder:
+    """
+    Transport that records each exchange. Requests go on to the transport that was
+    active when the Recorder was created, normally http.send.
+    """
+
+    def __init__(self, transport=None):
+        self.exchanges = []
+        self.transport = transport or http.current_transport()
+        self.offline = getattr(self.transport, "offline", False)
+        self._lock = threading.Lock()
+
+    def __call__(self, session, method, url, timeout=None, **kwargs):
+        response = self.transport(session, method, url, timeout=timeout, **kwargs)
+        self.keep(method, request_url(method, url, kwargs.get("params")), response)
+        return response
+
+    def keep(self, method: str, url: str, response):
+        """Record an exchange, also one an adapter answered from its own cache."""
+        exchange = {
+            "method": method.upper(),
+            "url": url,
+            "status": response.status_code,
+            "headers": {k: response.headers[k] for k in KEPT_HEADERS if k in response.headers},
+            **encode_body(response.content),
+        }
+        with self._lock:
+            self.exchanges.append(exchange)
+
+    def save(self, path, source: str = None):
+        save_fixture(path, self.exchanges, source)
+
+
+def fallback_key(method: str, url: str) -> tuple:
+    """Method, scheme, host, path and the query without its date-window parameters."""
+    parts = urlsplit(url)
+    query = frozenset(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key not in DATE_WINDOW_PARAMS
+    )
+    return method, parts.scheme, parts.netloc, parts.path, query
+
+
+class Replayer:
+    """Transport that answers requests from recorded exchanges."""
+
+    offline = True
+
+    def __init__(self, exchanges: list[dict]):
+        self._by_url = defaultdict(deque)
+        self._by_key = defaultdict(deque)
+        for exchange in exchanges:
+            self._by_url[(exchange["method"], exchange["url"])].append(exchange)
+            self._by_key[fallback_key(exchange["method"], exchange["url"])].append(exchange)
+        self._served = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path):
+        return cls(load_fixture(path))
+
+    def _next(self, queue):
+        while queue:
+            exchange = queue.popleft()
+            if id(exchange) not in self._served:
+                self._served.add(id(exchange))
+                return exchange
+        return None
+
+    def __call__(self, session, method, url, timeout=None, **kwargs):
+        method = method.upper()
+        full_url = request_url(method, url, kwargs.get("params"))
+        with self._lock:
+            exchange = self._next(self._by_url[(method, full_url)]) or self._next(
+                self._by_key[fallback_key(method, full_url)]
+            )
+        if exchange is None:
+            raise ReplayMissError(f"No recorded response for {method} {full_url}")
+        return build_response(exchange, method, full_url)
+
+
+def build_response(exchange: dict, method: str, url: str) -> requests.Response:
+    response = requests.Response()
+    response.status_code = exchange["status"]
+    response.headers = CaseInsensitiveDict(exchange.get("headers", {}))
+    response._content = decode_body(exchange)
+    # Skip charset detection, which would dominate the cost of parsing small bodies
+    response.encoding = "utf-8" if "text" in exchange else None
+    response.url = url
+    response.request = requests.Request(method, url).prepare()
+    return response
+
+
+def record(source: str, path):
+    """Run one source's adapter against the live site and save its traffic to path."""
+    recorder = Recorder()
+    with http.use_transport(recorder):
+        hackathons = load_adapter(registered_sources()[source])()
+    recorder.save(path, source)
+    print(f"Recorded {len(recorder.exchanges)} responses ({len(hackathons)} hackathons) to {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record adapter HTTP fixtures.")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    record_parser = subcommands.add_parser("record", help="record a source's live traffic")
+    record_parser.add_argument("source", choices=sorted(registered_sources()))
+    record_parser.add_argument("path")
+    args = parser.parse_args()
+
+    if args.command == "record":
+        record(args.source, args.path)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,10 @@
-import hashlib
 import json
 from datetime import datetime
 
 import requests
-from pydantic import ValidationError
 
+from adapters import http, parsing
+from adapters.ids import hackathon_id
 from backend.schemas import Hackathon
 
 
@@ -39,25 +39,21 @@ def fetch_unstop_hackathons() -> list[Hackathon]:
         "Upgrade-Insecure-Requests": "1",
     }
 
-    hackathons = []
+    rows = []
     page = 1
 
     while page is not None:
         params = {"opportunity": "hackathons", "page": page, "oppstatus": "open"}
         try:
-            response = requests.get(base_url, headers=headers, params=params, timeout=10)
+            response = http.get(base_url, headers=headers, params=params, timeout=10)
             if response.status_code != 200:
                 print(f"Error: Received status code {response.status_code} on page {page}")
                 break
             data = response.json()
-            # Get last_page from the first response
-            next_page_url = data.get("data", {}).get("next_page_url")
-            if next_page_url:
-                page = int(next_page_url.split("page=")[1])
-            else:
-                page = None
-                break
             hackathon_data = data.get("data", {}).get("data", [])
+            # The last page has no next_page_url, but its hackathons still count
+            next_page_url = data.get("data", {}).get("next_page_url")
+            page = int(next_page_url.split("page=")[1]) if next_page_url else None
         except requests.RequestException as e:
             print(f"Error fetching URL on page {page}: {e}")
             break
@@ -150,9 +146,9 @@ def fetch_unstop_hackathons() -> list[Hackathon]:
             elif opp_status == "LIVE":
                 status = "ongoing"
 
-            try:
-                hackathon = Hackathon(
-                    id=hashlib.sha256(str(item.get("title")).encode()).hexdigest(),
+            rows.append(
+                dict(
+                    id=hackathon_id("unstop", item.get("id")),
                     title=item.get("title"),
                     start_date=start_date,
                     end_date=end_date,
@@ -174,11 +170,8 @@ def fetch_unstop_hackathons() -> list[Hackathon]:
                     )
                     or "Open to all",
                 )
-                hackathons.append(hackathon)
-            except ValidationError as e:
-                print(f"Skipping hackathon due to validation error: {item.get('title')}")
-                print(e)
-    return hackathons
+            )
+    return parsing.validate(rows)
 
 
 if __name__ == "__main__":
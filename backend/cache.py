@@ -0,0 +1,205 @@
+import logging
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from functools import wraps
+from inspect import signature
+
+from sqlalchemy.exc import SQLAlchemyError
+
+QUERY_CACHE_MAXSIZE = int(os.getenv("QUERY_CACHE_MAXSIZE", "256"))
+QUERY_CACHE_TTL = float(os.getenv("QUERY_CACHE_TTL", "600"))
+
+
+def _iter_rows(value):
+    """Yield the rows of a cached result: a list, or a tuple (page) holding a list."""
+    if isinstance(value, list):
+        yield from value
+    elif isinstance(value, tuple):
+        for part in value:
+            if isinstance(part, list):
+                yield from part
+
+
+def _approx_size(value) -> int:
+    """Rough memory footprint of a cached result (shallow per row)."""
+    size = sys.getsizeof(value)
+    for item in _iter_rows(value):
+        size += sys.getsizeof(item)
+        attrs = getattr(item, "__dict__", None)
+        if attrs:
+            size += sum(sys.getsizeof(v) for v in attrs.values())
+    return size
+
+
+class QueryCache:
+    """
+    LRU cache with a TTL for read-only query results.
+
+    Entries are tagged with the generation they were computed in. Ingestion calls
+    bump_generation() after writing, which makes every older entry stale at once.
+
+    The generation lives in this process only. When ingestion runs elsewhere (the
+    scraper service, or another bot holding the scrape lock) nothing bumps it here,
+    so results can lag the database by up to the TTL (QUERY_CACHE_TTL seconds).
+    """
+
+    def __init__(self, maxsize: int = QUERY_CACHE_MAXSIZE, ttl: float = QUERY_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (generation, expires_at, value, size)
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._metrics_hooks = []
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def bump_generation(self):
+        """Invalidate every cached result. Called by ingestion once new data is committed."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def get(self, key):
+        """Return (found, value) for key."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                generation, expires_at, value, _ = entry
+                if generation == self._generation and expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    found = True
+                else:
+                    del self._entries[key]
+                    entry = None
+            if entry is None:
+                self.misses += 1
+                found, value = False, None
+        self._emit_metrics()
+        return found, value
+
+    def set(self, key, value, generation: int):
+        """Store value, unless ingestion bumped the generation while it was being computed."""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[key] = (
+                generation,
+                time.monotonic() + self.ttl,
+                value,
+                _approx_size(value),
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "approx_bytes": sum(entry[3] for entry in self._entries.values()),
+                "generation": self._generation,
+            }
+
+    def add_metrics_hook(self, hook):
+        """Register hook(stats: dict), called after every cache lookup."""
+        self._metrics_hooks.append(hook)
+
+    def remove_metrics_hook(self, hook):
+        if hook in self._metrics_hooks:
+            self._metrics_hooks.remove(hook)
+
+    def _emit_metrics(self):
+        if not self._metrics_hooks:
+            return
+        stats = self.stats()
+        for hook in list(self._metrics_hooks):
+            try:
+                hook(stats)
+            except Exception as e:
+                logging.error(f"Query cache metrics hook failed: {e}")
+
+
+query_cache = QueryCache()
+
+
+def _normalize(value):
+    if isinstance(value, str):
+        return value.strip().lower()
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(_normalize(v) for v in value))
+    if isinstance(value, (list, tuple)):
+        return tuple(_normalize(v) for v in value)
+    return value
+
+
+def cached_query(func=None, *, default=list, cache: QueryCache | None = None):
+    """
+    Read-through cache for crud query functions taking (db, *args).
+
+    The key is the function name plus its normalized bound arguments and today's
+    date (results depend on date.today()). Database errors are logged and `default()`
+    is returned without being cached. Returned ORM objects are expunged from the
+    session so they stay usable after it closes.
+    """
+
+    def decorator(func):
+        sig = signature(func)
+
+        @wraps(func)
+        def wrapper(db, *args, **kwargs):
+            store = cache or query_cache
+            bound = sig.bind(db, *args, **kwargs)
+            bound.apply_defaults()
+            key = (
+                func.__name__,
+                date.today(),
+                tuple((name, _normalize(v)) for name, v in bound.arguments.items() if name != "db"),
+            )
+
+            found, value = store.get(key)
+            if found:
+                return value
+
+            generation = store.generation
+            try:
+                value = func(db, *args, **kwargs)
+            except SQLAlchemyError as e:
+                db.rollback()
+                logging.error(f"Database error in {func.__name__}: {e}")
+                return default()
+
+            for obj in _iter_rows(value):
+                if obj in db:
+                    db.expunge(obj)
+            store.set(key, value, generation)
+            return value
+
+        wrapper.uncached = func
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+    return decorator
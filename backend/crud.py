@@ -1,20 +1,103 @@
 import logging
+from datetime import date, datetime, timedelta
+from typing import NamedTuple
 
+from sqlalchemy import delete, func, or_, text, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
-from backend.models import GuildConfig, HackathonDB, UserSubscription
+from backend.cache import cached_query
+from backend.models import (
+    ChangeCursor,
+    CircuitBreakerState,
+    GuildConfig,
+    HackathonChange,
+    HackathonDB,
+    ScrapeRun,
+    SourceSchedule,
+    UserSubscription,
+)
 from backend.schemas import Hackathon
 
+# Fields whose changes are recorded in hackathon_changes
+CHANGE_TRACKED_FIELDS = (
+    "title",
+    "start_date",
+    "end_date",
+    "location",
+    "url",
+    "mode",
+    "status",
+    "tags",
+    "prize_pool",
+    "team_size",
+    "eligibility",
+)
+
+# pg_advisory_xact_lock key serializing writers of hackathon_changes
+CHANGE_LOG_LOCK_KEY = 7_210_031
+
+
+def _change_value(value):
+    if value is None:
+        return None
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+def diff_hackathon(db_obj: HackathonDB, hack: Hackathon) -> list[dict]:
+    """Field-level differences between a stored row and a freshly scraped hackathon."""
+    changes = []
+    for field in CHANGE_TRACKED_FIELDS:
+        old = getattr(db_obj, field)
+        new = ",".join(hack.tags) if field == "tags" else getattr(hack, field)
+        if old != new:
+            changes.append(
+                {
+                    "hackathon_id": db_obj.id,
+                    "field": field,
+                    "old_value": _change_value(old),
+                    "new_value": _change_value(new),
+                }
+            )
+    return changes
+
 
-def upsert_hackathon(db: Session, hack: Hackathon):
+def append_hackathon_changes(db: Session, changes: list[dict]):
+    """
+    Append change rows to the change log.
+
+    Writers take a transaction-scoped advisory lock first, so sequence numbers are
+    handed out in commit order and a reader tailing by seq never skips a row that
+    commits late.
+    """
+    if not changes:
+        return
+    db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": CHANGE_LOG_LOCK_KEY})
+    db.execute(insert(HackathonChange), changes)
+
+
+def upsert_hackathon(db: Session, hack: Hackathon, commit: bool = True, changes: list = None):
     """
     Upsert a hackathon and return (hackathon_obj, is_new)
-    where is_new is True if the hackathon was newly created, False if updated
+    where is_new is True if the hackathon was newly created, False if updated.
+
+    With commit=False the change is only flushed, so the caller controls the
+    transaction (and any savepoint around this call) and rolls back on error.
+    Field changes of an existing row go to the change log; pass a `changes` list to
+    collect them instead and write them later with append_hackathon_changes().
     """
     try:
         db_obj = db.query(HackathonDB).filter_by(id=hack.id).first()
         if db_obj:
+            diffs = diff_hackathon(db_obj, hack)
+            if changes is not None:
+                changes.extend(diffs)
+            else:
+                append_hackathon_changes(db, diffs)
+
             # Update existing record if needed
             db_obj.title = hack.title
             db_obj.start_date = hack.start_date
@@ -25,11 +108,15 @@ def upsert_hackathon(db: Session, hack: Hackathon):
             db_obj.status = hack.status
             db_obj.source = hack.source
             db_obj.tags = ",".join(hack.tags)
-            db_obj.banner_url = hack.banner_url
+            # A banner from the detail page beats the list's thumbnail
+            db_obj.banner_url = db_obj.detail_banner_url or hack.banner_url
             db_obj.prize_pool = hack.prize_pool
             db_obj.team_size = hack.team_size
             db_obj.eligibility = hack.eligibility
-            db.commit()
+            if commit:
+                db.commit()
+            else:
+                db.flush()
             return db_obj, False
         else:
             # Create new record
@@ -50,22 +137,27 @@ def upsert_hackathon(db: Session, hack: Hackathon):
                 eligibility=hack.eligibility,
             )
             db.add(db_obj)
-            db.commit()
-            db.refresh(db_obj)
+            if commit:
+                db.commit()
+                db.refresh(db_obj)
+            else:
+                db.flush()
             return db_obj, True
     except SQLAlchemyError as e:
-        db.rollback()
+        if commit:
+            db.rollback()
         logging.error(f"Database error in upsert_hackathon: {e}")
         raise
     except Exception as e:
-        db.rollback()
+        if commit:
+            db.rollback()
         logging.error(f"Unexpected error in upsert_hackathon: {e}")
         raise
 
 
 def get_upcoming(db: Session, from_date=None, to_date=None, sources=None):
     try:
-        q = db.query(HackathonDB)
+        q = db.query(HackathonDB).filter(HackathonDB.duplicate_of.is_(None))
         if from_date:
             q = q.filter(HackathonDB.start_date >= from_date)
         if to_date:
@@ -78,114 +170,424 @@ def get_upcoming(db: Session, from_date=None, to_date=None, sources=None):
         raise
 
 
-def search_hackathons(db: Session, keyword: str, limit: int = 3):
+def get_hackathons_by_ids(db: Session, ids: list):
+    """
+    Get hackathons by primary key.
+    """
+    if not ids:
+        return []
     try:
-        # Case insensitive search using ilike
-        search_term = f"%{keyword}%"
-        results = (
-            db.query(HackathonDB).filter(HackathonDB.tags.ilike(search_term)).limit(limit).all()
-        )
-        return results
+        return db.query(HackathonDB).filter(HackathonDB.id.in_(ids)).all()
     except SQLAlchemyError as e:
-        logging.error(f"Database error in search_hackathons: {e}")
+        logging.error(f"Database error in get_hackathons_by_ids: {e}")
         return []
 
 
-from datetime import date
+def get_dedup_candidates(db: Session, from_date: date, to_date: date):
+    """
+    Get canonical hackathons whose dates overlap [from_date, to_date] (with a day of slack),
+    as light (id, title, source, url, start_date, end_date) rows.
+    """
+    return (
+        db.query(
+            HackathonDB.id,
+            HackathonDB.title,
+            HackathonDB.source,
+            HackathonDB.url,
+            HackathonDB.start_date,
+            HackathonDB.end_date,
+        )
+        .filter(HackathonDB.duplicate_of.is_(None))
+        .filter(HackathonDB.end_date >= from_date - timedelta(days=1))
+        .filter(HackathonDB.start_date <= to_date + timedelta(days=1))
+        .all()
+    )
 
 
-def get_hackathons_by_platform(db: Session, platform_name: str, limit: int = 3):
+def mark_duplicates(db: Session, canonical_id: str, duplicate_ids: list, commit: bool = True):
     """
-    Get hackathons from a specific platform (source).
-    Returns upcoming hackathons ordered by start date (soonest first).
+    Point duplicate_ids (and anything that pointed at them) at the canonical hackathon.
     """
+    if not duplicate_ids:
+        return
     try:
-        # Case insensitive search on the source column
-        # Filter for hackathons starting today or in the future
-        # Order by start_date ascending (soonest first)
-        results = (
-            db.query(HackathonDB)
-            .filter(HackathonDB.source.ilike(f"%{platform_name}%"))
-            .filter(HackathonDB.start_date >= date.today())
-            .order_by(HackathonDB.start_date.asc())
+        db.query(HackathonDB).filter(
+            or_(HackathonDB.id.in_(duplicate_ids), HackathonDB.duplicate_of.in_(duplicate_ids))
+        ).update({HackathonDB.duplicate_of: canonical_id}, synchronize_session=False)
+        if commit:
+            db.commit()
+    except SQLAlchemyError as e:
+        if commit:
+            db.rollback()
+        logging.error(f"Database error in mark_duplicates: {e}")
+        raise
+
+
+def get_alternate_listings(db: Session, ids: list) -> dict:
+    """
+    Get the other sources listing each canonical hackathon: {id: [(source, url), ...]}.
+    """
+    if not ids:
+        return {}
+    try:
+        rows = (
+            db.query(HackathonDB.duplicate_of, HackathonDB.source, HackathonDB.url)
+            .filter(HackathonDB.duplicate_of.in_(ids))
+            .order_by(HackathonDB.source)
+            .all()
+        )
+    except SQLAlchemyError as e:
+        logging.error(f"Database error in get_alternate_listings: {e}")
+        return {}
+    listings = {}
+    for canonical_id, source, url in rows:
+        listings.setdefault(canonical_id, []).append((source, url))
+    return listings
+
+
+def get_hackathon_changes(db: Session, after_seq: int = 0, limit: int = 500):
+    """
+    Get change log entries with seq > after_seq, oldest first.
+    """
+    try:
+        return (
+            db.query(HackathonChange)
+            .filter(HackathonChange.seq > after_seq)
+            .order_by(HackathonChange.seq.asc())
             .limit(limit)
             .all()
         )
-        return results
     except SQLAlchemyError as e:
-        logging.error(f"Database error in get_hackathons_by_platform: {e}")
+        logging.error(f"Database error in get_hackathon_changes: {e}")
         return []
 
 
-from datetime import timedelta
+def get_latest_change_seq(db: Session) -> int:
+    return db.query(func.coalesce(func.max(HackathonChange.seq), 0)).scalar()
 
 
-def get_upcoming_hackathons(db: Session, days: int = 7):
+def get_change_cursor(db: Session, consumer: str):
     """
-    Get hackathons starting within the next 'days' days.
+    Get the last change seq a consumer has processed, or None for a new consumer.
     """
+    cursor = db.get(ChangeCursor, consumer)
+    return cursor.last_seq if cursor else None
+
+
+def set_change_cursor(db: Session, consumer: str, last_seq: int):
     try:
-        today = date.today()
-        end_date = today + timedelta(days=days)
-
-        results = (
-            db.query(HackathonDB)
-            .filter(HackathonDB.start_date >= today)
-            .filter(HackathonDB.start_date <= end_date)
-            .order_by(HackathonDB.start_date.asc())
-            .all()
+        stmt = (
+            insert(ChangeCursor)
+            .values(consumer=consumer, last_seq=last_seq)
+            .on_conflict_do_update(
+                index_elements=[ChangeCursor.consumer],
+                set_={"last_seq": last_seq, "updated_at": func.now()},
+            )
         )
-        return results
+        db.execute(stmt)
+        db.commit()
     except SQLAlchemyError as e:
-        logging.error(f"Database error in get_upcoming_hackathons: {e}")
-        return []
+        db.rollback()
+        logging.error(f"Database error in set_change_cursor: {e}")
+        raise
+
+
+def get_source_schedules(db: Session) -> dict:
+    """
+    Get the polling state of every source that ran before: {source: SourceSchedule}.
+    """
+    return {schedule.source: schedule for schedule in db.query(SourceSchedule).all()}
+
+
+def save_source_schedule(db: Session, source: str, **values):
+    try:
+        stmt = (
+            insert(SourceSchedule)
+            .values(source=source, **values)
+            .on_conflict_do_update(index_elements=[SourceSchedule.source], set_=values)
+        )
+        db.execute(stmt)
+        db.commit()
+    except SQLAlchemyError as e:
+        db.rollback()
+        logging.error(f"Database error in save_source_schedule: {e}")
+        raise
+
+
+def get_circuit_breakers(db: Session) -> dict:
+    """
+    Get persisted circuit breakers: {host: CircuitBreakerState}.
+    """
+    return {row.host: row for row in db.query(CircuitBreakerState).all()}
+
+
+def save_circuit_breakers(db: Session, states: list[dict]):
+    """
+    Upsert circuit breaker rows given as dicts with host, state, failures and opened_at.
+    """
+    if not states:
+        return
+    try:
+        stmt = insert(CircuitBreakerState).values(states)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CircuitBreakerState.host],
+            set_={
+                "state": stmt.excluded.state,
+                "failures": stmt.excluded.failures,
+                "opened_at": stmt.excluded.opened_at,
+                "updated_at": func.now(),
+            },
+        )
+        db.execute(stmt)
+        db.commit()
+    except SQLAlchemyError as e:
+        db.rollback()
+        logging.error(f"Database error in save_circuit_breakers: {e}")
+        raise
+
+
+def get_enrichment_candidates(db: Session, stale_before: datetime, limit: int):
+    """
+    Current, canonical hackathons whose detail page was never fetched or not since
+    stale_before; never fetched first, then the least recently fetched. Pages whose
+    last fetch failed wait until their enrich_retry_at.
+    """
+    return (
+        db.query(
+            HackathonDB.id,
+            HackathonDB.url,
+            HackathonDB.detail_etag,
+            HackathonDB.detail_last_modified,
+            HackathonDB.enrich_failures,
+        )
+        .filter(HackathonDB.duplicate_of.is_(None))
+        .filter(HackathonDB.end_date >= date.today())
+        .filter(or_(HackathonDB.enriched_at.is_(None), HackathonDB.enriched_at < stale_before))
+        .filter(
+            or_(HackathonDB.enrich_retry_at.is_(None), HackathonDB.enrich_retry_at <= func.now())
+        )
+        .order_by(HackathonDB.enriched_at.asc().nulls_first(), HackathonDB.start_date)
+        .limit(limit)
+        .all()
+    )
+
+
+def save_enrichments(db: Session, rows: list[dict]):
+    """
+    Bulk update hackathons from their detail pages. Each row has "id" and the columns
+    to set; a detail_banner_url also replaces banner_url.
+    """
+    if not rows:
+        return
+    try:
+        db.execute(
+            update(HackathonDB),
+            [
+                {**row, "banner_url": row["detail_banner_url"]}
+                if row.get("detail_banner_url")
+                else row
+                for row in rows
+            ],
+        )
+        db.commit()
+    except SQLAlchemyError as e:
+        db.rollback()
+        logging.error(f"Database error in save_enrichments: {e}")
+        raise
+
+
+def add_scrape_run(db: Session, **values):
+    try:
+        db.add(ScrapeRun(**values))
+        db.commit()
+    except SQLAlchemyError as e:
+        db.rollback()
+        logging.error(f"Database error in add_scrape_run: {e}")
+        raise
+
+
+def get_last_successful_scrape(db: Session):
+    """
+    Get the finish time of the latest scrape run in which every source succeeded, or None.
+    """
+    return db.query(func.max(ScrapeRun.finished_at)).filter(ScrapeRun.ok.is_(True)).scalar()
+
+
+class HackathonPage(NamedTuple):
+    items: list
+    has_prev: bool
+    has_next: bool
+
+
+def paginate_hackathons(query, cursor=None, backwards: bool = False, page_size: int = 5):
+    """
+    Keyset-paginate a HackathonDB query on (start_date, id).
+
+    cursor is the (start_date, id) of the first item of the current page when going
+    backwards, or of the last item when going forwards. Only page_size + 1 rows are
+    read, so the cost of a page does not depend on how deep the user has scrolled.
+    """
+    key = tuple_(HackathonDB.start_date, HackathonDB.id)
+    if cursor:
+        query = query.filter(key < tuple_(*cursor) if backwards else key > tuple_(*cursor))
+
+    if backwards:
+        query = query.order_by(HackathonDB.start_date.desc(), HackathonDB.id.desc())
+    else:
+        query = query.order_by(HackathonDB.start_date.asc(), HackathonDB.id.asc())
+
+    rows = query.limit(page_size + 1).all()
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+
+    if backwards:
+        rows.reverse()
+        return HackathonPage(rows, has_more, cursor is not None)
+    return HackathonPage(rows, cursor is not None, has_more)
+
+
+@cached_query(default=lambda: HackathonPage([], False, False))
+def search_hackathons_page(
+    db: Session, keyword: str, cursor=None, backwards: bool = False, page_size: int = 5
+):
+    """
+    Get one page of hackathons whose tags or description match keyword.
+    """
+    search_term = f"%{keyword}%"
+    query = (
+        db.query(HackathonDB)
+        .filter(
+            or_(HackathonDB.tags.ilike(search_term), HackathonDB.description.ilike(search_term))
+        )
+        .filter(HackathonDB.duplicate_of.is_(None))
+    )
+    return paginate_hackathons(query, cursor, backwards, page_size)
+
+
+@cached_query(default=lambda: HackathonPage([], False, False))
+def get_hackathons_by_platform_page(
+    db: Session, platform_name: str, cursor=None, backwards: bool = False, page_size: int = 5
+):
+    """
+    Get one page of upcoming hackathons from a specific platform (source).
+    """
+    query = (
+        db.query(HackathonDB)
+        .filter(HackathonDB.source.ilike(f"%{platform_name}%"))
+        .filter(HackathonDB.start_date >= date.today())
+    )
+    return paginate_hackathons(query, cursor, backwards, page_size)
+
+
+@cached_query(default=lambda: HackathonPage([], False, False))
+def get_upcoming_hackathons_page(
+    db: Session, days: int = 7, cursor=None, backwards: bool = False, page_size: int = 5
+):
+    """
+    Get one page of hackathons starting within the next 'days' days.
+    """
+    today = date.today()
+    query = (
+        db.query(HackathonDB)
+        .filter(HackathonDB.start_date >= today)
+        .filter(HackathonDB.start_date <= today + timedelta(days=days))
+        .filter(HackathonDB.duplicate_of.is_(None))
+    )
+    return paginate_hackathons(query, cursor, backwards, page_size)
 
 
 def subscribe_user(db: Session, user_id: int, theme: str):
     """
-    Subscribe a user to a theme.
-    Returns (subscription_obj, is_new)
+    Subscribe a user to a theme with a single INSERT ... ON CONFLICT DO NOTHING.
+    Returns (subscription_obj, is_new); subscription_obj is None if already subscribed.
     """
     try:
-        # Normalize theme to lowercase for consistent matching?
-        # The user didn't specify, but it's good practice.
-        # However, tags in DB might be mixed case.
-        # Let's store as provided but maybe lowercase for comparison?
-        # For now, store as provided.
-
-        existing = db.query(UserSubscription).filter_by(user_id=user_id, theme=theme).first()
-        if existing:
-            return existing, False
-
-        sub = UserSubscription(user_id=user_id, theme=theme)
-        db.add(sub)
+        stmt = (
+            insert(UserSubscription)
+            .values(user_id=user_id, theme=theme)
+            .on_conflict_do_nothing(constraint="unique_user_theme")
+            .returning(UserSubscription)
+        )
+        sub = db.scalars(stmt).first()
         db.commit()
-        db.refresh(sub)
-        return sub, True
+        return sub, sub is not None
     except SQLAlchemyError as e:
         db.rollback()
         logging.error(f"Database error in subscribe_user: {e}")
         raise
 
 
+def subscribe_user_bulk(db: Session, user_id: int, themes: list):
+    """
+    Subscribe a user to several themes in one statement.
+    Returns the list of themes that were newly subscribed.
+    """
+    themes = list(dict.fromkeys(themes))
+    if not themes:
+        return []
+    try:
+        stmt = (
+            insert(UserSubscription)
+            .values([{"user_id": user_id, "theme": theme} for theme in themes])
+            .on_conflict_do_nothing(constraint="unique_user_theme")
+            .returning(UserSubscription.theme)
+        )
+        added = set(db.scalars(stmt).all())
+        db.commit()
+        return [theme for theme in themes if theme in added]
+    except SQLAlchemyError as e:
+        db.rollback()
+        logging.error(f"Database error in subscribe_user_bulk: {e}")
+        raise
+
+
 def unsubscribe_user(db: Session, user_id: int, theme: str):
     """
     Unsubscribe a user from a theme.
     Returns True if removed, False if not found.
     """
+    return bool(unsubscribe_user_bulk(db, user_id, [theme]))
+
+
+def unsubscribe_user_bulk(db: Session, user_id: int, themes: list):
+    """
+    Unsubscribe a user from several themes in one statement.
+    Returns the list of themes that were removed.
+    """
+    themes = list(dict.fromkeys(themes))
+    if not themes:
+        return []
     try:
-        existing = db.query(UserSubscription).filter_by(user_id=user_id, theme=theme).first()
-        if existing:
-            db.delete(existing)
-            db.commit()
-            return True
-        return False
+        stmt = (
+            delete(UserSubscription)
+            .where(UserSubscription.user_id == user_id, UserSubscription.theme.in_(themes))
+            .returning(UserSubscription.theme)
+        )
+        removed = set(db.scalars(stmt).all())
+        db.commit()
+        return [theme for theme in themes if theme in removed]
     except SQLAlchemyError as e:
         db.rollback()
-        logging.error(f"Database error in unsubscribe_user: {e}")
+        logging.error(f"Database error in unsubscribe_user_bulk: {e}")
         raise
 
 
+def get_user_subscriptions(db: Session, user_id: int):
+    """
+    Get one user's subscriptions (uses idx_user_subscriptions_user_id).
+    """
+    try:
+        return (
+            db.query(UserSubscription)
+            .filter(UserSubscription.user_id == user_id)
+            .order_by(UserSubscription.theme)
+            .all()
+        )
+    except SQLAlchemyError as e:
+        logging.error(f"Database error in get_user_subscriptions: {e}")
+        return []
+
+
 def get_all_subscriptions(db: Session):
     """
     Get all user subscriptions.
@@ -208,6 +610,32 @@ def get_guild_config(db: Session, guild_id: str):
         return None
 
 
+def get_active_guilds_for_source(db: Session, source: str):
+    """
+    Get guilds with notifications enabled that track the given source,
+    either explicitly or by tracking all platforms (empty list).
+
+    The two cases are separate queries: the GIN index answers the first and the
+    partial idx_guild_configs_all_platforms index the second, which one OR could not.
+    """
+    try:
+        active = db.query(GuildConfig).filter(~GuildConfig.notifications_paused)
+        explicit = active.filter(GuildConfig.subscribed_platforms.contains([source.lower()]))
+        everything = active.filter(text("guild_configs.subscribed_platforms = '{}'"))
+        return explicit.union_all(everything).all()
+    except SQLAlchemyError as e:
+        logging.error(f"Database error in get_active_guilds_for_source: {e}")
+        return []
+
+
+def guild_wants_tags(config: GuildConfig, tags: list) -> bool:
+    """Theme filter for a guild: no themes means all, otherwise any theme within any tag."""
+    if not config.subscribed_themes:
+        return True
+    tags = [tag.lower() for tag in tags]
+    return any(theme in tag for theme in config.subscribed_themes for tag in tags)
+
+
 def update_guild_preferences(
     db: Session, guild_id: str, channel_id: str = None, platforms: list = None, themes: list = None
 ):
@@ -223,11 +651,12 @@ def update_guild_preferences(
         if channel_id:
             config.channel_id = channel_id
 
+        # An empty list means "all"
         if platforms is not None:
-            config.subscribed_platforms = ",".join(platforms) if platforms else "all"
+            config.subscribed_platforms = [p.strip().lower() for p in platforms if p.strip()]
 
         if themes is not None:
-            config.subscribed_themes = ",".join(themes) if themes else "all"
+            config.subscribed_themes = [t.strip().lower() for t in themes if t.strip()]
 
         db.commit()
         db.refresh(config)
@@ -248,7 +677,7 @@ def pause_notifications(db: Session, guild_id: str):
         if not config:
             return False
 
-        config.notifications_paused = "true"
+        config.notifications_paused = True
         db.commit()
         return True
     except SQLAlchemyError as e:
@@ -267,7 +696,7 @@ def resume_notifications(db: Session, guild_id: str):
         if not config:
             return False
 
-        config.notifications_paused = "false"
+        config.notifications_paused = False
         db.commit()
         return True
     except SQLAlchemyError as e:
@@ -0,0 +1,204 @@
+"""
+Cross-source duplicate detection.
+
+The same event is often listed on several platforms (MLH and Devpost, Devfolio and
+Devpost, ...). Titles are reduced to character shingles and hashed into MinHash
+signatures; locality-sensitive hashing over bands of the signature yields candidate
+pairs in near-linear time. A candidate pair is a duplicate when its shingle sets are
+similar enough, its date ranges overlap and it comes from two different sources. A
+shared event domain in the URLs lowers the similarity needed.
+"""
+
+import hashlib
+import random
+import re
+from datetime import date, timedelta
+from itertools import combinations
+from typing import NamedTuple
+from urllib.parse import urlparse
+
+SHINGLE_SIZE = 3
+NUM_PERMUTATIONS = 64
+LSH_BANDS = 16
+LSH_ROWS = NUM_PERMUTATIONS // LSH_BANDS
+
+# Jaccard similarity of title shingles needed to call two listings the same event
+TITLE_SIMILARITY = 0.6
+# ...when both URLs point at the same event domain
+TITLE_SIMILARITY_SAME_DOMAIN = 0.3
+# Slack for platforms that round dates or list the submission deadline as end date
+DATE_TOLERANCE = timedelta(days=1)
+
+# Preferred canonical source when none of the listings is stored yet
+SOURCE_PRIORITY = ("mlh", "devpost", "devfolio", "unstop", "dorahacks", "hack2skill", "kaggle")
+
+# Hosting platforms and shared hosts: the event is identified by the subdomain, if any
+PLATFORM_DOMAINS = (
+    "devpost.com",
+    "devfolio.co",
+    "unstop.com",
+    "dorahacks.io",
+    "hack2skill.com",
+    "mlh.io",
+    "kaggle.com",
+    "lu.ma",
+    "github.io",
+    "github.com",
+    "notion.site",
+    "eventbrite.com",
+    "google.com",
+    "forms.gle",
+    "gitlab.io",
+    "vercel.app",
+    "netlify.app",
+    "pages.dev",
+    "web.app",
+    "firebaseapp.com",
+    "herokuapp.com",
+    "onrender.com",
+    "replit.app",
+    "webflow.io",
+    "framer.website",
+    "wixsite.com",
+    "carrd.co",
+    "super.site",
+    "blogspot.com",
+)
+
+# Second-level labels that are part of a country suffix (example.co.uk, example.com.au)
+COUNTRY_SECOND_LEVELS = {"co", "com", "org", "net", "ac", "edu", "gov", "or", "ne"}
+
+# Words that say nothing about which event a title refers to
+TITLE_STOPWORDS = {"a", "an", "and", "the", "of", "hackathon", "hack", "edition", "online"}
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(20260418)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERMUTATIONS)
+]
+
+
+class DedupRecord(NamedTuple):
+    id: str
+    title: str
+    source: str
+    url: str
+    start_date: date
+    end_date: date
+    stored: bool = False  # already in the database before this run
+
+
+def normalize_title(title: str) -> str:
+    words = re.findall(r"[a-z0-9]+", (title or "").lower())
+    return " ".join(word for word in words if word not in TITLE_STOPWORDS)
+
+
+def title_shingles(title: str) -> set:
+    text = normalize_title(title)
+    if len(text) <= SHINGLE_SIZE:
+        return {text}
+    return {text[i : i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1)}
+
+
+def minhash(shingles: set) -> tuple:
+    hashes = [
+        int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), "big") for s in shingles
+    ]
+    return tuple(min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in _PERMUTATIONS)
+
+
+def jaccard(a: set, b: set) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def url_key(url: str) -> str | None:
+    """The part of a URL that names the event: a platform subdomain or the site's own domain."""
+    host = (urlparse(url or "").hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if not host:
+        return None
+    for platform in PLATFORM_DOMAINS:
+        if host == platform:
+            return None
+        if host.endswith("." + platform):
+            return host[: -len(platform) - 1].split(".")[-1]
+    labels = host.split(".")
+    # The name of the registrable domain: skip the public suffix, then take one label
+    suffix = 1
+    if len(labels) >= 3 and len(labels[-1]) == 2 and labels[-2] in COUNTRY_SECOND_LEVELS:
+        suffix = 2
+    return labels[-suffix - 1] if len(labels) > suffix else labels[0]
+
+
+def dates_overlap(a: DedupRecord, b: DedupRecord) -> bool:
+    return (
+        a.start_date <= b.end_date + DATE_TOLERANCE and b.start_date <= a.end_date + DATE_TOLERANCE
+    )
+
+
+def is_duplicate(a: DedupRecord, b: DedupRecord, shingles_a: set, shingles_b: set) -> bool:
+    if a.source.lower() == b.source.lower() or not dates_overlap(a, b):
+        return False
+    similarity = jaccard(shingles_a, shingles_b)
+    if similarity >= TITLE_SIMILARITY:
+        return True
+    key = url_key(a.url)
+    return key is not None and key == url_key(b.url) and similarity >= TITLE_SIMILARITY_SAME_DOMAIN
+
+
+def find_duplicate_clusters(records: list) -> list[list]:
+    """Group records listing the same event. Only clusters of two or more are returned."""
+    shingles = [title_shingles(record.title) for record in records]
+    buckets = {}
+    for index, record_shingles in enumerate(shingles):
+        signature = minhash(record_shingles)
+        for band in range(LSH_BANDS):
+            rows = signature[band * LSH_ROWS : (band + 1) * LSH_ROWS]
+            buckets.setdefault((band, rows), []).append(index)
+    # Records sharing an event domain are candidates even if their titles hash apart
+    for index, record in enumerate(records):
+        key = url_key(record.url)
+        if key:
+            buckets.setdefault(("url", key), []).append(index)
+
+    parent = list(range(len(records)))
+    # A cluster never holds two listings from the same source, even transitively
+    cluster_sources = [{record.source.lower()} for record in records]
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    checked = set()
+    for members in buckets.values():
+        for i, j in combinations(members, 2):
+            if (i, j) in checked:
+                continue
+            checked.add((i, j))
+            root_i, root_j = find(i), find(j)
+            if cluster_sources[root_i] & cluster_sources[root_j]:
+                continue
+            if is_duplicate(records[i], records[j], shingles[i], shingles[j]):
+                parent[root_j] = root_i
+                cluster_sources[root_i] |= cluster_sources[root_j]
+
+    clusters = {}
+    for index in range(len(records)):
+        clusters.setdefault(find(index), []).append(records[index])
+    return [cluster for cluster in clusters.values() if len(cluster) > 1]
+
+
+def _source_rank(record: DedupRecord) -> int:
+    source = record.source.lower()
+    return SOURCE_PRIORITY.index(source) if source in SOURCE_PRIORITY else len(SOURCE_PRIORITY)
+
+
+def choose_canonical(cluster: list) -> DedupRecord:
+    """A listing that is already stored (and was announced) wins, then source priority."""
+    return min(cluster, key=lambda record: (not record.stored, _source_rank(record), record.id))
@@ -1,8 +1,11 @@
+import backend.models  # noqa: F401  (registers tables on Base.metadata)
 from backend.db import Base, engine
+from backend.migrations import run_migrations
 
 
 def create_all_tables():
     Base.metadata.create_all(bind=engine)
+    run_migrations(engine)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,107 @@
+"""
+Leader election for scheduled jobs when several replicas of a bot run at once.
+
+Each replica tries to take a session-level PostgreSQL advisory lock on a dedicated
+connection before running a job. The replica holding it is the leader and keeps the
+lock (and the connection) between runs; the others skip their scheduled jobs but keep
+serving commands. If the leader dies, PostgreSQL drops its session and the lock, and
+the next replica to tick takes over.
+"""
+
+import logging
+import zlib
+from functools import wraps
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from backend.db import engine
+
+
+def lock_key(name: str) -> int:
+    """Stable 32-bit advisory lock key for a job name."""
+    return zlib.crc32(name.encode())
+
+
+class LeaderElection:
+    def __init__(self, name: str, bind=None):
+        self.name = name
+        self.key = lock_key(name)
+        self.bind = bind if bind is not None else engine
+        self._conn = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self._conn is not None
+
+    def acquire(self) -> bool:
+        """Become, or confirm still being, the leader. Never blocks."""
+        if self._conn is not None:
+            try:
+                self._conn.execute(text("SELECT 1"))
+                self._conn.commit()
+                return True
+            except SQLAlchemyError as e:
+                logging.warning(f"Lost the {self.name} leader connection: {e}")
+                self._discard()
+
+        try:
+            conn = self.bind.connect()
+        except SQLAlchemyError as e:
+            logging.error(f"Database error in leader election for {self.name}: {e}")
+            return False
+        try:
+            acquired = conn.execute(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": self.key}
+            ).scalar()
+            conn.commit()
+        except SQLAlchemyError as e:
+            logging.error(f"Database error in leader election for {self.name}: {e}")
+            conn.invalidate()
+            conn.close()
+            return False
+
+        if not acquired:
+            conn.close()
+            return False
+        self._conn = conn
+        logging.info(f"This replica is now the leader for {self.name}")
+        return True
+
+    def release(self):
+        """Give up leadership, e.g. on shutdown."""
+        if self._conn is None:
+            return
+        try:
+            self._conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": self.key})
+            self._conn.commit()
+            self._conn.close()
+            self._conn = None
+        except SQLAlchemyError as e:
+            logging.error(f"Database error releasing the {self.name} leader lock: {e}")
+            self._discard()
+
+    def _discard(self):
+        # Never hand a connection that may still hold the lock back to the pool
+        try:
+            self._conn.invalidate()
+            self._conn.close()
+        except SQLAlchemyError:
+            pass
+        self._conn = None
+
+
+def leader_only(election: LeaderElection):
+    """Decorator for async scheduled jobs: run only on the replica holding the lock."""
+
+    def decorator(job):
+        @wraps(job)
+        async def wrapper(*args, **kwargs):
+            if not election.acquire():
+                logging.debug(f"Not the {election.name} leader, skipping {job.__name__}")
+                return None
+            return await job(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
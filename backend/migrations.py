@@ -0,0 +1,99 @@
+"""
+In-place migrations for databases created by older versions.
+
+create_all() never alters existing tables, so each migration checks the live
+schema and only runs when it still has the old shape.
+"""
+
+import logging
+
+from sqlalchemy import Boolean, inspect, text
+from sqlalchemy.schema import CreateColumn
+
+import backend.models  # noqa: F401  (registers tables on Base.metadata)
+from backend.db import Base, engine
+
+GUILD_CONFIG_TYPED_COLUMNS = [
+    "ALTER TABLE guild_configs ALTER COLUMN notifications_paused DROP DEFAULT",
+    """
+    ALTER TABLE guild_configs ALTER COLUMN notifications_paused TYPE boolean
+    USING coalesce(lower(trim(notifications_paused)) = 'true', false)
+    """,
+    "ALTER TABLE guild_configs ALTER COLUMN notifications_paused SET DEFAULT false",
+    "ALTER TABLE guild_configs ALTER COLUMN notifications_paused SET NOT NULL",
+]
+for _column in ("subscribed_platforms", "subscribed_themes"):
+    GUILD_CONFIG_TYPED_COLUMNS += [
+        f"ALTER TABLE guild_configs ALTER COLUMN {_column} DROP DEFAULT",
+        # 'all', '' and NULL used to mean "everything"; that is now an empty array.
+        f"""
+        ALTER TABLE guild_configs ALTER COLUMN {_column} TYPE text[]
+        USING CASE
+            WHEN {_column} IS NULL OR lower(trim({_column})) IN ('', 'all') THEN '{{}}'::text[]
+            ELSE array_remove(regexp_split_to_array(lower(trim({_column})), '\\s*,\\s*'), '')
+        END
+        """,
+        f"ALTER TABLE guild_configs ALTER COLUMN {_column} SET DEFAULT '{{}}'",
+        f"ALTER TABLE guild_configs ALTER COLUMN {_column} SET NOT NULL",
+    ]
+
+
+def migrate_guild_config_types(conn) -> bool:
+    """Convert guild_configs comma strings / 'true' strings into text[] and boolean columns."""
+    inspector = inspect(conn)
+    if not inspector.has_table("guild_configs"):
+        return False
+    columns = {column["name"]: column for column in inspector.get_columns("guild_configs")}
+    if isinstance(columns["notifications_paused"]["type"], Boolean):
+        return False
+
+    for statement in GUILD_CONFIG_TYPED_COLUMNS:
+        conn.execute(text(statement))
+    return True
+
+
+def add_missing_columns(conn) -> bool:
+    """Add nullable columns that were introduced after a table was created."""
+    inspector = inspect(conn)
+    applied = False
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing or not column.nullable:
+                continue
+            ddl = CreateColumn(column).compile(dialect=conn.dialect)
+            conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN IF NOT EXISTS {ddl}"))
+            applied = True
+    return applied
+
+
+def create_missing_indexes(conn) -> bool:
+    """Create indexes that were introduced after a table was created."""
+    inspector = inspect(conn)
+    applied = False
+    for table in Base.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(conn)
+                applied = True
+    return applied
+
+
+MIGRATIONS = [migrate_guild_config_types, add_missing_columns, create_missing_indexes]
+
+
+def run_migrations(bind=engine):
+    with bind.begin() as conn:
+        for migration in MIGRATIONS:
+            if migration(conn):
+                logging.info(f"Applied migration {migration.__name__}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    run_migrations()
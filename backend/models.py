@@ -1,15 +1,20 @@
 from sqlalchemy import (
     TIMESTAMP,
     BigInteger,
+    Boolean,
     Column,
     Date,
+    Float,
     Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
+    false,
     func,
+    text,
 )
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 
 from backend.db import Base
 
@@ -31,6 +36,22 @@ class HackathonDB(Base):
     prize_pool = Column(String, nullable=True)
     team_size = Column(String, nullable=True)
     eligibility = Column(String, nullable=True)
+    # Set when another source's listing of the same event was chosen as canonical
+    duplicate_of = Column(String, nullable=True)
+    # Filled in from the detail page after the row is stored (adapters.enrichment)
+    description = Column(Text, nullable=True)
+    detail_banner_url = Column(String, nullable=True)
+    detail_etag = Column(String, nullable=True)
+    detail_last_modified = Column(String, nullable=True)
+    enriched_at = Column(TIMESTAMP(timezone=True), nullable=True)
+    # Failed detail fetches since the last successful one, and when to try again
+    enrich_failures = Column(Integer, nullable=True)
+    enrich_retry_at = Column(TIMESTAMP(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("idx_hackathons_start_date_id", "start_date", "id"),
+        Index("idx_hackathons_duplicate_of", "duplicate_of"),
+    )
 
     def __repr__(self):
         return f"<Hackathon(title='{self.title}', start_date='{self.start_date}')>"
@@ -41,9 +62,26 @@ class GuildConfig(Base):
 
     guild_id = Column(String, primary_key=True, index=True)
     channel_id = Column(String, nullable=False)
-    subscribed_platforms = Column(String, default="all")
-    subscribed_themes = Column(String, default="all")
-    notifications_paused = Column(String, default="false")
+    # Lowercase platform names / themes; an empty array means "all"
+    subscribed_platforms = Column(ARRAY(Text), nullable=False, default=list, server_default="{}")
+    subscribed_themes = Column(ARRAY(Text), nullable=False, default=list, server_default="{}")
+    notifications_paused = Column(Boolean, nullable=False, default=False, server_default=false())
+
+    __table_args__ = (
+        Index("idx_guild_configs_platforms", "subscribed_platforms", postgresql_using="gin"),
+        Index("idx_guild_configs_themes", "subscribed_themes", postgresql_using="gin"),
+        Index(
+            "idx_guild_configs_active",
+            "guild_id",
+            postgresql_where=text("NOT notifications_paused"),
+        ),
+        # Guilds following every platform, which the GIN index cannot answer
+        Index(
+            "idx_guild_configs_all_platforms",
+            "guild_id",
+            postgresql_where=text("NOT notifications_paused AND subscribed_platforms = '{}'"),
+        ),
+    )
 
     def __repr__(self):
         return f"<GuildConfig(guild_id='{self.guild_id}', channel_id='{self.channel_id}')>"
@@ -64,3 +102,89 @@ class UserSubscription(Base):
 
     def __repr__(self):
         return f"<UserSubscription(user_id={self.user_id}, theme='{self.theme}')>"
+
+
+class HackathonChange(Base):
+    """Append-only, field-level change log of hackathons, ordered by seq."""
+
+    __tablename__ = "hackathon_changes"
+
+    seq = Column(BigInteger, primary_key=True, autoincrement=True)
+    hackathon_id = Column(String, nullable=False)
+    field = Column(String(50), nullable=False)
+    old_value = Column(Text, nullable=True)
+    new_value = Column(Text, nullable=True)
+    changed_at = Column(TIMESTAMP, server_default=func.now())
+
+    __table_args__ = (Index("idx_hackathon_changes_hackathon_id", "hackathon_id"),)
+
+    def __repr__(self):
+        return f"<HackathonChange(seq={self.seq}, hackathon_id='{self.hackathon_id}', field='{self.field}')>"
+
+
+class ChangeCursor(Base):
+    """Position of a change log consumer (e.g. a bot) in hackathon_changes."""
+
+    __tablename__ = "change_cursors"
+
+    consumer = Column(String, primary_key=True)
+    last_seq = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(TIMESTAMP, server_default=func.now())
+
+    def __repr__(self):
+        return f"<ChangeCursor(consumer='{self.consumer}', last_seq={self.last_seq})>"
+
+
+class SourceSchedule(Base):
+    """Adaptive polling state of one source (see backend/scheduling.py)."""
+
+    __tablename__ = "source_schedules"
+
+    source = Column(String, primary_key=True)
+    interval_seconds = Column(Integer, nullable=False)
+    # Moving average of new + changed hackathons per run
+    activity_rate = Column(Float, nullable=True)
+    next_run_at = Column(TIMESTAMP(timezone=True), nullable=True)
+    last_run_at = Column(TIMESTAMP(timezone=True), nullable=True)
+    last_duration_seconds = Column(Float, nullable=True)
+    last_activity = Column(Integer, nullable=True)
+    last_run_ok = Column(Boolean, nullable=True)
+
+    def __repr__(self):
+        return f"<SourceSchedule(source='{self.source}', interval_seconds={self.interval_seconds})>"
+
+
+class ScrapeRun(Base):
+    """One completed run of fetch_and_store, so restarts know when the last scrape happened."""
+
+    __tablename__ = "scrape_runs"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    started_at = Column(TIMESTAMP(timezone=True), nullable=False)
+    finished_at = Column(TIMESTAMP(timezone=True), nullable=False)
+    sources = Column(ARRAY(Text), nullable=False, default=list, server_default="{}")
+    new_hackathons = Column(Integer, nullable=False, default=0)
+    # False when any of the sources failed
+    ok = Column(Boolean, nullable=False)
+    # Per-source outcome and circuit breaker states, see fetch_and_store.run()
+    summary = Column(JSONB, nullable=True)
+
+    __table_args__ = (Index("idx_scrape_runs_finished_at", "finished_at"),)
+
+    def __repr__(self):
+        return f"<ScrapeRun(id={self.id}, finished_at='{self.finished_at}', ok={self.ok})>"
+
+
+class CircuitBreakerState(Base):
+    """Persisted circuit breaker of one upstream host (see adapters/http.py)."""
+
+    __tablename__ = "circuit_breakers"
+
+    host = Column(String, primary_key=True)
+    state = Column(String(20), nullable=False)
+    failures = Column(Integer, nullable=False, default=0)
+    opened_at = Column(TIMESTAMP(timezone=True), nullable=True)
+    updated_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self):
+        return f"<CircuitBreakerState(host='{self.host}', state='{self.state}')>"
@@ -0,0 +1,32 @@
+"""
+Text of the "updated" notices both bots send from the hackathon change log.
+"""
+
+from datetime import datetime
+from html import escape
+
+# Change log fields worth a notice; other tracked fields change without one
+NOTABLE_CHANGE_FIELDS = ("start_date", "end_date", "prize_pool", "status")
+
+
+def describe_change(change):
+    """One line describing a change log entry."""
+
+    def as_date(value):
+        return datetime.strptime(value, "%Y-%m-%d").date() if value else None
+
+    if change.field in ("start_date", "end_date"):
+        old, new = as_date(change.old_value), as_date(change.new_value)
+        old_text = old.strftime("%B %d, %Y") if old else "unknown"
+        new_text = new.strftime("%B %d, %Y") if new else "unknown"
+        if change.field == "start_date":
+            return f"📅 <b>Start date changed:</b> {old_text} → {new_text}"
+        if old and new and new > old:
+            return f"⏰ <b>Deadline extended:</b> {old_text} → {new_text}"
+        return f"⏰ <b>Deadline moved:</b> {old_text} → {new_text}"
+    if change.field == "prize_pool":
+        return f"🏆 <b>Prize updated:</b>\n{escape(change.new_value or 'See details')}"
+    return (
+        f"🔄 <b>{change.field.replace('_', ' ').capitalize()}:</b> "
+        f"{escape(change.old_value or '-')} → {escape(change.new_value or '-')}"
+    )
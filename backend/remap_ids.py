@@ -0,0 +1,111 @@
+"""
+One-off job moving hackathons to the stable ids of adapters.ids.
+
+Old Unstop, DoraHacks, Devfolio and MLH rows were keyed by sha256(title); every
+title edit left a stale copy behind. Rows that share a native key are merged into a
+single row under the new id, and the change log and duplicate links follow it.
+
+Run it once before (or right after) the first scrape with the new adapters:
+    python -m backend.remap_ids
+"""
+
+import logging
+
+from sqlalchemy import delete, func, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from adapters.ids import hackathon_id, native_key_from_url
+from backend.db import SessionLocal
+from backend.models import HackathonChange, HackathonDB
+
+REMAPPED_SOURCES = ("unstop", "dorahacks", "devfolio", "mlh")
+
+
+def plan_remap(db: Session) -> dict:
+    """
+    Group rows by their new id: {new_id: [old_id, ...]}, survivor first.
+
+    A row already stored under the new id survives; otherwise the row with the most
+    recent change log entry (the one the scraper kept updating) does.
+    """
+    rows = (
+        db.query(HackathonDB.id, HackathonDB.source, HackathonDB.url)
+        .filter(func.lower(HackathonDB.source).in_(REMAPPED_SOURCES))
+        .all()
+    )
+    last_change = dict(
+        db.query(HackathonChange.hackathon_id, func.max(HackathonChange.seq))
+        .group_by(HackathonChange.hackathon_id)
+        .all()
+    )
+
+    groups = {}
+    for row in rows:
+        native_key = native_key_from_url(row.source, row.url)
+        if native_key is None:
+            logging.warning(f"No native key in URL of hackathon {row.id} ({row.url}), skipping")
+            continue
+        groups.setdefault(hackathon_id(row.source.lower(), native_key), []).append(row.id)
+
+    plan = {}
+    for new_id, old_ids in groups.items():
+        if old_ids == [new_id]:
+            continue
+        old_ids.sort(key=lambda old_id: (old_id != new_id, -last_change.get(old_id, 0), old_id))
+        plan[new_id] = old_ids
+    return plan
+
+
+def remap_hackathon_ids(db: Session) -> dict:
+    """Apply plan_remap() in one transaction. Returns counts of remapped and merged rows."""
+    stats = {"remapped": 0, "merged": 0}
+    try:
+        for new_id, (survivor, *merged) in plan_remap(db).items():
+            old_ids = [survivor, *merged]
+            # Keep a cross-source link that only a stale copy carried
+            duplicate_of = (
+                db.query(HackathonDB.duplicate_of)
+                .filter(HackathonDB.id.in_(old_ids), HackathonDB.duplicate_of.isnot(None))
+                .order_by(HackathonDB.id != survivor)
+                .limit(1)
+                .scalar()
+            )
+            if merged:
+                db.execute(delete(HackathonDB).where(HackathonDB.id.in_(merged)))
+                stats["merged"] += len(merged)
+            db.execute(
+                update(HackathonDB)
+                .where(HackathonDB.id == survivor)
+                .values(id=new_id, duplicate_of=duplicate_of)
+            )
+            if survivor != new_id:
+                stats["remapped"] += 1
+            db.execute(
+                update(HackathonChange)
+                .where(HackathonChange.hackathon_id.in_(old_ids))
+                .values(hackathon_id=new_id)
+            )
+            db.execute(
+                update(HackathonDB)
+                .where(HackathonDB.duplicate_of.in_(old_ids))
+                .values(duplicate_of=new_id)
+            )
+        db.commit()
+    except SQLAlchemyError as e:
+        db.rollback()
+        logging.error(f"Database error in remap_hackathon_ids: {e}")
+        raise
+    return stats
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    db = SessionLocal()
+    try:
+        stats = remap_hackathon_ids(db)
+        logging.info(
+            f"Remapped {stats['remapped']} hackathons and merged {stats['merged']} stale copies."
+        )
+    finally:
+        db.close()
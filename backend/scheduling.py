@@ -0,0 +1,104 @@
+"""
+Adaptive polling interval per source.
+
+Every run of a source reports how many hackathons were new or changed ("activity")
+and how long the fetch took. The interval shrinks while a source keeps producing
+activity and grows while it is quiet, within SOURCE_INTERVAL_MIN/MAX. Slow sources
+get a higher floor, so one scrape never takes more than 1/SOURCE_COST_FACTOR of its
+own interval.
+"""
+
+import os
+from datetime import datetime, timedelta, timezone
+
+SOURCE_INTERVAL_MIN = int(os.getenv("SOURCE_INTERVAL_MIN", str(60 * 60)))
+SOURCE_INTERVAL_MAX = int(os.getenv("SOURCE_INTERVAL_MAX", str(24 * 60 * 60)))
+SOURCE_INTERVAL_DEFAULT = int(os.getenv("SOURCE_INTERVAL_DEFAULT", str(6 * 60 * 60)))
+SOURCE_COST_FACTOR = float(os.getenv("SOURCE_COST_FACTOR", "60"))
+# How often the bots check for due sources
+SCRAPE_TICK_MINUTES = float(os.getenv("SCRAPE_TICK_MINUTES", "15"))
+# Time budget of one scrape run; sources still running after it are reported as timed out
+SCRAPE_RUN_DEADLINE_SECONDS = float(os.getenv("SCRAPE_RUN_DEADLINE_SECONDS", "600"))
+# Random delay added to each tick, so replicas and restarts do not fire in lockstep
+SCRAPE_JITTER_SECONDS = int(os.getenv("SCRAPE_JITTER_SECONDS", "60"))
+# A tick missed by less than this (e.g. while the event loop was busy) still runs
+SCRAPE_MISFIRE_GRACE_SECONDS = int(os.getenv("SCRAPE_MISFIRE_GRACE_SECONDS", "300"))
+
+# Activity per run the interval is steered towards
+TARGET_ACTIVITY = 1.0
+# Weight of the latest run in the moving average of activity
+ACTIVITY_ALPHA = 0.3
+# Bounds of the per-run change of the interval
+MIN_STEP, MAX_STEP = 0.5, 1.5
+
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def update_activity_rate(rate: float | None, activity: int) -> float:
+    if rate is None:
+        return float(activity)
+    return ACTIVITY_ALPHA * activity + (1 - ACTIVITY_ALPHA) * rate
+
+
+def adapt_interval(
+    interval: float,
+    rate: float,
+    duration: float,
+    min_interval: float = SOURCE_INTERVAL_MIN,
+    max_interval: float = SOURCE_INTERVAL_MAX,
+) -> int:
+    """Next interval in seconds, from the current one, the activity rate and the fetch time."""
+    step = TARGET_ACTIVITY / rate if rate > 0 else MAX_STEP
+    interval *= min(MAX_STEP, max(MIN_STEP, step))
+    floor = max(min_interval, duration * SOURCE_COST_FACTOR)
+    return int(min(max_interval, max(floor, interval)))
+
+
+def next_schedule(schedule, activity: int, duration: float, ok: bool, now: datetime = None):
+    """
+    New (interval_seconds, activity_rate, next_run_at) after a run of a source.
+    schedule is the stored SourceSchedule, or None for a source that never ran.
+    A failed run keeps the interval and rate, and is retried after one interval.
+    """
+    now = now or utcnow()
+    interval = schedule.interval_seconds if schedule else SOURCE_INTERVAL_DEFAULT
+    rate = schedule.activity_rate if schedule else None
+    if ok:
+        rate = update_activity_rate(rate, activity)
+        interval = adapt_interval(interval, rate, duration)
+    return interval, rate, now + timedelta(seconds=interval)
+
+
+def is_due(schedule, now: datetime = None) -> bool:
+    return (
+        schedule is None
+        or schedule.next_run_at is None
+        or schedule.next_run_at <= (now or utcnow())
+    )
+
+
+def first_tick_at(last_success: datetime | None, now: datetime = None) -> datetime:
+    """
+    When the first scrape after a (re)start should run: one tick after the last
+    successful run, or right away if that is already overdue (or never happened).
+    """
+    now = now or utcnow()
+    if last_success is None:
+        return now
+    return max(now, last_success + timedelta(minutes=SCRAPE_TICK_MINUTES))
+
+
+def scrape_job_options(last_success: datetime | None) -> dict:
+    """APScheduler add_job() options for the bots' scrape tick."""
+    return {
+        "trigger": "interval",
+        "minutes": SCRAPE_TICK_MINUTES,
+        "next_run_time": first_tick_at(last_success),
+        "jitter": SCRAPE_JITTER_SECONDS,
+        "misfire_grace_time": SCRAPE_MISFIRE_GRACE_SECONDS,
+        # Ticks missed while a long scrape was running collapse into one
+        "coalesce": True,
+        "max_instances": 1,
+    }
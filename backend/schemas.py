@@ -1,7 +1,7 @@
 from datetime import date
-from typing import List
+from typing import Annotated, Any, List
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError, field_validator
 
 
 class Hackathon(BaseModel):
@@ -28,3 +28,37 @@ class Hackathon(BaseModel):
         return v
 
     model_config = {"from_attributes": True}
+
+
+# Built once: creating the validator is far more expensive than running it. A row
+# that is not a valid Hackathon is passed through as is instead of failing the list.
+_hackathon_rows = TypeAdapter(list[Annotated[Hackathon | Any, Field(union_mode="left_to_right")]])
+
+
+def validate_hackathons(
+    rows: list[dict],
+) -> tuple[list[Hackathon], list[tuple[int, ValidationError]]]:
+    """
+    Validate many rows in one call. Invalid rows do not abort the batch: they are
+    returned as (index in rows, ValidationError) next to the valid Hackathons, which
+    keep their order.
+    """
+    hackathons, errors = [], []
+    for index, result in enumerate(_hackathon_rows.validate_python(rows)):
+        if isinstance(result, Hackathon):
+            hackathons.append(result)
+            continue
+        try:
+            Hackathon.model_validate(result)  # only to get this row's errors
+        except ValidationError as error:
+            errors.append((index, error))
+    return hackathons, errors
+
+
+def construct_hackathons(rows: list[dict]) -> list[Hackathon]:
+    """
+    Build Hackathons without validation, for rows whose fields already have the
+    right types (date objects, tags as a list of strings). Missing optional fields
+    get their defaults; nothing else is checked.
+    """
+    return [Hackathon.model_construct(**row) for row in rows]
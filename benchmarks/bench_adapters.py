@@ -0,0 +1,90 @@
+"""
+Adapter benchmark: parse throughput and memory of each adapter, offline.
+
+Every adapter with a fixture in tests/fixtures (named after the source, e.g.
+devpost.json.gz) is run against its replayed responses, so only fetching from
+memory, parsing and validation are measured. Reported per source: hackathons per
+second over --repeat runs, and from one run under tracemalloc the peak of traced
+memory plus the number of memory blocks still allocated afterwards.
+
+    python -m benchmarks.bench_adapters --repeat 20
+    python -m benchmarks.bench_adapters --source Devpost --source MLH
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import os
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+
+# Adapters import backend.schemas, which must not need a real database
+os.environ.setdefault("DATABASE_URL", "postgresql://localhost/hackradar")
+# Kaggle needs some credentials to send requests, and must not answer from its cache
+os.environ.setdefault("KAGGLE_API_TOKEN", "replay")
+os.environ.setdefault("KAGGLE_CACHE_SECONDS", "0")
+
+from adapters import http, load_adapter, registered_sources
+from adapters.replay import Replayer, load_fixture
+
+FIXTURES = Path(__file__).resolve().parents[1] / "tests" / "fixtures"
+
+
+def fixture_path(source: str) -> Path:
+    return FIXTURES / f"{source.lower()}.json.gz"
+
+
+def run_once(fetch, exchanges) -> int:
+    # Progress prints of the adapters would dominate the timings
+    with http.use_transport(Replayer(exchanges)), contextlib.redirect_stdout(io.StringIO()):
+        return len(fetch())
+
+
+def measure(source: str, repeat: int):
+    fetch = load_adapter(registered_sources()[source])
+    if source == "MLH":
+        from adapters import mlh
+
+        # The fixture holds the 2030 and 2031 seasons, not today's
+        mlh.mlh_seasons = lambda today=None: [2030, 2031]
+    exchanges = load_fixture(fixture_path(source))
+    run_once(fetch, exchanges)  # warm up imports and caches
+
+    rates = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        count = run_once(fetch, exchanges)
+        rates.append(count / (time.perf_counter() - started))
+
+    gc.collect()
+    tracemalloc.start()
+    blocks_before = len(tracemalloc.take_snapshot().traces)
+    run_once(fetch, exchanges)
+    _, peak = tracemalloc.get_traced_memory()
+    gc.collect()
+    retained = len(tracemalloc.take_snapshot().traces) - blocks_before
+    tracemalloc.stop()
+
+    print(
+        f"{source:<12} {count:>5} items  median {statistics.median(rates):>9.0f} items/s  "
+        f"best {max(rates):>9.0f} items/s  peak {peak / 1024:>8.1f} KiB  "
+        f"retained blocks {retained:>6}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--source", action="append", help="only these sources (repeatable)")
+    args = parser.parse_args()
+
+    sources = args.source or [s for s in registered_sources() if fixture_path(s).exists()]
+    for source in sources:
+        measure(source, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Ingestion benchmark: per-row commits (previous behaviour) vs one transaction per
+source with per-row savepoints, optionally with synchronous_commit=off.
+
+Writes rows with ids prefixed "bench-" to the database at DATABASE_URL and deletes
+them afterwards.
+
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_ingest --rows 500
+"""
+
+import argparse
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import event
+
+import fetch_and_store
+from backend.crud import upsert_hackathon
+from backend.db import SessionLocal, engine
+from backend.init_db import create_all_tables
+from backend.models import HackathonDB
+from backend.schemas import Hackathon
+
+
+def make_hackathons(prefix: str, rows: int) -> list[Hackathon]:
+    today = date.today()
+    return [
+        Hackathon(
+            id=f"bench-{prefix}-{i}",
+            title=f"Benchmark Hackathon {i}",
+            start_date=today + timedelta(days=i % 60),
+            end_date=today + timedelta(days=i % 60 + 2),
+            location="Everywhere",
+            url=f"https://example.com/bench/{i}",
+            mode="Online",
+            status="Open",
+            source="bench",
+            tags=["ai", "web3"],
+            prize_pool="See details",
+        )
+        for i in range(rows)
+    ]
+
+
+def per_row_commits(hackathons):
+    db = SessionLocal()
+    try:
+        for h in hackathons:
+            upsert_hackathon(db, h)
+    finally:
+        db.close()
+
+
+def single_transaction(hackathons, synchronous_commit="on"):
+    fetch_and_store.INGEST_SYNCHRONOUS_COMMIT = synchronous_commit
+    fetch_and_store.process_source("bench", lambda: hackathons)
+
+
+def measure(label, func, *args):
+    commits = []
+    listener = lambda _conn: commits.append(True)  # noqa: E731
+    event.listen(engine, "commit", listener)
+    started = time.perf_counter()
+    try:
+        func(*args)
+    finally:
+        elapsed = time.perf_counter() - started
+        event.remove(engine, "commit", listener)
+    print(f"{label:<52} commits={len(commits):>5}  elapsed={elapsed * 1000:>9.1f} ms")
+
+
+def cleanup():
+    db = SessionLocal()
+    try:
+        db.query(HackathonDB).filter(HackathonDB.id.like("bench-%")).delete(
+            synchronize_session=False
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=500)
+    args = parser.parse_args()
+
+    create_all_tables()
+    cleanup()
+    original = fetch_and_store.INGEST_SYNCHRONOUS_COMMIT
+    try:
+        cases = [
+            ("per-row commits", "legacy", per_row_commits, ()),
+            ("single transaction + savepoints", "txn", single_transaction, ()),
+            ("single transaction, sync commit off", "async", single_transaction, ("off",)),
+        ]
+        for label, prefix, func, extra in cases:
+            hackathons = make_hackathons(prefix, args.rows)
+            measure(f"{label} (insert {args.rows})", func, hackathons, *extra)
+            measure(f"{label} (update {args.rows})", func, hackathons, *extra)
+    finally:
+        fetch_and_store.INGEST_SYNCHRONOUS_COMMIT = original
+        cleanup()
+
+
+if __name__ == "__main__":
+    main()
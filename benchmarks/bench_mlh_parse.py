@@ -0,0 +1,78 @@
+"""
+MLH season page parsing benchmark: the full html.parser tree (the previous
+behaviour) against a tree of only the div.event cards, with html.parser and lxml.
+
+Uses the replay fixture's season page; --copies repeats its event cards to get
+closer to the size of a real season page.
+
+    python -m benchmarks.bench_mlh_parse --copies 5 --repeat 20
+"""
+
+import argparse
+import os
+import statistics
+import time
+from pathlib import Path
+
+os.environ.setdefault("DATABASE_URL", "postgresql://localhost/hackradar")
+
+from bs4 import BeautifulSoup
+
+from adapters import mlh
+from adapters.replay import decode_body, load_fixture
+
+FIXTURE = Path(__file__).resolve().parents[1] / "tests" / "fixtures" / "mlh.json.gz"
+
+
+def season_page(copies: int) -> str:
+    html = decode_body(load_fixture(FIXTURE)[0]).decode("utf-8")
+    head, _, rest = html.partition('<div class="event"')
+    cards, _, tail = rest.rpartition("</div></div></body>")
+    return head + ('<div class="event"' + cards) * copies + "</div></div></body>" + tail
+
+
+def full_parse(html):
+    return BeautifulSoup(html, "html.parser").find_all("div", class_="event")
+
+
+def strained(parser):
+    def parse(html):
+        soup = BeautifulSoup(html, parser, parse_only=mlh.EVENT_STRAINER)
+        return soup.find_all("div", class_="event")
+
+    return parse
+
+
+def measure(label, find_events, html, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        events = [mlh.parse_event(event) for event in find_events(html)]
+        timings.append(time.perf_counter() - started)
+    median = statistics.median(timings)
+    print(
+        f"{label:<28} {len(events):>5} events  median {median * 1000:>8.2f} ms  "
+        f"{len(events) / median:>9.0f} events/s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--copies", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    html = season_page(args.copies)
+    print(f"season page: {len(html) / 1024:.0f} KiB")
+    measure("full tree, html.parser", full_parse, html, args.repeat)
+    measure("div.event only, html.parser", strained("html.parser"), html, args.repeat)
+    try:
+        import lxml  # noqa: F401
+    except ImportError:
+        print("lxml is not installed, skipping the lxml fast path")
+    else:
+        measure("div.event only, lxml", strained("lxml"), html, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Parse pool benchmark: MLH and Devpost scraped side by side in threads (as in
+fetch_and_store.run), parsing in those threads vs in a pool of worker processes.
+
+Responses are replayed from synthetic payloads scaled by --events, so only parsing,
+validation and the cost of shipping payloads and rows between processes are
+measured. A speed-up needs more than one core.
+
+    python -m benchmarks.bench_parse_pool --events 2000 --processes 0 2 4
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import os
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+os.environ.setdefault("DATABASE_URL", "postgresql://localhost/hackradar")
+
+from adapters import http, mlh, parsing
+from adapters.devpost import fetch_devpost_hackathons
+from adapters.mlh import scrape_mlh_events
+from adapters.replay import Replayer
+
+SYNTHETIC = Path(__file__).resolve().parents[1] / "tests" / "fixtures" / "synthetic.py"
+
+
+def load_synthetic():
+    spec = importlib.util.spec_from_file_location("synthetic", SYNTHETIC)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def scrape_both(exchanges) -> int:
+    with (
+        http.use_transport(Replayer(exchanges)),
+        contextlib.redirect_stdout(io.StringIO()),
+        ThreadPoolExecutor(max_workers=2) as executor,
+    ):
+        futures = [
+            http.submit(executor, fetch) for fetch in (scrape_mlh_events, fetch_devpost_hackathons)
+        ]
+        return sum(len(future.result()) for future in futures)
+
+
+def measure(processes: int, exchanges, repeat: int):
+    parsing.PARSE_PROCESSES = processes
+    parsing._pool = None
+    scrape_both(exchanges)  # starts the pool and warms up imports in the workers
+
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        count = scrape_both(exchanges)
+        timings.append(time.perf_counter() - started)
+    if parsing._pool is not None:
+        parsing._pool.shutdown()
+
+    median = statistics.median(timings)
+    label = f"{processes} processes" if processes else "in threads"
+    print(
+        f"{label:<14} {count:>6} hackathons  median {median * 1000:>8.1f} ms  "
+        f"{count / median:>8.0f} hackathons/s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=1000, help="events per source")
+    parser.add_argument("--processes", type=int, nargs="+", default=[0, os.cpu_count() or 1])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    synthetic = load_synthetic()
+    # The synthetic MLH payloads are the 2030 and 2031 seasons, not today's
+    mlh.mlh_seasons = lambda today=None: [2030, 2031]
+    exchanges = [
+        *synthetic.mlh(count=args.events, previous_only=0, overlap=0),
+        *synthetic.devpost(pages=3, per_page=-(-args.events // 3)),
+    ]
+    print(f"{os.cpu_count()} CPUs, {args.events} events per source")
+    for processes in args.processes:
+        measure(processes, exchanges, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Hackathon construction benchmark: one Hackathon(...) per row inside try/except (how
+the adapters used to build them) vs batch validation with validate_hackathons() vs
+trusted construction with construct_hackathons().
+
+    python -m benchmarks.bench_schemas --rows 10000 --invalid 0.01
+"""
+
+import argparse
+import os
+import statistics
+import time
+from datetime import date, timedelta
+
+os.environ.setdefault("DATABASE_URL", "postgresql://localhost/hackradar")
+
+from pydantic import ValidationError
+
+from backend.schemas import Hackathon, construct_hackathons, validate_hackathons
+
+
+def make_rows(count: int, invalid: float, normalized: bool) -> list[dict]:
+    first = date(2031, 1, 1)
+    every = int(1 / invalid) if invalid else 0
+    rows = []
+    for i in range(count):
+        start = first + timedelta(days=i % 365)
+        rows.append(
+            {
+                "id": f"bench-{i}",
+                "title": None if every and i % every == every - 1 else f"Benchmark Hackathon {i}",
+                "start_date": start if normalized else start.isoformat(),
+                "end_date": start + timedelta(days=2) if normalized else f"{start}",
+                "location": "Everywhere",
+                "url": f"https://example.com/bench/{i}",
+                "mode": "Online",
+                "status": "Open",
+                "source": "bench",
+                "tags": ["ai", "web3"] if normalized else "AI, Web3",
+                "banner_url": None,
+                "prize_pool": "See details",
+                "team_size": "1-4 members",
+                "eligibility": "Open to all",
+            }
+        )
+    return rows
+
+
+def one_by_one(rows):
+    hackathons = []
+    for row in rows:
+        try:
+            hackathons.append(Hackathon(**row))
+        except ValidationError:
+            pass
+    return hackathons
+
+
+def batch(rows):
+    return validate_hackathons(rows)[0]
+
+
+def measure(label, build, rows, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        count = len(build(rows))
+        timings.append(time.perf_counter() - started)
+    median = statistics.median(timings)
+    print(
+        f"{label:<32} {count:>6} rows  median {median * 1000:>8.1f} ms  {count / median:>9.0f} rows/s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--invalid", type=float, default=0.01, help="share of invalid rows")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    raw = make_rows(args.rows, args.invalid, normalized=False)
+    normalized = make_rows(args.rows, 0, normalized=True)
+    measure("Hackathon(**row) per row", one_by_one, raw, args.repeat)
+    measure("validate_hackathons()", batch, raw, args.repeat)
+    measure("validate_hackathons(), normalized", batch, normalized, args.repeat)
+    measure("construct_hackathons(), trusted", construct_hackathons, normalized, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Startup benchmark: import cost of both bot entry points, measured with -X importtime.
+
+Each bot module is loaded in a fresh interpreter (main() is not run) and the
+importtime report is summarised: total import time, the slowest top-level imports,
+and whether any scraping adapter got imported. No database connection is made.
+
+    python -m benchmarks.bench_startup --repeat 5 --top 10
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+from adapters import SOURCES
+
+ROOT = Path(__file__).resolve().parents[1]
+ENTRY_POINTS = ("telegram-bot.py", "telegram-channel-bot.py")
+
+LOAD_SNIPPET = (
+    "import importlib.util, sys;"
+    "spec = importlib.util.spec_from_file_location('bot', sys.argv[1]);"
+    "spec.loader.exec_module(importlib.util.module_from_spec(spec))"
+)
+
+
+def import_times(script: Path) -> list[tuple[int, int, str]]:
+    """Run one cold import of script; returns (self_us, cumulative_us, module) per import."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", LOAD_SNIPPET, str(script)],
+        cwd=ROOT,
+        # Importing must not connect, so any well-formed URL will do
+        env={
+            "DATABASE_URL": "postgresql://localhost/hackradar",
+            **os.environ,
+            "PYTHONDONTWRITEBYTECODE": "1",
+        },
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:") :].split("|")
+        rows.append((int(self_us), int(cumulative_us), module.rstrip()))
+    return rows
+
+
+def summarise(script: Path, repeat: int, top: int):
+    totals = []
+    for _ in range(repeat):
+        rows = import_times(script)
+        totals.append(sum(self_us for self_us, _, _ in rows))
+
+    # Top-level imports are the ones without indentation under another import
+    top_level = sorted(
+        (row for row in rows if not row[2].startswith("  ")), key=lambda row: -row[1]
+    )
+    adapter_modules = {target.partition(":")[0] for target in SOURCES.values()}
+    adapters = sorted({module.strip() for _, _, module in rows} & adapter_modules)
+
+    print(f"{script.name}")
+    print(
+        f"  total import time: median {statistics.median(totals) / 1000:.1f} ms, "
+        f"min {min(totals) / 1000:.1f} ms over {repeat} runs"
+    )
+    print(f"  modules imported: {len(rows)}")
+    print(f"  adapters imported: {', '.join(adapters) or 'none'}")
+    print("  slowest top-level imports (cumulative):")
+    for _, cumulative_us, module in top_level[:top]:
+        print(f"    {cumulative_us / 1000:8.1f} ms  {module.strip()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    for name in ENTRY_POINTS:
+        summarise(ROOT / name, args.repeat, args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,66 +1,182 @@
+import argparse
 import logging
+import os
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from datetime import datetime, timedelta, timezone
 
+from sqlalchemy import text
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
 
-from adapters.devfolio import fetch_devfolio_hackathons
-from adapters.devpost import fetch_devpost_hackathons
-from adapters.dorahacks import fetch_dorahacks_hackathons
-from adapters.hack2skill import fetch_hack2skill_hackathons
-from adapters.mlh import scrape_mlh_events
-from adapters.unstop import fetch_unstop_hackathons
-from backend.crud import upsert_hackathon
-from backend.db import Base, SessionLocal, engine
-
-Base.metadata.create_all(bind=engine)
+from adapters import (
+    SOURCE_HOSTS,
+    SourceNotConfiguredError,
+    archive,
+    enrichment,
+    http,
+    lazy_fetcher,
+    registered_sources,
+)
+from backend.cache import query_cache
+from backend.crud import (
+    add_scrape_run,
+    append_hackathon_changes,
+    get_circuit_breakers,
+    get_dedup_candidates,
+    get_enrichment_candidates,
+    get_last_successful_scrape,
+    get_source_schedules,
+    mark_duplicates,
+    save_circuit_breakers,
+    save_enrichments,
+    save_source_schedule,
+    upsert_hackathon,
+)
+from backend.db import SessionLocal
+from backend.dedup import DedupRecord, choose_canonical, find_duplicate_clusters
+from backend.init_db import create_all_tables
+from backend.scheduling import SCRAPE_RUN_DEADLINE_SECONDS, is_due, next_schedule, utcnow
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 
+# Outcome of the latest run() in this process, see run()
+last_run_summary = {}
+
+# Detail pages fetched after each run (adapters.enrichment); "off" skips enrichment.
+ENRICHMENT = os.getenv("ENRICHMENT", "on").lower()
+ENRICH_BATCH = int(os.getenv("ENRICH_BATCH", "200"))
+ENRICH_REFRESH_SECONDS = int(os.getenv("ENRICH_REFRESH_SECONDS", str(7 * 24 * 60 * 60)))
+# A failed detail page is retried after this long, doubling per failure up to the refresh
+ENRICH_RETRY_SECONDS = int(os.getenv("ENRICH_RETRY_SECONDS", str(60 * 60)))
+
+_enrichment_thread = None
+_enrichment_lock = threading.Lock()
 
-def process_source(source_name, fetch_func):
-    """Process a single source with its own database session. Returns list of newly added hackathons."""
+# "off" trades durability of the last committed run for fewer WAL flushes during ingestion.
+INGEST_SYNCHRONOUS_COMMIT = os.getenv("INGEST_SYNCHRONOUS_COMMIT", "on").lower()
+
+
+def process_source(
+    source_name,
+    fetch_func,
+    stats: dict = None,
+    deadline: http.Deadline = None,
+    record_changes: bool = True,
+):
+    """
+    Process a single source with its own database session. Returns list of newly added hackathons.
+
+    All rows of a source are written in one transaction with a SAVEPOINT per row, so a bad
+    row is skipped without losing the others and a failed source leaves no partial writes.
+    If a `stats` dict is passed, it receives status, ok, new, activity (new + changed
+    hackathons) and duration (seconds spent fetching) for the scheduler and run summary.
+    With a `deadline`, adapter requests stop once it passes and nothing is committed after
+    it; the source then ends with status "timed_out". An adapter raising
+    SourceNotConfiguredError (e.g. Kaggle without credentials) ends with "not_configured".
+    With record_changes=False field changes are not appended to the change log, so the
+    bots send no "updated" notices for them.
+    """
+    if stats is not None:
+        stats.update(status="failed", ok=False, new=0, activity=0, duration=0.0)
     max_retries = 3
     retry_delay = 1
     new_hackathons = []
 
     for attempt in range(max_retries):
+        new_hackathons = []
         db = SessionLocal()
         try:
             logging.info(f"Started fetching from {source_name}.")
-            hackathons = fetch_func()
+            started = time.monotonic()
+            with http.deadline_scope(deadline), archive.recording(source_name):
+                hackathons = fetch_func()
+            duration = time.monotonic() - started
+            if deadline is not None:
+                # Adapters return what they got so far when a request is cancelled
+                deadline.check()
             logging.info(f"Fetched {len(hackathons)} hackathons from {source_name}.")
 
+            if INGEST_SYNCHRONOUS_COMMIT == "off":
+                # Skip waiting for the WAL flush; a crash can lose the last run, never corrupt it.
+                db.execute(text("SET LOCAL synchronous_commit TO OFF"))
+
+            changes = []
             for h in hackathons:
                 try:
                     logging.debug(f"Upserting hackathon: {h}")
-                    db_obj, is_new = upsert_hackathon(db, h)
+                    row_changes = []
+                    with db.begin_nested():
+                        db_obj, is_new = upsert_hackathon(db, h, commit=False, changes=row_changes)
+                    changes.extend(row_changes)
                     if is_new:
                         new_hackathons.append(h)
                 except (SQLAlchemyError, OperationalError) as e:
                     logging.error(f"Database error upserting hackathon from {source_name}: {e}")
-                    db.rollback()
                     continue
                 except Exception as e:
                     logging.error(f"Unexpected error upserting hackathon from {source_name}: {e}")
-                    db.rollback()
                     continue
 
+            # Written last so the change log lock is only held briefly before commit.
+            if record_changes:
+                append_hackathon_changes(db, changes)
+            # Once the run has given up on this source, its results would never be announced
+            with deadline.shielded() if deadline is not None else nullcontext():
+                db.commit()
+                if stats is not None:
+                    changed = {change["hackathon_id"] for change in changes}
+                    stats.update(
+                        status="ok",
+                        ok=True,
+                        new=len(new_hackathons),
+                        activity=len(new_hackathons) + len(changed),
+                        duration=duration,
+                    )
+            # Cached discovery results may now be stale.
+            query_cache.bump_generation()
             logging.info(
-                f"Completed upserting hackathons from {source_name}. {len(new_hackathons)} new hackathons added."
+                f"Completed upserting hackathons from {source_name}. {len(new_hackathons)} new hackathons added, "
+                f"{len(changes)} field changes recorded."
             )
             break  # Success, exit retry loop
 
+        except http.RunCancelledError:
+            new_hackathons = []
+            db.rollback()
+            if stats is not None:
+                stats["status"] = "timed_out"
+            logging.warning(f"Gave up on {source_name}: the run deadline passed.")
+            break
+
+        except SourceNotConfiguredError as e:
+            new_hackathons = []
+            db.rollback()
+            if stats is not None:
+                stats["status"] = "not_configured"
+            logging.warning(f"Skipping {source_name}: {e}")
+            break
+
         except (SQLAlchemyError, OperationalError) as e:
+            new_hackathons = []
+            db.rollback()
             logging.error(
                 f"Database error fetching from {source_name} (attempt {attempt + 1}/{max_retries}): {e}"
             )
+            if deadline is not None and deadline.remaining() <= retry_delay:
+                if stats is not None:
+                    stats["status"] = "timed_out"
+                logging.warning(f"No time left in the run to retry {source_name}.")
+                break
             if attempt < max_retries - 1:
                 time.sleep(retry_delay)
                 retry_delay *= 2  # Exponential backoff
             else:
                 logging.error(f"Failed to process {source_name} after {max_retries} attempts")
         except Exception as e:
+            new_hackathons = []
+            db.rollback()
             logging.error(f"Error fetching from {source_name}: {e}")
             break  # Don't retry for non-database errors
         finally:
@@ -69,40 +185,457 @@ def process_source(source_name, fetch_func):
     return new_hackathons
 
 
-def run():
+def deduplicate(new_hackathons):
+    """
+    Link new hackathons to listings of the same event from other sources.
+
+    Each cluster keeps one canonical row (an already stored listing wins); the others get
+    duplicate_of set. Returns the new hackathons that should still be announced.
+    """
+    if not new_hackathons:
+        return new_hackathons
+
+    new_ids = {h.id for h in new_hackathons}
+    db = SessionLocal()
+    try:
+        candidates = get_dedup_candidates(
+            db,
+            min(h.start_date for h in new_hackathons),
+            max(h.end_date for h in new_hackathons),
+        )
+        records = [
+            DedupRecord(h.id, h.title, h.source, h.url, h.start_date, h.end_date, stored=True)
+            for h in candidates
+            if h.id not in new_ids
+        ]
+        records += [
+            DedupRecord(h.id, h.title, h.source, h.url, h.start_date, h.end_date)
+            for h in new_hackathons
+        ]
+
+        duplicate_ids = set()
+        for cluster in find_duplicate_clusters(records):
+            canonical = choose_canonical(cluster)
+            duplicates = [record.id for record in cluster if record.id != canonical.id]
+            mark_duplicates(db, canonical.id, duplicates, commit=False)
+            duplicate_ids.update(duplicates)
+        if not duplicate_ids:
+            return new_hackathons
+
+        db.commit()
+        query_cache.bump_generation()
+        logging.info(f"Linked {len(duplicate_ids)} hackathons to listings from other sources.")
+        return [h for h in new_hackathons if h.id not in duplicate_ids]
+    except SQLAlchemyError as e:
+        db.rollback()
+        # Announcing an event twice beats not announcing it
+        logging.error(f"Database error during deduplication: {e}")
+        return new_hackathons
+    finally:
+        db.close()
+
+
+def due_sources(names):
+    """Names of the sources whose adaptive interval has elapsed (all of them if unknown)."""
+    db = SessionLocal()
+    try:
+        schedules = get_source_schedules(db)
+        return [name for name in names if is_due(schedules.get(name))]
+    except SQLAlchemyError as e:
+        db.rollback()
+        logging.error(f"Database error reading source schedules: {e}")
+        return list(names)
+    finally:
+        db.close()
+
+
+def update_source_schedules(stats_by_source):
+    """Adapt and persist each source's polling interval after a run."""
+    db = SessionLocal()
+    try:
+        schedules = get_source_schedules(db)
+        now = utcnow()
+        for name, stats in stats_by_source.items():
+            interval, rate, next_run_at = next_schedule(
+                schedules.get(name), stats["activity"], stats["duration"], stats["ok"], now
+            )
+            save_source_schedule(
+                db,
+                name,
+                interval_seconds=interval,
+                activity_rate=rate,
+                next_run_at=next_run_at,
+                last_run_at=now,
+                last_duration_seconds=stats["duration"],
+                last_activity=stats["activity"],
+                last_run_ok=stats["ok"],
+            )
+            logging.info(
+                f"{name}: activity {stats['activity']}, next run in {interval / 3600:.1f}h."
+            )
+    except SQLAlchemyError as e:
+        db.rollback()
+        logging.error(f"Database error saving source schedules: {e}")
+    finally:
+        db.close()
+
+
+def load_circuit_breakers():
+    """Restore the persisted breaker of every host, so a fresh process skips failing hosts."""
+    db = SessionLocal()
+    try:
+        http.restore_breakers(
+            {
+                host: {
+                    "state": row.state,
+                    "failures": row.failures,
+                    "opened_at": row.opened_at.timestamp() if row.opened_at else None,
+                }
+                for host, row in get_circuit_breakers(db).items()
+            }
+        )
+    except SQLAlchemyError as e:
+        db.rollback()
+        logging.error(f"Database error loading circuit breakers: {e}")
+    finally:
+        db.close()
+
+
+def store_circuit_breakers(breakers):
+    db = SessionLocal()
+    try:
+        save_circuit_breakers(
+            db,
+            [
+                {
+                    "host": host,
+                    "state": breaker["state"],
+                    "failures": breaker["failures"],
+                    "opened_at": datetime.fromtimestamp(breaker["opened_at"], timezone.utc)
+                    if breaker["opened_at"]
+                    else None,
+                }
+                for host, breaker in breakers.items()
+            ],
+        )
+    except SQLAlchemyError as e:
+        logging.error(f"Database error saving circuit breakers: {e}")
+    finally:
+        db.close()
+
+
+def record_scrape_run(summary):
+    db = SessionLocal()
+    try:
+        add_scrape_run(
+            db,
+            started_at=summary["started_at"],
+            finished_at=summary["finished_at"],
+            sources=list(summary["sources"]),
+            new_hackathons=summary["new_hackathons"],
+            ok=all(stats["ok"] for stats in summary["sources"].values()),
+            summary={
+                "sources": summary["sources"],
+                "breakers": {host: b["state"] for host, b in summary["breakers"].items()},
+            },
+        )
+    except SQLAlchemyError as e:
+        logging.error(f"Database error recording scrape run: {e}")
+    finally:
+        db.close()
+
+
+def last_successful_scrape():
+    """Finish time of the latest fully successful run, or None (also on database errors)."""
+    db = SessionLocal()
+    try:
+        return get_last_successful_scrape(db)
+    except SQLAlchemyError as e:
+        logging.error(f"Database error reading scrape runs: {e}")
+        return None
+    finally:
+        db.close()
+
+
+def enrich_pending(limit: int = ENRICH_BATCH) -> int:
+    """
+    Fetch the detail pages of up to limit hackathons not enriched within
+    ENRICH_REFRESH_SECONDS and store their banner and description.
+    A page that fails is retried with exponential backoff (see ENRICH_RETRY_SECONDS),
+    so failing pages do not take the head of every pass.
+    Returns the number of hackathons updated.
+    """
+    db = SessionLocal()
+    try:
+        stale_before = utcnow() - timedelta(seconds=ENRICH_REFRESH_SECONDS)
+        pages = [
+            enrichment.DetailPage(*row)
+            for row in get_enrichment_candidates(db, stale_before, limit)
+        ]
+    except SQLAlchemyError as e:
+        logging.error(f"Database error reading hackathons to enrich: {e}")
+        return 0
+    finally:
+        db.close()
+
+    results = enrichment.enrich(pages)
+    failures = {page.hackathon_id: page.failures or 0 for page in pages}
+    now = utcnow()
+    rows = []
+    failed = 0
+    for hackathon_id, details in results.items():
+        if details is None:
+            failed += 1
+            count = failures[hackathon_id] + 1
+            backoff = min(ENRICH_RETRY_SECONDS * 2 ** (count - 1), ENRICH_REFRESH_SECONDS)
+            rows.append(
+                {
+                    "id": hackathon_id,
+                    "enrich_failures": count,
+                    "enrich_retry_at": now + timedelta(seconds=backoff),
+                }
+            )
+            continue
+        row = {
+            "id": hackathon_id,
+            "enriched_at": now,
+            "detail_etag": details["etag"],
+            "detail_last_modified": details["last_modified"],
+            "enrich_failures": None,
+            "enrich_retry_at": None,
+        }
+        if "description" in details:
+            # Only a page that changed has new details
+            row.update(description=details["description"], detail_banner_url=details["banner_url"])
+        rows.append(row)
+
+    db = SessionLocal()
+    try:
+        save_enrichments(db, rows)
+    except SQLAlchemyError:
+        return 0
+    finally:
+        db.close()
+    enriched = len(rows) - failed
+    if enriched:
+        query_cache.bump_generation()
+    logging.info(
+        f"Enriched {enriched} of {len(pages)} hackathons from their detail pages, {failed} failed."
+    )
+    return enriched
+
+
+def start_enrichment():
+    """
+    Run enrich_pending() in a background thread, unless ENRICHMENT is off or a pass is
+    still running. Returns the thread, or None.
+    """
+    global _enrichment_thread
+    if ENRICHMENT == "off":
+        return None
+    with _enrichment_lock:
+        if _enrichment_thread is not None and _enrichment_thread.is_alive():
+            return None
+        _enrichment_thread = threading.Thread(target=enrich_pending, name="enrichment", daemon=True)
+        _enrichment_thread.start()
+        return _enrichment_thread
+
+
+def run_sources(sources, stats_by_source, deadline: http.Deadline):
+    """
+    Scrape sources concurrently until they are done or the deadline passes, and return
+    the new hackathons of every source that committed in time. Sources still running
+    then are cancelled, get status "timed_out", and are not waited for.
+    """
+    executor = ThreadPoolExecutor(max_workers=len(sources))
+    # Adapters are imported by their own worker, only when the source runs
+    future_to_source = {
+        executor.submit(
+            process_source, name, lazy_fetcher(target), stats_by_source[name], deadline
+        ): name
+        for name, target in sources.items()
+    }
+    done, not_done = wait(future_to_source, timeout=deadline.remaining())
+    # After cancel() returns no late source can commit any more
+    deadline.cancel()
+    late_commits = [f for f in not_done if stats_by_source[future_to_source[f]].get("ok")]
+    if late_commits:
+        # Committed just before the deadline; only logging is left to do
+        committed, _ = wait(late_commits)
+        done |= committed
+        not_done -= committed
+    executor.shutdown(wait=False, cancel_futures=True)
+
+    new_hackathons = []
+    for future in done:
+        name = future_to_source[future]
+        try:
+            new_hackathons.extend(future.result())
+        except Exception as e:
+            logging.error(f"Thread for {name} failed: {e}")
+    for future in not_done:
+        name = future_to_source[future]
+        # A fresh dict, so the abandoned worker cannot change the run's summary any more
+        stats_by_source[name] = {**stats_by_source[name], "status": "timed_out", "ok": False}
+        logging.warning(
+            f"{name} did not finish within the {deadline.seconds:.0f}s run deadline, "
+            "its results are discarded."
+        )
+    return new_hackathons
+
+
+def run(due_only: bool = False, deadline_seconds: float = SCRAPE_RUN_DEADLINE_SECONDS):
     """
     Run hackathon scraping and return list of newly added hackathons.
+    With due_only=True only the sources whose adaptive interval has elapsed are scraped.
+    The run gives up on sources still running after deadline_seconds; what the others
+    found is committed and returned right away, so it can be announced.
+    Sources whose host has an open circuit breaker are skipped. The outcome of every
+    source and the breaker states are kept in last_run_summary and in scrape_runs.
+    Detail pages are then fetched in the background, see start_enrichment().
     Returns: List of Hackathon objects that were newly added to the database.
     """
-    logging.info("Starting hackathon scraping run.")
-    sources = [
-        ("MLH", scrape_mlh_events),
-        ("Devpost", fetch_devpost_hackathons),
-        ("Unstop", fetch_unstop_hackathons),
-        ("DoraHacks", fetch_dorahacks_hackathons),
-        ("Devfolio", fetch_devfolio_hackathons),
-        # ("Kaggle", fetch_kaggle_competitions)
-        ("Hack2Skill", fetch_hack2skill_hackathons),
-    ]
+    global last_run_summary
+
+    sources = registered_sources()
+    if due_only:
+        due = set(due_sources(sources))
+        sources = {name: target for name, target in sources.items() if name in due}
+        if not sources:
+            logging.debug("No source is due for scraping.")
+            return []
+
+    logging.info(f"Starting hackathon scraping run: {', '.join(sources)}.")
+    started_at = utcnow()
     all_new_hackathons = []
+    stats_by_source = {name: {} for name in sources}
 
-    with ThreadPoolExecutor(max_workers=len(sources)) as executor:
-        future_to_source = {
-            executor.submit(process_source, name, fetch_func): name for name, fetch_func in sources
-        }
-        for future in as_completed(future_to_source):
-            name = future_to_source[future]
+    load_circuit_breakers()
+    runnable = {}
+    for name, target in sources.items():
+        host = SOURCE_HOSTS.get(name)
+        if host and http.breaker_for(host).is_open():
+            logging.warning(f"Skipping {name}: circuit breaker for {host} is open.")
+            stats_by_source[name].update(
+                status="circuit_open", ok=False, new=0, activity=0, duration=0.0
+            )
+        else:
+            runnable[name] = target
+
+    if runnable:
+        deadline = http.Deadline(deadline_seconds)
+        all_new_hackathons = run_sources(runnable, stats_by_source, deadline)
+
+    breakers = http.export_breakers()
+    store_circuit_breakers(breakers)
+    update_source_schedules(stats_by_source)
+    all_new_hackathons = deduplicate(all_new_hackathons)
+    archive.prune_if_due()
+    # Detail pages are fetched after the new hackathons are returned for announcing
+    start_enrichment()
+
+    last_run_summary = {
+        "started_at": started_at,
+        "finished_at": utcnow(),
+        "new_hackathons": len(all_new_hackathons),
+        "sources": stats_by_source,
+        "breakers": breakers,
+    }
+    record_scrape_run(last_run_summary)
+    logging.info(
+        f"Hackathon scraping run completed. {len(all_new_hackathons)} new hackathons added. "
+        + ", ".join(f"{name}: {stats['status']}" for name, stats in stats_by_source.items())
+    )
+    open_hosts = [host for host, b in breakers.items() if b["state"] != http.CLOSED]
+    if open_hosts:
+        logging.warning(f"Circuit breakers not closed: {', '.join(open_hosts)}")
+    return all_new_hackathons
+
+
+def reparse(sources=None, since: datetime = None, workers: int = 4):
+    """
+    Rebuild rows from the archived responses (adapters.archive) with the current
+    adapters, without network access, e.g. after fixing a parsing bug.
+
+    The archived runs are replayed in parallel; for a hackathon seen in several runs
+    the latest run wins. Each source's rows are then upserted like a scrape, in one
+    transaction per source. Corrections are not written to the change log, so the bots
+    send no "updated" notices for them. Returns {source: number of hackathons reparsed}.
+    """
+    paths = archive.find_runs(sources, since)
+    if not paths:
+        logging.info("No archived runs to reparse.")
+        return {}
+    logging.info(f"Reparsing {len(paths)} archived runs.")
+
+    latest = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {path: executor.submit(archive.replay_run, path) for path in paths}
+        # Oldest first, so later runs overwrite what earlier ones found
+        for path, future in futures.items():
             try:
-                new_hackathons = future.result()  # Get list of new hackathons from this source
-                all_new_hackathons.extend(new_hackathons)
+                hackathons = future.result()
             except Exception as e:
-                logging.error(f"Thread for {name} failed: {e}")
+                logging.error(f"Could not reparse {path}: {e}")
+                continue
+            rows = latest.setdefault(path.parent.name, {})
+            rows.update((h.id, h) for h in hackathons)
 
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                process_source,
+                source,
+                lambda rows=rows: list(rows.values()),
+                record_changes=False,
+            )
+            for source, rows in latest.items()
+        ]
+        new_hackathons = [h for future in futures for h in future.result()]
+    deduplicate(new_hackathons)
+
+    counts = {source: len(rows) for source, rows in latest.items()}
     logging.info(
-        f"Hackathon scraping run completed. {len(all_new_hackathons)} new hackathons added."
+        "Reparse completed. "
+        + ", ".join(f"{source}: {count} hackathons" for source, count in counts.items())
     )
-    return all_new_hackathons
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scrape hackathons into the database.")
+    parser.add_argument(
+        "command",
+        nargs="?",
+        default="run",
+        choices=["run", "reparse", "enrich", "prune"],
+        help="scrape the sources (default), rebuild rows from archived responses, "
+        "fetch detail pages of stored hackathons, or delete expired archived responses",
+    )
+    parser.add_argument("--source", action="append", help="reparse only these sources (repeatable)")
+    parser.add_argument(
+        "--since",
+        type=datetime.fromisoformat,
+        help="reparse only runs archived since this UTC date or time, e.g. 2025-06-01",
+    )
+    parser.add_argument("--workers", type=int, default=4, help="runs reparsed in parallel")
+    args = parser.parse_args()
+
+    if args.command == "prune":
+        archive.prune()
+        return
+    create_all_tables()
+    if args.command == "reparse":
+        since = args.since.replace(tzinfo=args.since.tzinfo or timezone.utc) if args.since else None
+        reparse(args.source, since, args.workers)
+    elif args.command == "enrich":
+        enrich_pending()
+    else:
+        run()
+        # A one-off run waits for its enrichment pass instead of killing it on exit
+        if _enrichment_thread is not None:
+            _enrichment_thread.join()
 
 
 if __name__ == "__main__":
-    run()
+    main()
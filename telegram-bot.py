@@ -1,6 +1,8 @@
 import asyncio
 import logging
 import os
+from html import escape
+from uuid import uuid4
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from dotenv import load_dotenv
@@ -13,19 +15,33 @@ from telegram.ext import (
     ContextTypes,
 )
 
+from backend.cache import query_cache
 from backend.crud import (
+    get_active_guilds_for_source,
     get_all_subscriptions,
-    get_hackathons_by_platform,
-    get_upcoming_hackathons,
+    get_alternate_listings,
+    get_change_cursor,
+    get_hackathon_changes,
+    get_hackathons_by_ids,
+    get_hackathons_by_platform_page,
+    get_latest_change_seq,
+    get_upcoming_hackathons_page,
+    get_user_subscriptions,
+    guild_wants_tags,
     pause_notifications,
     resume_notifications,
-    search_hackathons,
-    subscribe_user,
-    unsubscribe_user,
+    search_hackathons_page,
+    set_change_cursor,
+    subscribe_user_bulk,
+    unsubscribe_user_bulk,
     update_guild_preferences,
 )
 from backend.db import SessionLocal
-from backend.models import GuildConfig
+from backend.init_db import create_all_tables
+from backend.locks import LeaderElection, leader_only
+from backend.notices import NOTABLE_CHANGE_FIELDS, describe_change
+from backend.scheduling import SCRAPE_TICK_MINUTES, scrape_job_options
+from fetch_and_store import last_successful_scrape
 from fetch_and_store import run as fetch_and_store_hackathons
 
 load_dotenv()
@@ -36,6 +52,23 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Change log consumer for "updated" notices
+CHANGE_CONSUMER = "telegram-bot"
+CHANGE_BATCH_SIZE = 200
+
+# Held by the replica that runs the scheduled scrape and notifications
+scrape_leader = LeaderElection("telegram-bot:scrape")
+
+# Result browsing for /search, /platform and /upcoming
+BROWSE_PAGE_SIZE = 5
+MAX_BROWSE_PAGE_SIZE = 10
+MAX_BROWSE_SESSIONS = 20
+BROWSE_QUERIES = {
+    "search": search_hackathons_page,
+    "platform": get_hackathons_by_platform_page,
+    "upcoming": get_upcoming_hackathons_page,
+}
+
 
 # Helper function to check if user is admin
 async def is_user_admin(update: Update, context: ContextTypes.DEFAULT_TYPE) -> bool:
@@ -56,8 +89,20 @@ async def is_user_admin(update: Update, context: ContextTypes.DEFAULT_TYPE) -> b
         return False
 
 
-def format_hackathon_message(hackathon):
-    """Format a hackathon as a Telegram message with HTML formatting."""
+def hackathon_tags(hackathon):
+    """Tags as a list, for both Hackathon schemas (list) and HackathonDB rows (comma string)."""
+    if not hackathon.tags:
+        return []
+    if isinstance(hackathon.tags, str):
+        return [tag.strip() for tag in hackathon.tags.split(",") if tag.strip()]
+    return list(hackathon.tags)
+
+
+def format_hackathon_message(hackathon, alternates=()):
+    """
+    Format a hackathon as a Telegram message with HTML formatting.
+    alternates are (source, url) listings of the same event on other platforms.
+    """
     emojis = ["🎉", "🚀", "💡", "🔥", "💻", "🏆", "🌟", "⚡", "🔮", "🛠️"]
     import random
 
@@ -80,6 +125,8 @@ def format_hackathon_message(hackathon):
     keyboard = []
     if hackathon.url:
         keyboard.append([InlineKeyboardButton("View Details", url=hackathon.url)])
+    for source, url in alternates:
+        keyboard.append([InlineKeyboardButton(f"View on {source}", url=url)])
 
     reply_markup = InlineKeyboardMarkup(keyboard) if keyboard else None
 
@@ -125,51 +172,31 @@ async def send_hackathon_notifications(application, new_hackathons, target_chat=
         db = SessionLocal()
 
         try:
-            configs = db.query(GuildConfig).all()
-
-            for config in configs:
-                # Check if notifications are paused
-                if config.notifications_paused == "true":
-                    logger.info(f"Notifications are paused for chat {config.guild_id}. Skipping.")
-                    continue
-
-                chat_id = config.guild_id
-                platforms = (
-                    config.subscribed_platforms.split(",")
-                    if config.subscribed_platforms
-                    else ["all"]
-                )
-                themes = (
-                    config.subscribed_themes.split(",") if config.subscribed_themes else ["all"]
-                )
-
-                # Send notification for each new hackathon
-                for hackathon in new_hackathons:
-                    # Filter by platform
-                    if "all" not in platforms:
-                        if not any(p.lower() in hackathon.source.lower() for p in platforms):
-                            continue
-
+            # Listings of the same event on other platforms were linked during ingestion;
+            # a guild following any of those platforms gets the canonical one, once.
+            alternates = get_alternate_listings(db, [h.id for h in new_hackathons])
+            guilds_by_source = {}
+
+            for hackathon in new_hackathons:
+                listings = alternates.get(hackathon.id, [])
+                sources = {hackathon.source.lower()} | {source.lower() for source, _ in listings}
+                configs = {}
+                for source in sources:
+                    if source not in guilds_by_source:
+                        # Paused guilds and platform filters are applied in SQL
+                        guilds_by_source[source] = get_active_guilds_for_source(db, source)
+                    for config in guilds_by_source[source]:
+                        configs.setdefault(config.guild_id, config)
+
+                for chat_id, config in configs.items():
                     # Filter by theme
-                    if "all" not in themes:
-                        hack_tags = (
-                            [t.lower() for t in hackathon.tags.split(",")] if hackathon.tags else []
-                        )
-                        match = False
-                        for theme in themes:
-                            theme_lower = theme.lower()
-                            for tag in hack_tags:
-                                if theme_lower in tag:
-                                    match = True
-                                    break
-                            if match:
-                                break
-
-                        if not match:
-                            continue
+                    if not guild_wants_tags(config, hackathon_tags(hackathon)):
+                        continue
 
                     try:
-                        text, photo_url, reply_markup = format_hackathon_message(hackathon)
+                        text, photo_url, reply_markup = format_hackathon_message(
+                            hackathon, listings
+                        )
 
                         if photo_url:
                             await application.bot.send_photo(
@@ -214,7 +241,7 @@ async def notify_subscribers(application, new_hackathons):
         user_notifications = {}
 
         for hackathon in new_hackathons:
-            hack_tags = [t.lower() for t in hackathon.tags.split(",")] if hackathon.tags else []
+            hack_tags = [t.lower() for t in hackathon_tags(hackathon)]
 
             for sub in subscriptions:
                 theme_lower = sub.theme.lower()
@@ -262,6 +289,187 @@ async def notify_subscribers(application, new_hackathons):
         db.close()
 
 
+def format_hackathon_page(state, page):
+    """Format one page of hackathons as a single message with ◀/▶ navigation buttons."""
+    first_number = state["page"] * state["page_size"] + 1
+
+    text = f"{state['header']} (page {state['page'] + 1})\n\n"
+    for number, hackathon in enumerate(page.items, start=first_number):
+        text += f"<b>{number}. {escape(hackathon.title)}</b>\n"
+        text += (
+            f"📅 {hackathon.start_date.strftime('%b %d')} - "
+            f"{hackathon.end_date.strftime('%b %d, %Y')} · {escape(hackathon.source)} · "
+            f"{escape(hackathon.mode)}\n"
+        )
+        if hackathon.url:
+            text += f'🔗 <a href="{escape(hackathon.url)}">View Details</a>\n'
+        text += "\n"
+
+    buttons = []
+    if page.has_prev:
+        buttons.append(InlineKeyboardButton("◀", callback_data=f"browse:{state['token']}:prev"))
+    if page.has_next:
+        buttons.append(InlineKeyboardButton("▶", callback_data=f"browse:{state['token']}:next"))
+    reply_markup = InlineKeyboardMarkup([buttons]) if buttons else None
+
+    return text, reply_markup
+
+
+def fetch_hackathon_page(state, cursor=None, backwards=False):
+    db = SessionLocal()
+    try:
+        return BROWSE_QUERIES[state["kind"]](
+            db, state["arg"], cursor=cursor, backwards=backwards, page_size=state["page_size"]
+        )
+    finally:
+        db.close()
+
+
+def remember_page(state, page):
+    """Keep the keyset cursors of the page currently shown."""
+    state["first"] = (page.items[0].start_date, page.items[0].id)
+    state["last"] = (page.items[-1].start_date, page.items[-1].id)
+
+
+async def send_hackathon_page(update, context, kind, arg, header, page_size=BROWSE_PAGE_SIZE):
+    """
+    Reply with the first page of results for a browse query.
+    Returns False if there are no results.
+    """
+    state = {
+        "token": uuid4().hex[:8],
+        "kind": kind,
+        "arg": arg,
+        "header": header,
+        "page_size": max(1, min(page_size, MAX_BROWSE_PAGE_SIZE)),
+        "page": 0,
+    }
+    page = fetch_hackathon_page(state)
+    if not page.items:
+        return False
+
+    remember_page(state, page)
+    sessions = context.chat_data.setdefault("browse", {})
+    sessions[state["token"]] = state
+    while len(sessions) > MAX_BROWSE_SESSIONS:
+        sessions.pop(next(iter(sessions)))
+
+    text, reply_markup = format_hackathon_page(state, page)
+    await update.message.reply_text(
+        text,
+        parse_mode=ParseMode.HTML,
+        reply_markup=reply_markup,
+        disable_web_page_preview=True,
+    )
+    return True
+
+
+async def browse_callback(query, context):
+    """Handle ◀/▶ buttons by editing the results message in place."""
+    _, token, direction = query.data.split(":")
+    state = context.chat_data.get("browse", {}).get(token)
+    if not state:
+        await query.edit_message_reply_markup(reply_markup=None)
+        return
+
+    backwards = direction == "prev"
+    page = fetch_hackathon_page(
+        state, cursor=state["first"] if backwards else state["last"], backwards=backwards
+    )
+    if not page.items:
+        return
+
+    state["page"] += -1 if backwards else 1
+    remember_page(state, page)
+    text, reply_markup = format_hackathon_page(state, page)
+    await query.edit_message_text(
+        text,
+        parse_mode=ParseMode.HTML,
+        reply_markup=reply_markup,
+        disable_web_page_preview=True,
+    )
+
+
+def format_change_notice(hackathon, changes):
+    """Format an "updated" notice for one hackathon and its latest changes."""
+    # Only the newest change per field matters if a field changed more than once
+    latest = {change.field: change for change in changes}
+
+    text = f"📢 <b>Update: {escape(hackathon.title)}</b>\n\n"
+    text += "\n".join(describe_change(change) for change in latest.values())
+
+    reply_markup = None
+    if hackathon.url:
+        reply_markup = InlineKeyboardMarkup(
+            [[InlineKeyboardButton("View Details", url=hackathon.url)]]
+        )
+    return text, reply_markup
+
+
+async def notify_hackathon_updates(application):
+    """
+    Tail the hackathon change log from this bot's cursor and send "updated"
+    notices for notable changes to the groups that follow the hackathon.
+    """
+    db = SessionLocal()
+    try:
+        cursor = get_change_cursor(db, CHANGE_CONSUMER)
+        if cursor is None:
+            # First run: start at the end of the log instead of replaying history
+            set_change_cursor(db, CHANGE_CONSUMER, get_latest_change_seq(db))
+            return
+
+        while True:
+            changes = get_hackathon_changes(db, cursor, limit=CHANGE_BATCH_SIZE)
+            if not changes:
+                break
+
+            by_hackathon = {}
+            for change in changes:
+                if change.field in NOTABLE_CHANGE_FIELDS:
+                    by_hackathon.setdefault(change.hackathon_id, []).append(change)
+
+            guilds_by_source = {}
+            alternates = get_alternate_listings(db, list(by_hackathon))
+            for hackathon in get_hackathons_by_ids(db, list(by_hackathon)):
+                if hackathon.duplicate_of:
+                    # Announced through its canonical listing
+                    continue
+                text, reply_markup = format_change_notice(hackathon, by_hackathon[hackathon.id])
+                # Guilds following a merged duplicate's platform were told about the
+                # canonical listing, so they get its updates too.
+                sources = {hackathon.source.lower()} | {
+                    source.lower() for source, _ in alternates.get(hackathon.id, [])
+                }
+                configs = {}
+                for source in sources:
+                    if source not in guilds_by_source:
+                        guilds_by_source[source] = get_active_guilds_for_source(db, source)
+                    for config in guilds_by_source[source]:
+                        configs.setdefault(config.guild_id, config)
+
+                for config in configs.values():
+                    if not guild_wants_tags(config, hackathon_tags(hackathon)):
+                        continue
+                    try:
+                        await application.bot.send_message(
+                            chat_id=config.guild_id,
+                            text=text,
+                            parse_mode=ParseMode.HTML,
+                            reply_markup=reply_markup,
+                        )
+                        logger.info(
+                            f"Sent update for hackathon '{hackathon.title}' to chat {config.guild_id}"
+                        )
+                    except Exception as e:
+                        logger.error(f"Failed to send update to chat {config.guild_id}: {e}")
+
+            cursor = changes[-1].seq
+            set_change_cursor(db, CHANGE_CONSUMER, cursor)
+    finally:
+        db.close()
+
+
 # Command Handlers
 
 
@@ -301,10 +509,10 @@ async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         "<b>🔍 Search & Browse</b>\n"
         "/search [keyword] - Search hackathons\n"
         "/upcoming [days] - Hackathons starting soon (default: 7 days)\n"
-        "/platform [name] [count] - Filter by platform (default: 3)\n\n"
+        "/platform [name] [count] - Filter by platform (count per page, default: 3)\n\n"
         "<b>🔔 Personal Alerts</b>\n"
-        "/subscribe [theme] - Get DM alerts for a theme\n"
-        "/unsubscribe [theme] - Stop DM alerts for a theme\n"
+        "/subscribe [theme], ... - Get DM alerts for one or more themes\n"
+        "/unsubscribe [theme], ... - Stop DM alerts for one or more themes\n"
         "/subscriptions - View your subscriptions\n\n"
         "<b>🔧 Group Setup (Admin Only)</b>\n"
         "/setup - Configure group preferences\n"
@@ -376,25 +584,13 @@ async def search_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         f"🔍 Searching for hackathons matching '<b>{keyword}</b>'...", parse_mode=ParseMode.HTML
     )
 
-    db = SessionLocal()
-    try:
-        results = search_hackathons(db, keyword)
-    finally:
-        db.close()
-
-    if not results:
+    found = await send_hackathon_page(
+        update, context, "search", keyword, f"🔍 Hackathons for <b>{escape(keyword)}</b>"
+    )
+    if not found:
         await update.message.reply_text(
             f"❌ No hackathons found for <b>{keyword}</b>", parse_mode=ParseMode.HTML
         )
-        return
-
-    await update.message.reply_text(
-        f"🔍 Found <b>{len(results)}</b> hackathon(s) for <b>{keyword}</b>:",
-        parse_mode=ParseMode.HTML,
-    )
-    await send_hackathon_notifications(
-        context.application, results, target_chat=update.effective_chat.id
-    )
 
 
 async def platform_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -414,25 +610,18 @@ async def platform_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         f"🔍 Fetching hackathons from <b>{platform_name}</b>...", parse_mode=ParseMode.HTML
     )
 
-    db = SessionLocal()
-    try:
-        results = get_hackathons_by_platform(db, platform_name, count)
-    finally:
-        db.close()
-
-    if not results:
+    found = await send_hackathon_page(
+        update,
+        context,
+        "platform",
+        platform_name,
+        f"🔍 Hackathons from <b>{escape(platform_name)}</b>",
+        page_size=count,
+    )
+    if not found:
         await update.message.reply_text(
             f"❌ No hackathons found for platform <b>{platform_name}</b>", parse_mode=ParseMode.HTML
         )
-        return
-
-    await update.message.reply_text(
-        f"🔍 Found <b>{len(results)}</b> hackathon(s) from <b>{platform_name}</b>:",
-        parse_mode=ParseMode.HTML,
-    )
-    await send_hackathon_notifications(
-        context.application, results, target_chat=update.effective_chat.id
-    )
 
 
 async def upcoming_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -444,52 +633,51 @@ async def upcoming_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         parse_mode=ParseMode.HTML,
     )
 
-    db = SessionLocal()
-    try:
-        results = get_upcoming_hackathons(db, days)
-    finally:
-        db.close()
-
-    if not results:
+    found = await send_hackathon_page(
+        update,
+        context,
+        "upcoming",
+        days,
+        f"📅 Hackathons starting in the next <b>{days}</b> days",
+    )
+    if not found:
         await update.message.reply_text(
             f"❌ No upcoming hackathons found in the next <b>{days}</b> days.",
             parse_mode=ParseMode.HTML,
         )
-        return
 
-    await update.message.reply_text(
-        f"📅 Found <b>{len(results)}</b> upcoming hackathon(s) in the next <b>{days}</b> days:",
-        parse_mode=ParseMode.HTML,
-    )
-    await send_hackathon_notifications(
-        context.application, results, target_chat=update.effective_chat.id
-    )
+
+def parse_themes(args):
+    """Split command arguments into themes: "/subscribe AI, Web3, machine learning"."""
+    return [theme.strip() for theme in " ".join(args).split(",") if theme.strip()]
 
 
 async def subscribe_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /subscribe command."""
-    if not context.args:
+    themes = parse_themes(context.args or [])
+    if not themes:
         await update.message.reply_text(
             "❌ Please provide a theme to subscribe to.\n\n"
-            "Usage: /subscribe [theme]\n"
-            "Example: /subscribe AI"
+            "Usage: /subscribe [theme], [theme], ...\n"
+            "Example: /subscribe AI, Web3"
         )
         return
 
-    theme = " ".join(context.args)
     user_id = update.effective_user.id
 
     db = SessionLocal()
     try:
-        sub, is_new = subscribe_user(db, user_id, theme)
-        if is_new:
+        added = subscribe_user_bulk(db, user_id, themes)
+        existing = [theme for theme in themes if theme not in added]
+        if added:
             await update.message.reply_text(
-                f"✅ You have successfully subscribed to <b>{theme}</b> updates!",
+                f"✅ You have successfully subscribed to <b>{', '.join(added)}</b> updates!",
                 parse_mode=ParseMode.HTML,
             )
-        else:
+        if existing:
             await update.message.reply_text(
-                f"ℹ️ You are already subscribed to <b>{theme}</b>.", parse_mode=ParseMode.HTML
+                f"ℹ️ You are already subscribed to <b>{', '.join(existing)}</b>.",
+                parse_mode=ParseMode.HTML,
             )
     except Exception as e:
         await update.message.reply_text(f"❌ Error subscribing: {str(e)}")
@@ -500,28 +688,30 @@ async def subscribe_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 async def unsubscribe_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /unsubscribe command."""
-    if not context.args:
+    themes = parse_themes(context.args or [])
+    if not themes:
         await update.message.reply_text(
             "❌ Please provide a theme to unsubscribe from.\n\n"
-            "Usage: /unsubscribe [theme]\n"
-            "Example: /unsubscribe AI"
+            "Usage: /unsubscribe [theme], [theme], ...\n"
+            "Example: /unsubscribe AI, Web3"
         )
         return
 
-    theme = " ".join(context.args)
     user_id = update.effective_user.id
 
     db = SessionLocal()
     try:
-        removed = unsubscribe_user(db, user_id, theme)
+        removed = unsubscribe_user_bulk(db, user_id, themes)
+        missing = [theme for theme in themes if theme not in removed]
         if removed:
             await update.message.reply_text(
-                f"✅ You have successfully unsubscribed from <b>{theme}</b> updates.",
+                f"✅ You have successfully unsubscribed from <b>{', '.join(removed)}</b> updates.",
                 parse_mode=ParseMode.HTML,
             )
-        else:
+        if missing:
             await update.message.reply_text(
-                f"ℹ️ You were not subscribed to <b>{theme}</b>.", parse_mode=ParseMode.HTML
+                f"ℹ️ You were not subscribed to <b>{', '.join(missing)}</b>.",
+                parse_mode=ParseMode.HTML,
             )
     except Exception as e:
         await update.message.reply_text(f"❌ Error unsubscribing: {str(e)}")
@@ -536,8 +726,7 @@ async def subscriptions_command(update: Update, context: ContextTypes.DEFAULT_TY
 
     db = SessionLocal()
     try:
-        all_subs = get_all_subscriptions(db)
-        user_subs = [sub for sub in all_subs if sub.user_id == user_id]
+        user_subs = get_user_subscriptions(db, user_id)
 
         if not user_subs:
             await update.message.reply_text(
@@ -682,7 +871,10 @@ async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     data = query.data
 
-    if data == "help":
+    if data.startswith("browse:"):
+        await browse_callback(query, context)
+
+    elif data == "help":
         help_text = (
             "📖 <b>HackRadar Commands</b>\n\n"
             "<b>🔍 Search & Browse</b>\n"
@@ -1010,7 +1202,8 @@ async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
             )
 
             # Clear setup state
-            context.chat_data.clear()
+            context.chat_data.pop("setup_platforms", None)
+            context.chat_data.pop("setup_themes", None)
         except Exception as e:
             await query.edit_message_text(f"❌ Error saving preferences: {str(e)}")
             logger.error(f"Error in setup save: {e}")
@@ -1019,7 +1212,8 @@ async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     elif data == "setup_cancel":
         await query.edit_message_text("❌ Setup cancelled.")
-        context.chat_data.clear()
+        context.chat_data.pop("setup_platforms", None)
+        context.chat_data.pop("setup_themes", None)
 
 
 # Background task
@@ -1029,31 +1223,46 @@ async def check_and_notify_hackathons(application):
     """Background task that fetches hackathons and sends notifications."""
     try:
         logger.info("Starting hackathon fetch and notification check")
-        new_hackathons = fetch_and_store_hackathons()
+        # In a worker thread, so commands are still answered while sources are scraped
+        new_hackathons = await asyncio.to_thread(fetch_and_store_hackathons, due_only=True)
 
-        if not new_hackathons:
-            logger.info("No new hackathons found")
-            return
+        if new_hackathons:
+            logger.info(f"Found {len(new_hackathons)} new hackathons, sending notifications")
 
-        logger.info(f"Found {len(new_hackathons)} new hackathons, sending notifications")
+            # Send notifications to all groups
+            await send_hackathon_notifications(application, new_hackathons)
 
-        # Send notifications to all groups
-        await send_hackathon_notifications(application, new_hackathons)
+            # Notify subscribers via DM
+            await notify_subscribers(application, new_hackathons)
+        else:
+            logger.info("No new hackathons found")
 
-        # Notify subscribers via DM
-        await notify_subscribers(application, new_hackathons)
+        # Announce changed dates, prizes and statuses of known hackathons
+        await notify_hackathon_updates(application)
 
         logger.info("Completed hackathon notifications")
     except Exception as e:
         logger.error(f"Error in check_and_notify_hackathons task: {e}")
+    finally:
+        logger.info(f"Query cache stats: {query_cache.stats()}")
 
 
 async def post_init(application: Application) -> None:
     """Initialize scheduler after application starts."""
     scheduler = AsyncIOScheduler()
-    scheduler.add_job(check_and_notify_hackathons, "interval", hours=12, args=[application])
+    # Each tick only scrapes the sources whose adaptive interval has elapsed. With several
+    # replicas running, only the one holding the leader lock scrapes and notifies.
+    # A restart resumes one tick after the last successful scrape instead of scraping at once.
+    job = scheduler.add_job(
+        leader_only(scrape_leader)(check_and_notify_hackathons),
+        args=[application],
+        **scrape_job_options(last_successful_scrape()),
+    )
     scheduler.start()
-    logger.info("Background scheduler started")
+    logger.info(
+        f"Background scheduler started (checks sources every {SCRAPE_TICK_MINUTES:g} min, "
+        f"next at {job.next_run_time:%Y-%m-%d %H:%M %Z})"
+    )
 
 
 async def main():
@@ -1062,8 +1271,10 @@ async def main():
     if not token:
         raise RuntimeError("TELEGRAM_TOKEN is not set in the environment")
 
+    create_all_tables()
+
     # Create application
-    application = Application.builder().token(token).post_init(post_init).build()
+    application = Application.builder().token(token).build()
 
     # Add command handlers
     application.add_handler(CommandHandler("start", start))
@@ -1086,6 +1297,8 @@ async def main():
     await application.initialize()
     await application.start()
     await application.updater.start_polling(allowed_updates=Update.ALL_TYPES)
+    # post_init is only invoked by run_polling(), so start the scheduler here
+    await post_init(application)
 
     logger.info("Bot started successfully!")
 
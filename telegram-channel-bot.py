@@ -1,6 +1,7 @@
 import asyncio
 import logging
 import os
+from html import escape
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from dotenv import load_dotenv
@@ -8,6 +9,19 @@ from telegram import Bot, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.constants import ParseMode
 from telegram.error import TelegramError
 
+from backend.crud import (
+    get_change_cursor,
+    get_hackathon_changes,
+    get_hackathons_by_ids,
+    get_latest_change_seq,
+    set_change_cursor,
+)
+from backend.db import SessionLocal
+from backend.init_db import create_all_tables
+from backend.locks import LeaderElection, leader_only
+from backend.notices import NOTABLE_CHANGE_FIELDS, describe_change
+from backend.scheduling import SCRAPE_TICK_MINUTES, scrape_job_options
+from fetch_and_store import last_successful_scrape
 from fetch_and_store import run as fetch_and_store_hackathons
 
 load_dotenv()
@@ -18,6 +32,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+CHANGE_BATCH_SIZE = 200
+
 
 def format_hackathon_message(hackathon):
     """Format a hackathon as a Telegram message with HTML formatting."""
@@ -98,18 +114,75 @@ async def send_to_channel(bot: Bot, channel_id: str, new_hackathons):
     logger.info(f"Channel posting complete: {success_count} successful, {error_count} failed")
 
 
+async def post_hackathon_updates(bot: Bot, channel_id: str):
+    """Tail the hackathon change log and post "updated" notices for notable changes."""
+    consumer = f"telegram-channel-bot:{channel_id}"
+    db = SessionLocal()
+    try:
+        cursor = get_change_cursor(db, consumer)
+        if cursor is None:
+            # First run: start at the end of the log instead of replaying history
+            set_change_cursor(db, consumer, get_latest_change_seq(db))
+            return
+
+        while True:
+            changes = get_hackathon_changes(db, cursor, limit=CHANGE_BATCH_SIZE)
+            if not changes:
+                break
+
+            by_hackathon = {}
+            for change in changes:
+                if change.field in NOTABLE_CHANGE_FIELDS:
+                    # Only the newest change per field matters
+                    by_hackathon.setdefault(change.hackathon_id, {})[change.field] = change
+
+            for hackathon in get_hackathons_by_ids(db, list(by_hackathon)):
+                if hackathon.duplicate_of:
+                    # Announced through its canonical listing
+                    continue
+                text = f"📢 <b>Update: {escape(hackathon.title)}</b>\n\n"
+                text += "\n".join(
+                    describe_change(change) for change in by_hackathon[hackathon.id].values()
+                )
+                keyboard = None
+                if hackathon.url:
+                    keyboard = InlineKeyboardMarkup(
+                        [[InlineKeyboardButton("View Details", url=hackathon.url)]]
+                    )
+                try:
+                    await bot.send_message(
+                        chat_id=channel_id,
+                        text=text,
+                        parse_mode=ParseMode.HTML,
+                        reply_markup=keyboard,
+                    )
+                    logger.info(f"Posted update for hackathon '{hackathon.title}' to channel")
+                    # Small delay to avoid rate limiting
+                    await asyncio.sleep(3)
+                except TelegramError as e:
+                    logger.error(f"Failed to post update for '{hackathon.title}': {e}")
+
+            cursor = changes[-1].seq
+            set_change_cursor(db, consumer, cursor)
+    finally:
+        db.close()
+
+
 async def check_and_post_hackathons(bot: Bot, channel_id: str):
     """Background task that fetches hackathons and posts to channel."""
     try:
         logger.info("Starting hackathon fetch and channel posting")
-        new_hackathons = fetch_and_store_hackathons()
+        # In a worker thread, so commands are still answered while sources are scraped
+        new_hackathons = await asyncio.to_thread(fetch_and_store_hackathons, due_only=True)
 
-        if not new_hackathons:
+        if new_hackathons:
+            logger.info(f"Found {len(new_hackathons)} new hackathons, posting to channel")
+            await send_to_channel(bot, channel_id, new_hackathons)
+        else:
             logger.info("No new hackathons found")
-            return
 
-        logger.info(f"Found {len(new_hackathons)} new hackathons, posting to channel")
-        await send_to_channel(bot, channel_id, new_hackathons)
+        # Announce changed dates, prizes and statuses of known hackathons
+        await post_hackathon_updates(bot, channel_id)
 
         logger.info("Completed channel posting")
 
@@ -137,6 +210,7 @@ async def main():
         )
 
     logger.info(f"Starting Telegram Channel Bot for channel: {channel_id}")
+    create_all_tables()
 
     # Create bot instance
     bot = Bot(token=token)
@@ -150,15 +224,23 @@ async def main():
         logger.error("Make sure the bot is added as an administrator to the channel!")
         return
 
+    # Only the replica holding this lock scrapes and posts to the channel
+    leader = LeaderElection(f"telegram-channel-bot:{channel_id}")
+    check_and_post = leader_only(leader)(check_and_post_hackathons)
+
     # Set up scheduler for background tasks
     scheduler = AsyncIOScheduler()
-    scheduler.add_job(check_and_post_hackathons, "interval", hours=6, args=[bot, channel_id])
+    # Each tick only scrapes the sources whose adaptive interval has elapsed. The first tick
+    # runs right away only if the last successful scrape is older than one tick, so crash
+    # loops and redeploys do not hit every upstream site on each start.
+    job = scheduler.add_job(
+        check_and_post, args=[bot, channel_id], **scrape_job_options(last_successful_scrape())
+    )
     scheduler.start()
-    logger.info("Background scheduler started (runs every 6 hours)")
-
-    # Run initial fetch and post
-    logger.info("Running initial hackathon fetch and post...")
-    await check_and_post_hackathons(bot, channel_id)
+    logger.info(
+        f"Background scheduler started (checks sources every {SCRAPE_TICK_MINUTES:g} min, "
+        f"next at {job.next_run_time:%Y-%m-%d %H:%M %Z})"
+    )
 
     # Keep the script running
     logger.info("Channel bot is now running. Press Ctrl+C to stop.")
@@ -169,6 +251,7 @@ async def main():
     except KeyboardInterrupt:
         logger.info("Shutting down channel bot...")
         scheduler.shutdown()
+        leader.release()
 
 
 if __name__ == "__main__":
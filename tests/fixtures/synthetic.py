@@ -0,0 +1,350 @@
+"""
+Builds the replay fixtures in this directory.
+
+The payloads mirror the shape of each source's real responses (the fields the
+adapters read, with the same nesting and formats) but the events are made up and
+dated far in the future, so the fixtures do not expire. Responses recorded from
+the live sites can replace any of them:
+
+    python -m adapters.replay record Devpost tests/fixtures/devpost.json.gz
+
+Regenerate the synthetic ones with
+
+    python tests/fixtures/synthetic.py
+"""
+
+import json
+import sys
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE.parents[1]))
+
+from adapters.replay import request_url, save_fixture
+
+FIRST_DAY = date(2031, 1, 6)
+THEMES = ["AI", "Web3", "Climate", "Health", "Education", "Fintech"]
+CITIES = [("Boston", "MA"), ("Toronto", "ON"), ("Austin", "TX"), ("Bengaluru", "KA")]
+
+
+def exchange(url, body, params=None, content_type="application/json"):
+    text = body if isinstance(body, str) else json.dumps(body)
+    return {
+        "method": "GET",
+        "url": request_url("GET", url, params),
+        "status": 200,
+        "headers": {"Content-Type": content_type},
+        "text": text,
+    }
+
+
+def utc_iso(day):
+    return datetime.combine(day, datetime.min.time(), timezone.utc).strftime(
+        "%Y-%m-%dT%H:%M:%S.000Z"
+    )
+
+
+def event_dates(i, length=2):
+    start = FIRST_DAY + timedelta(days=3 * i)
+    return start, start + timedelta(days=length)
+
+
+def devpost(pages=3, per_page=9, ended_pages=3):
+    """Pages of open hackathons, then pages of ended ones as the API lists them."""
+    exchanges = []
+    for page in range(1, pages + ended_pages + 1):
+        items = []
+        for n in range(per_page):
+            i = (page - 1) * per_page + n
+            start, end = event_dates(i, length=30)
+            online = i % 3 != 0
+            if page > pages:
+                state = "ended"
+                start, end = start.replace(year=2020), end.replace(year=2020)
+            else:
+                state = "open" if i % 4 else "upcoming"
+            items.append(
+                {
+                    "id": 20000 + i,
+                    "title": f"Devpost Hack {i}",
+                    "url": f"https://devpost-hack-{i}.devpost.com/",
+                    "open_state": state,
+                    "submission_period_dates": f"{start:%b %d} - {end:%b %d, %Y}",
+                    "displayed_location": {
+                        "icon": "globe" if online else "map-marker-alt",
+                        "location": "Online" if online else f"{CITIES[i % 4][0]}, USA",
+                    },
+                    "thumbnail_url": f"//d112y698adiu2z.cloudfront.net/photos/{i}/medium_square.png",
+                    "prize_amount": f"$<span data-currency-value>{(i + 1) * 1000:,}</span>",
+                    "prizes_counts": {"cash": i % 5, "other": i % 2},
+                    "themes": [{"id": t, "name": THEMES[(i + t) % len(THEMES)]} for t in range(2)],
+                }
+            )
+        exchanges.append(
+            exchange(f"https://devpost.com/api/hackathons?page={page}", {"hackathons": items})
+        )
+    return exchanges
+
+
+def unstop(pages=2, per_page=10):
+    url = "https://unstop.com/api/public/opportunity/search-result"
+    exchanges = []
+    for page in range(1, pages + 1):
+        items = []
+        for n in range(per_page):
+            i = (page - 1) * per_page + n
+            start, end = event_dates(i)
+            items.append(
+                {
+                    "id": 900000 + i,
+                    "title": f"Unstop Hackathon {i}",
+                    "seo_url": f"https://unstop.com/hackathons/unstop-hackathon-{i}-{900000 + i}",
+                    "start_date": f"{start}T00:00:00+05:30",
+                    "end_date": f"{end}T23:59:00+05:30",
+                    "region": "online" if i % 2 else "offline",
+                    "status": "LIVE",
+                    "logoUrl2": f"https://d8it4huxumps7.cloudfront.net/images/{i}.png",
+                    "filters": [
+                        {"type": "category", "name": THEMES[i % len(THEMES)]},
+                        {"type": "eligible", "name": "Engineering Students"},
+                    ],
+                    "prizes": [
+                        {"rank": "Winner", "cash": 50000 + i, "currency": "fa-rupee"},
+                        {"rank": "1st Runner Up", "cash": 25000, "currency": "fa-rupee"},
+                        {"rank": "Goodies", "cash": 0, "currency": ""},
+                    ][: 1 + i % 3],
+                    "regnRequirements": {
+                        "reg_status": "STARTED",
+                        "min_team_size": 1,
+                        "max_team_size": 4,
+                    },
+                    "address_with_country_logo": None
+                    if i % 2
+                    else {
+                        "address": "Main Campus",
+                        "city": CITIES[i % 4][0],
+                        "state": CITIES[i % 4][1],
+                        "country": {"name": "India"},
+                    },
+                }
+            )
+        next_page = f"{url}?page={page + 1}" if page < pages else None
+        params = {"opportunity": "hackathons", "page": page, "oppstatus": "open"}
+        exchanges.append(
+            exchange(url, {"data": {"data": items, "next_page_url": next_page}}, params)
+        )
+    return exchanges
+
+
+def devfolio(count=12):
+    url = "https://api.devfolio.co/api/hackathons"
+    items, prizes = [], []
+    for i in range(count):
+        start, end = event_dates(i)
+        slug = f"devfolio-hack-{i}"
+        items.append(
+            {
+                "name": f"Devfolio Hack {i}",
+                "slug": slug,
+                "cover_img": f"https://assets.devfolio.co/hackathons/{slug}/cover.png",
+                "starts_at": f"{start}T04:30:00.000Z",
+                "ends_at": f"{end}T12:30:00.000Z",
+                "location": None if i % 2 else CITIES[i % 4][0],
+                "is_online": bool(i % 2),
+                "team_min": 1,
+                "team_size": 4,
+            }
+        )
+        prizes.append(
+            exchange(
+                f"{url}/{slug}/prizes",
+                [
+                    {"name": "Best Overall", "amount": str(1000 * (i + 1)), "desc": ""},
+                    {"name": "Best Hardware Hack", "amount": None, "desc": "Dev boards"},
+                ],
+            )
+        )
+    list_params = {"filter": "application_open"}
+    return [
+        exchange(url, {"result": items}, {**list_params, "page": 1}),
+        *prizes,
+        exchange(url, {"result": []}, {**list_params, "page": 2}),
+    ]
+
+
+def dorahacks(upcoming=30, ongoing=10, page_size=24):
+    """The upcoming and ongoing lists, then the details of the hackathons without a prize."""
+    url = "https://dorahacks.io/api/hackathon/"
+    exchanges, details = [], []
+    i = 0
+    for status, count in (("upcoming", upcoming), ("ongoing", ongoing)):
+        pages = max(1, -(-count // page_size))
+        for page in range(1, pages + 1):
+            results = []
+            for _ in range(min(page_size, count - (page - 1) * page_size)):
+                start, end = event_dates(i, length=20)
+                results.append(
+                    {
+                        "uname": f"dora-hack-{i}",
+                        "title": f"DoraHacks Buidl {i}",
+                        "start_time": int(datetime.combine(start, datetime.min.time()).timestamp()),
+                        "end_time": int(datetime.combine(end, datetime.min.time()).timestamp()),
+                        "status": 0 if status == "upcoming" else 1,
+                        "participation_form": "Virtual" if i % 3 else "Hybrid",
+                        "venue_name": None if i % 3 else f"{CITIES[i % 4][0]} Hub",
+                        "bonus_price": 10000 + i if i % 2 else None,
+                        "token": "USD",
+                        "field": ",".join(THEMES[i % 3 : i % 3 + 2]),
+                        "image_url": f"https://cdn.dorahacks.io/static/files/{i}.png",
+                    }
+                )
+                if i % 2 == 0:
+                    details.append(
+                        exchange(f"{url}dora-hack-{i}/", {"bonus_price": 5000 + i, "token": "USDT"})
+                    )
+                i += 1
+            next_url = f"{url}?page={page + 1}&page_size={page_size}&status={status}"
+            body = {"results": results, "next": next_url if page < pages else None}
+            if page == 1:
+                params = {"page": 1, "page_size": page_size, "status": status}
+                exchanges.append(exchange(url, body, params))
+            else:
+                exchanges.append(
+                    exchange(f"{url}?page={page}&page_size={page_size}&status={status}", body)
+                )
+    return [*exchanges, *details]
+
+
+def hack2skill(count=300, records=50):
+    """The API's public list, records events per page with the total in totalCount."""
+    events = []
+    for i in range(count):
+        start, end = event_dates(i, length=14)
+        events.append(
+            {
+                "_id": f"65f{i:021x}",
+                "title": f"Hack2Skill Challenge {i}",
+                "registrationStart": utc_iso(start),
+                "registrationEnd": utc_iso(end),
+                "submissionEnd": utc_iso(end + timedelta(days=3)),
+                "mode": ("VIRTUAL", "HYBRID", "OFFLINE")[i % 3],
+                "eventUrl": f"hack2skill-challenge-{i}",
+                "ticket": "free" if i % 2 else "paid",
+                "flag": "featured" if i % 5 == 0 else None,
+                "participation": ("Individual", "Team", "")[i % 3],
+                "thumbnail": f"https://hack2skill.com/thumbnails/{i}.png",
+            }
+        )
+    url = "https://vision.hack2skill.com/api/v1/innovator/public/event/public-list"
+    return [
+        exchange(
+            url,
+            {"success": True, "data": events[first : first + records], "totalCount": count},
+            {"page": first // records + 1, "records": records, "search": ""},
+        )
+        for first in range(0, max(count, 1), records)
+    ]
+
+
+def kaggle(count=50, ended=30, page_size=20, empty_pages=2):
+    """Competitions by latest deadline: the open ones, then ended ones, then empty pages."""
+    url = "https://www.kaggle.com/api/v1/competitions/list"
+    competitions = []
+    for i in range(count + ended):
+        start, end = event_dates(count - i, length=60)
+        if i >= count:
+            start, end = start.replace(year=2020), end.replace(year=2020)
+        competitions.append(
+            {
+                "ref": f"kaggle-challenge-{i}",
+                "title": f"Kaggle Challenge {i}",
+                "url": f"https://www.kaggle.com/competitions/kaggle-challenge-{i}",
+                "category": ("Featured", "Research", "Playground")[i % 3],
+                "reward": f"${(i + 1) * 5000:,}" if i % 3 != 2 else "Swag",
+                "tags": [{"ref": t.lower(), "name": t} for t in THEMES[i % 4 : i % 4 + 2]],
+                "deadline": f"{end}T23:59:00Z",
+                "enabledDate": f"{start}T00:00:00Z",
+                "maxTeamSize": 5,
+            }
+        )
+    pages = -(-len(competitions) // page_size) + empty_pages
+    return [
+        exchange(
+            url,
+            competitions[(page - 1) * page_size : page * page_size],
+            {"category": "all", "sortBy": "latestDeadline", "page": page},
+        )
+        for page in range(1, pages + 1)
+    ]
+
+
+def mlh_season_page(indices):
+    events = []
+    for i in indices:
+        start, end = event_dates(i)
+        city, state = CITIES[i % 4]
+        notes = ("In-Person Only", "Digital Only", "Hybrid: In-Person & Digital")[i % 3]
+        events.append(
+            f"""<div class="event" itemscope itemtype="http://schema.org/Event">
+  <div class="event-wrapper">
+    <a class="event-link" href="https://mlh-hack-{i}.example.com/?utm_source=mlh" target="_blank" itemprop="url">
+      <div class="image-wrap"><img src="https://s3.amazonaws.com/mlh/{i}.png"></div>
+      <h3 class="event-name" itemprop="name">MLH Hack {i}</h3>
+      <p class="event-date">{start:%b %d} - {end:%d}</p>
+      <meta itemprop="startDate" content="{start}">
+      <meta itemprop="endDate" content="{end}">
+      <div class="event-location" itemprop="location" itemscope itemtype="http://schema.org/Place">
+        <span itemprop="city">{city}</span>
+        <span itemprop="state">{state}</span>
+      </div>
+      <div class="event-hybrid-notes"><span>{notes}</span></div>
+    </a>
+  </div>
+</div>"""
+        )
+    html = (
+        "<!DOCTYPE html><html><head><title>MLH Season Events</title></head><body>"
+        '<div class="container feature"><div class="row">'
+        + "\n".join(events)
+        + "</div></div></body></html>"
+    )
+    return html
+
+
+def mlh(count=40, previous_only=10, overlap=5, season=2031):
+    """The next season's page, then the running season's: its own events plus a few shared."""
+    pages = {
+        season: range(count),
+        season - 1: [*range(count, count + previous_only), *range(overlap)],
+    }
+    return [
+        exchange(
+            f"https://mlh.io/seasons/{year}/events",
+            mlh_season_page(indices),
+            content_type="text/html; charset=utf-8",
+        )
+        for year, indices in pages.items()
+    ]
+
+
+FIXTURES = {
+    "Devpost": ("devpost.json.gz", devpost),
+    "Unstop": ("unstop.json.gz", unstop),
+    "Devfolio": ("devfolio.json.gz", devfolio),
+    "DoraHacks": ("dorahacks.json.gz", dorahacks),
+    "Hack2Skill": ("hack2skill.json.gz", hack2skill),
+    "Kaggle": ("kaggle.json.gz", kaggle),
+    "MLH": ("mlh.json.gz", mlh),
+}
+
+
+def main():
+    for source, (filename, build) in FIXTURES.items():
+        exchanges = build()
+        save_fixture(HERE / filename, exchanges, source)
+        print(f"{filename}: {len(exchanges)} responses")
+
+
+if __name__ == "__main__":
+    main()
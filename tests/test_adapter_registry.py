@@ -0,0 +1,25 @@
+import sys
+from types import SimpleNamespace
+
+import adapters
+
+
+def test_lazy_fetcher_imports_adapter_on_first_call(monkeypatch):
+    monkeypatch.delitem(sys.modules, "adapters.ids", raising=False)
+
+    fetch = adapters.lazy_fetcher("adapters.ids:normalize_url")
+
+    assert "adapters.ids" not in sys.modules
+    assert fetch.__name__ == "normalize_url"
+    monkeypatch.setattr(adapters, "load_adapter", lambda target: lambda: [target])
+    assert fetch() == ["adapters.ids:normalize_url"]
+
+
+def test_entry_points_extend_builtin_sources(monkeypatch):
+    plugin = SimpleNamespace(name="Lablab", value="lablab_adapter:fetch")
+    monkeypatch.setattr(adapters, "entry_points", lambda group: [plugin])
+
+    sources = adapters.registered_sources()
+
+    assert sources["Lablab"] == "lablab_adapter:fetch"
+    assert sources["MLH"] == adapters.SOURCES["MLH"]
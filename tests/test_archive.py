@@ -0,0 +1,144 @@
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("bs4")
+pytest.importorskip("pydantic")
+
+from adapters import archive, http
+from adapters.replay import Replayer, load_fixture
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry(monkeypatch):
+    monkeypatch.setattr(http, "_breakers", {})
+    monkeypatch.setattr(http, "_limiters", {})
+
+
+def archive_devpost(root):
+    from adapters.devpost import fetch_devpost_hackathons
+
+    with http.use_transport(Replayer.load(FIXTURES / "devpost.json.gz")):
+        with archive.recording("Devpost", root):
+            return fetch_devpost_hackathons()
+
+
+def exchange(url, text):
+    return {"method": "GET", "url": url, "status": 200, "headers": {}, "text": text}
+
+
+def test_bodies_are_stored_once_by_content(tmp_path):
+    first = archive.store_blob(tmp_path, b'{"hackathons": []}')
+    second = archive.store_blob(tmp_path, b'{"hackathons": []}')
+
+    assert first == second
+    assert len(list((tmp_path / "objects").rglob("*.*"))) == 1
+    assert archive.read_blob(tmp_path, first) == b'{"hackathons": []}'
+
+
+def test_recording_keeps_each_source_run_apart_from_others(tmp_path):
+    archive_devpost(tmp_path)
+    time.sleep(0.001)
+    archive_devpost(tmp_path)
+
+    runs = archive.find_runs(root=tmp_path)
+    assert [run.parent.name for run in runs] == ["Devpost", "Devpost"]
+    exchanges = [e for run in runs for e in load_fixture(run)]
+    # Both runs got the same response for a page, so it was stored once
+    assert len(list((tmp_path / "objects").rglob("*.*"))) == len({e["url"] for e in exchanges})
+    assert len({e["blob"] for e in exchanges}) == len({e["url"] for e in exchanges})
+    assert archive.find_runs(["MLH"], root=tmp_path) == []
+
+
+def test_archived_runs_reparse_offline(tmp_path, monkeypatch):
+    scraped = archive_devpost(tmp_path)
+    [run] = archive.find_runs(root=tmp_path)
+
+    monkeypatch.setattr(http, "send", pytest.fail)
+    reparsed = archive.replay_run(run, tmp_path)
+
+    assert [h.model_dump() for h in reparsed] == [h.model_dump() for h in scraped]
+
+
+def test_reparse_finds_dorahacks_prizes_served_from_the_cache(tmp_path, monkeypatch):
+    from adapters import dorahacks
+
+    monkeypatch.setattr(dorahacks, "DORAHACKS_PRIZE_DETAILS", True)
+    monkeypatch.setattr(dorahacks, "_prize_cache", {})
+    # Online requests are rate limited; these only pretend to reach the site
+    monkeypatch.setattr(http, "_limiters", {"dorahacks.io": http.TokenBucket(1000, 1000)})
+
+    def scrape():
+        replayer = Replayer.load(FIXTURES / "dorahacks.json.gz")
+        # Online, like the live site, so the prize cache is used
+        with http.use_transport(lambda *args, **kwargs: replayer(*args, **kwargs)):
+            with archive.recording("DoraHacks", tmp_path):
+                return dorahacks.fetch_dorahacks_hackathons()
+
+    scrape()
+    time.sleep(0.001)
+    scraped = scrape()  # every prize comes from the cache this time
+    run = archive.find_runs(root=tmp_path)[-1]
+
+    # The cold cache of a reparse process
+    monkeypatch.setattr(dorahacks, "_prize_cache", {})
+    monkeypatch.setattr(http, "send", pytest.fail)
+    reparsed = archive.replay_run(run, tmp_path)
+
+    assert [h.model_dump() for h in reparsed] == [h.model_dump() for h in scraped]
+    assert dorahacks._prize_cache == {}
+
+
+def test_recording_is_off_without_an_archive_dir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    archive_devpost("")
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_reparse_upserts_the_latest_version_of_each_hackathon(tmp_path, monkeypatch):
+    pytest.importorskip("sqlalchemy")
+    import fetch_and_store
+
+    archive_devpost(tmp_path)
+    time.sleep(0.001)
+    archive_devpost(tmp_path)
+    monkeypatch.setattr(archive, "PAYLOAD_ARCHIVE_DIR", str(tmp_path))
+
+    upserted = {}
+
+    def fake_process_source(name, fetch_func, record_changes=True):
+        # Corrections found by a reparse are not announced as updates
+        assert record_changes is False
+        upserted[name] = fetch_func()
+        return []
+
+    monkeypatch.setattr(fetch_and_store, "process_source", fake_process_source)
+    monkeypatch.setattr(fetch_and_store, "deduplicate", lambda new: new)
+    monkeypatch.setattr(http, "send", pytest.fail)
+
+    assert fetch_and_store.reparse() == {"Devpost": 27}
+    assert len(upserted["Devpost"]) == 27
+
+
+def test_prune_deletes_expired_runs_and_the_bodies_only_they_used(tmp_path):
+    old = archive.save_run("Devpost", [exchange("https://devpost.com/1", "old")], tmp_path)
+    kept = archive.save_run("Devpost", [exchange("https://devpost.com/1", "kept")], tmp_path)
+    stale = time.time() - 40 * 24 * 3600
+    for path in (tmp_path / "objects").rglob("*.*"):
+        os.utime(path, (stale, stale))
+    old.rename(old.with_name("20000101T000000000000Z.json.gz"))
+    # Storing a body again, as the next run would, keeps it
+    archive.save_run("MLH", [exchange("https://mlh.io/", "kept")], tmp_path)
+
+    assert archive.prune(30, tmp_path) == 1
+
+    assert archive.find_runs(root=tmp_path)[0] == kept
+    [body] = (tmp_path / "objects").rglob("*.*")
+    assert archive.read_blob(tmp_path, body.name.partition(".")[0]) == b"kept"
+    assert archive.prune(0, tmp_path) == 0
@@ -0,0 +1,65 @@
+from datetime import date
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+from sqlalchemy.orm import Session
+
+from backend import crud
+from backend.db import Base
+from backend.schemas import Hackathon
+
+
+def make_hackathon(**overrides):
+    fields = dict(
+        id="h-1",
+        title="Change Hack",
+        start_date=date(2026, 6, 1),
+        end_date=date(2026, 6, 3),
+        location="Everywhere",
+        url="https://example.com/h-1",
+        mode="Online",
+        status="open",
+        source="devpost",
+        tags=["ai"],
+        prize_pool="- Total: $1,000",
+    )
+    fields.update(overrides)
+    return Hackathon(**fields)
+
+
+def test_upsert_records_field_level_changes(pg_connection):
+    Base.metadata.create_all(pg_connection)
+    db = Session(bind=pg_connection)
+
+    crud.upsert_hackathon(db, make_hackathon())
+    assert crud.get_hackathon_changes(db) == []
+
+    crud.upsert_hackathon(
+        db, make_hackathon(end_date=date(2026, 6, 10), prize_pool="- Total: $5,000")
+    )
+    crud.upsert_hackathon(db, make_hackathon(end_date=date(2026, 6, 10), status="ended"))
+
+    changes = crud.get_hackathon_changes(db)
+    assert [(c.field, c.old_value, c.new_value) for c in changes] == [
+        ("end_date", "2026-06-03", "2026-06-10"),
+        ("prize_pool", "- Total: $1,000", "- Total: $5,000"),
+        ("status", "open", "ended"),
+        ("prize_pool", "- Total: $5,000", "- Total: $1,000"),
+    ]
+    seqs = [c.seq for c in changes]
+    assert seqs == sorted(seqs)
+
+    assert crud.get_hackathon_changes(db, after_seq=seqs[1]) == changes[2:]
+    assert crud.get_latest_change_seq(db) == seqs[-1]
+
+
+def test_change_cursor_roundtrip(pg_connection):
+    Base.metadata.create_all(pg_connection)
+    db = Session(bind=pg_connection)
+
+    assert crud.get_change_cursor(db, "bot") is None
+    crud.set_change_cursor(db, "bot", 5)
+    crud.set_change_cursor(db, "bot", 9)
+
+    assert crud.get_change_cursor(db, "bot") == 9
@@ -0,0 +1,109 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+from sqlalchemy.dialects import postgresql
+
+from backend import crud
+
+
+class RecordingSession:
+    """Captures executed statements and returns canned RETURNING rows."""
+
+    def __init__(self, returned):
+        self.returned = returned
+        self.statements = []
+        self.commits = 0
+
+    def scalars(self, stmt):
+        self.statements.append(stmt)
+        rows = list(self.returned)
+        return SimpleNamespace(all=lambda: rows, first=lambda: rows[0] if rows else None)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+
+def compiled(stmt):
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def test_subscribe_user_is_a_single_upsert_statement():
+    db = RecordingSession(returned=[])
+
+    sub, is_new = crud.subscribe_user(db, 42, "AI")
+
+    assert (sub, is_new) == (None, False)
+    sql = compiled(db.statements[0])
+    assert "ON CONFLICT ON CONSTRAINT unique_user_theme DO NOTHING" in sql
+    assert "RETURNING" in sql
+    assert len(db.statements) == 1
+    assert db.commits == 1
+
+
+def test_subscribe_user_bulk_returns_only_new_themes_in_order():
+    db = RecordingSession(returned=["web3"])
+
+    added = crud.subscribe_user_bulk(db, 42, ["AI", "web3", "AI"])
+
+    assert added == ["web3"]
+    assert len(db.statements) == 1
+    assert "ON CONFLICT" in compiled(db.statements[0])
+
+
+def test_unsubscribe_user_bulk_deletes_in_one_statement():
+    db = RecordingSession(returned=["ai"])
+
+    removed = crud.unsubscribe_user_bulk(db, 42, ["ai", "cloud"])
+
+    assert removed == ["ai"]
+    sql = compiled(db.statements[0])
+    assert sql.startswith("DELETE FROM user_subscriptions")
+    assert "RETURNING user_subscriptions.theme" in sql
+
+
+def test_unsubscribe_user_reports_missing_theme():
+    db = RecordingSession(returned=[])
+
+    assert crud.unsubscribe_user(db, 42, "cloud") is False
+
+
+def test_guild_wants_tags_matches_theme_within_tag():
+    everything = SimpleNamespace(subscribed_themes=[])
+    ai_only = SimpleNamespace(subscribed_themes=["ai"])
+
+    assert crud.guild_wants_tags(everything, [])
+    assert crud.guild_wants_tags(ai_only, ["Generative AI", "Web"])
+    assert not crud.guild_wants_tags(ai_only, ["web3"])
+
+
+def test_active_guilds_for_source_include_guilds_following_everything(pg_connection):
+    from sqlalchemy.orm import Session
+
+    from backend.db import Base
+    from backend.models import GuildConfig
+
+    Base.metadata.create_all(pg_connection)
+    db = Session(bind=pg_connection)
+    db.add_all(
+        [
+            GuildConfig(guild_id="all", channel_id="1", subscribed_platforms=[]),
+            GuildConfig(guild_id="devpost", channel_id="2", subscribed_platforms=["devpost"]),
+            GuildConfig(guild_id="mlh", channel_id="3", subscribed_platforms=["mlh"]),
+            GuildConfig(
+                guild_id="paused",
+                channel_id="4",
+                subscribed_platforms=[],
+                notifications_paused=True,
+            ),
+        ]
+    )
+    db.flush()
+
+    guilds = crud.get_active_guilds_for_source(db, "Devpost")
+
+    assert sorted(guild.guild_id for guild in guilds) == ["all", "devpost"]
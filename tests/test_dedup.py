@@ -0,0 +1,100 @@
+from datetime import date, timedelta
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+from sqlalchemy.orm import Session
+
+from backend import crud
+from backend.db import Base
+from backend.dedup import DedupRecord, choose_canonical, find_duplicate_clusters, url_key
+from backend.schemas import Hackathon
+
+
+def make_record(id, title, source, url="", start=(2026, 5, 1), end=(2026, 5, 3), stored=False):
+    return DedupRecord(id, title, source, url, date(*start), date(*end), stored)
+
+
+def cluster_ids(records):
+    return sorted(sorted(r.id for r in cluster) for cluster in find_duplicate_clusters(records))
+
+
+def test_same_event_on_two_platforms_is_clustered():
+    records = [
+        make_record("mlh-1", "HackMIT 2026", "MLH", "https://hackmit.org"),
+        make_record("dp-1", "HackMIT 2026 Hackathon", "Devpost", "https://hackmit.devpost.com/"),
+        make_record("dp-2", "Climate Code Sprint", "Devpost", "https://climate.devpost.com/"),
+    ]
+
+    assert cluster_ids(records) == [["dp-1", "mlh-1"]]
+
+
+def test_same_source_and_disjoint_dates_are_never_merged():
+    records = [
+        make_record("dp-1", "Global AI Hackathon", "Devpost"),
+        make_record("dp-2", "Global AI Hackathon", "Devpost"),
+        make_record(
+            "df-1", "Global AI Hackathon", "Devfolio", start=(2026, 9, 1), end=(2026, 9, 2)
+        ),
+    ]
+
+    assert cluster_ids(records) == []
+
+
+def test_shared_event_domain_lowers_title_threshold():
+    records = [
+        make_record("mlh-1", "TreeHacks", "MLH", "https://www.treehacks.com/"),
+        make_record("dp-1", "TreeHacks 2026: Stanford", "Devpost", "https://treehacks.devpost.com"),
+    ]
+
+    assert url_key(records[0].url) == url_key(records[1].url) == "treehacks"
+    assert cluster_ids(records) == [["dp-1", "mlh-1"]]
+
+
+def test_url_key_skips_country_suffixes_and_shared_hosts():
+    assert url_key("https://www.hackcambridge.co.uk/") == "hackcambridge"
+    assert url_key("https://hackoxford.co.uk/") == "hackoxford"
+    assert url_key("https://pixelhack.vercel.app/") == "pixelhack"
+    assert url_key("https://devjam.github.io/2026/") == "devjam"
+    assert url_key("https://vercel.app/") is None
+
+
+def test_stored_listing_is_kept_as_canonical():
+    cluster = [
+        make_record("mlh-1", "HackMIT", "MLH"),
+        make_record("dp-1", "HackMIT", "Devpost", stored=True),
+    ]
+
+    assert choose_canonical(cluster).id == "dp-1"
+    assert choose_canonical([r._replace(stored=False) for r in cluster]).id == "mlh-1"
+
+
+def test_duplicates_are_hidden_and_linked_to_canonical(pg_connection):
+    Base.metadata.create_all(pg_connection)
+    db = Session(bind=pg_connection)
+    start = date.today() + timedelta(days=2)
+    for id, source in (("dp-1", "devpost"), ("mlh-1", "mlh"), ("df-1", "devfolio")):
+        crud.upsert_hackathon(
+            db,
+            Hackathon(
+                id=id,
+                title="HackMIT",
+                start_date=start,
+                end_date=start + timedelta(days=2),
+                location="Cambridge",
+                url=f"https://example.com/{id}",
+                mode="Offline",
+                status="open",
+                source=source,
+                tags=["ai"],
+            ),
+        )
+
+    crud.mark_duplicates(db, "mlh-1", ["df-1"])
+    crud.mark_duplicates(db, "dp-1", ["mlh-1"])
+
+    assert crud.get_alternate_listings(db, ["dp-1"]) == {
+        "dp-1": [("devfolio", "https://example.com/df-1"), ("mlh", "https://example.com/mlh-1")]
+    }
+    assert [h.id for h in crud.search_hackathons_page.uncached(db, "ai").items] == ["dp-1"]
+    assert [h.id for h in crud.get_upcoming_hackathons_page.uncached(db, 7).items] == ["dp-1"]
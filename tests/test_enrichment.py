@@ -0,0 +1,211 @@
+import json
+from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("bs4")
+
+from adapters import enrichment, http
+from adapters.enrichment import DetailPage
+from adapters.replay import Replayer
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry(monkeypatch):
+    monkeypatch.setattr(http, "_breakers", {})
+    monkeypatch.setattr(http, "_limiters", {})
+
+
+def detail_page(*json_ld):
+    scripts = "".join(
+        f'<script type="application/ld+json">{json.dumps(data)}</script>' for data in json_ld
+    )
+    return f"<html><head>{scripts}</head><body><p>Not this</p></body></html>"
+
+
+def test_details_come_from_the_json_ld_blocks():
+    html = detail_page(
+        {"@type": "Organization", "name": "Devpost"},
+        {
+            "@graph": [
+                {"@type": "Event", "image": [{"url": "https://cdn.example.com/big.png"}]},
+                {"@type": "WebPage", "description": "  Build   things\nwith AI. "},
+            ]
+        },
+    )
+
+    assert enrichment.extract_details(html) == {
+        "banner_url": "https://cdn.example.com/big.png",
+        "description": "Build things with AI.",
+    }
+    assert enrichment.extract_details("<script type='application/ld+json'>{oops</script>") == {
+        "banner_url": None,
+        "description": None,
+    }
+
+
+def test_detail_pages_are_fetched_conditionally(monkeypatch):
+    sent = []
+
+    def transport(session, method, url, timeout=None, headers=None, **kwargs):
+        sent.append(headers)
+        return SimpleNamespace(status_code=304, headers={})
+
+    page = DetailPage("h-1", "https://hack.devpost.com/", '"abc"', "Mon, 01 Jun 2026 10:00:00 GMT")
+    with http.use_transport(transport):
+        details = enrichment.fetch_details(page)
+
+    assert sent == [
+        {"If-None-Match": '"abc"', "If-Modified-Since": "Mon, 01 Jun 2026 10:00:00 GMT"}
+    ]
+    # Unchanged: only the validators, the stored details stay as they are
+    assert details == {"etag": '"abc"', "last_modified": "Mon, 01 Jun 2026 10:00:00 GMT"}
+
+
+def test_enrich_fetches_each_host_within_its_budget(monkeypatch):
+    monkeypatch.setattr(enrichment, "ENRICH_HOST_BUDGET", 2)
+    pages = [DetailPage(f"d-{i}", f"https://hack{i}.devpost.com/") for i in range(3)]
+    pages.append(DetailPage("m-0", "https://mlh-hack.example.com/"))
+    exchanges = [
+        {
+            "method": "GET",
+            "url": page.url,
+            "status": 200,
+            "headers": {"ETag": f'"{page.hackathon_id}"'},
+            "text": detail_page({"image": f"https://cdn.example.com/{page.hackathon_id}.png"}),
+        }
+        for page in pages
+    ]
+
+    with http.use_transport(Replayer(exchanges)):
+        results = enrichment.enrich(pages)
+
+    assert set(results) == {"d-0", "d-1", "m-0"}
+    assert results["m-0"] == {
+        "etag": '"m-0"',
+        "last_modified": None,
+        "banner_url": "https://cdn.example.com/m-0.png",
+        "description": None,
+    }
+
+
+def test_failed_pages_are_reported_without_tripping_the_list_api_breaker(monkeypatch):
+    monkeypatch.setattr(enrichment, "ENRICH_CONCURRENCY", 1)
+    pages = [DetailPage("ok", "https://ok.devpost.com/"), DetailPage("gone", "")]
+    pages += [DetailPage(f"down-{i}", f"https://down{i}.devpost.com/") for i in range(6)]
+    exchanges = [
+        {"method": "GET", "url": "https://ok.devpost.com/", "status": 200, "text": detail_page()}
+    ]
+    exchanges += [
+        {"method": "GET", "url": page.url, "status": 503, "text": ""} for page in pages[2:]
+    ]
+
+    replayer = Replayer(exchanges)
+    # Replays leave breakers alone; these only pretend to reach the site
+    monkeypatch.setattr(http, "_limiters", {"devpost.com": http.TokenBucket(1000, 1000)})
+
+    def live_site(session, method, url, **kwargs):
+        return replayer(session, method, url, **kwargs)
+
+    with http.use_transport(live_site):
+        results = enrichment.enrich(pages)
+
+    assert results["ok"]["banner_url"] is None
+    assert results["gone"] is None
+    assert [results[f"down-{i}"] for i in range(5)] == [None] * 5
+    # The fifth failure opened the detail pages' own breaker, so down-5 was not tried
+    assert "down-5" not in results
+    assert http.breaker_for("details:devpost.com").is_open()
+    assert not http.breaker_for("devpost.com").is_open()
+
+
+def test_an_unexpected_error_fails_only_its_page(monkeypatch):
+    pages = [DetailPage(f"h-{i}", f"https://h{i}.devpost.com/") for i in range(3)]
+    exchanges = [
+        {"method": "GET", "url": page.url, "status": 200, "text": page.hackathon_id}
+        for page in pages
+    ]
+    real_extract = enrichment.extract_details
+
+    def extract_details(html):
+        if html == "h-1":
+            raise TypeError("unexpected JSON-LD shape")
+        return real_extract(detail_page())
+
+    monkeypatch.setattr(enrichment, "extract_details", extract_details)
+    with http.use_transport(Replayer(exchanges)):
+        results = enrichment.enrich(pages)
+
+    assert results["h-1"] is None
+    assert results["h-0"] is not None and results["h-2"] is not None
+
+
+def test_enrichments_are_stored_and_survive_the_next_scrape(pg_connection):
+    pytest.importorskip("sqlalchemy")
+    from sqlalchemy.orm import Session
+
+    from backend import crud
+    from backend.db import Base
+    from backend.schemas import Hackathon
+
+    Base.metadata.create_all(pg_connection)
+    db = Session(bind=pg_connection)
+    start = date.today() + timedelta(days=5)
+    hackathons = [
+        Hackathon(
+            id=f"h-{i}",
+            title=f"Hack {i}",
+            start_date=start,
+            end_date=start + timedelta(days=2),
+            location="Everywhere",
+            url=f"https://hack{i}.devpost.com/",
+            mode="Online",
+            status="open",
+            source="devpost",
+            banner_url=f"https://cdn.example.com/thumb-{i}.png",
+        )
+        for i in range(2)
+    ]
+    for hackathon in hackathons:
+        crud.upsert_hackathon(db, hackathon)
+
+    now = datetime.now(timezone.utc)
+    assert [row.id for row in crud.get_enrichment_candidates(db, now, 10)] == ["h-0", "h-1"]
+
+    crud.save_enrichments(
+        db,
+        [
+            {
+                "id": "h-0",
+                "enriched_at": now,
+                "detail_etag": '"v1"',
+                "detail_last_modified": None,
+                "description": "Build things with AI.",
+                "detail_banner_url": "https://cdn.example.com/big-0.png",
+            },
+            {"id": "h-1", "enriched_at": now, "detail_etag": '"v1"', "detail_last_modified": None},
+        ],
+    )
+    assert crud.get_enrichment_candidates(db, now, 10) == []
+    later = now + timedelta(days=1)
+    crud.save_enrichments(
+        db, [{"id": "h-1", "enrich_failures": 1, "enrich_retry_at": now + timedelta(hours=1)}]
+    )
+    # h-1 failed on its last fetch and waits for its retry time
+    assert [row.id for row in crud.get_enrichment_candidates(db, later, 10)] == ["h-0"]
+    crud.save_enrichments(db, [{"id": "h-1", "enrich_retry_at": now - timedelta(seconds=1)}])
+    candidates = crud.get_enrichment_candidates(db, later, 10)
+    assert sorted((row.id, row.enrich_failures) for row in candidates) == [
+        ("h-0", None),
+        ("h-1", 1),
+    ]
+    assert [row.id for row in crud.get_enrichment_candidates(db, later, 1)] == ["h-0"]
+    assert [row.id for row in crud.search_hackathons_page.uncached(db, "with ai").items] == ["h-0"]
+
+    crud.upsert_hackathon(db, hackathons[0])
+    crud.upsert_hackathon(db, hackathons[1])
+    stored = {h.id: h for h in crud.get_hackathons_by_ids(db, ["h-0", "h-1"])}
+    assert stored["h-0"].banner_url == "https://cdn.example.com/big-0.png"
+    assert stored["h-1"].banner_url == "https://cdn.example.com/thumb-1.png"
@@ -1,5 +1,9 @@
 import importlib
 import sys
+import threading
+import time
+from contextlib import nullcontext
+from datetime import date
 from types import SimpleNamespace
 
 import pytest
@@ -9,14 +13,159 @@ from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.sql.schema import MetaData
 
 
+def make_session():
+    return SimpleNamespace(
+        rollback=lambda: None,
+        close=lambda: None,
+        commit=lambda: None,
+        begin_nested=nullcontext,
+    )
+
+
 def load_fetch_and_store(monkeypatch):
-    # fetch_and_store calls Base.metadata.create_all(...) at import time.
-    # Patch it to keep tests independent from a running Postgres instance.
-    monkeypatch.setattr(MetaData, "create_all", lambda _self, bind=None: None)
     sys.modules.pop("fetch_and_store", None)
     return importlib.import_module("fetch_and_store")
 
 
+def test_import_loads_no_adapters_and_creates_no_tables(monkeypatch):
+    from adapters import SOURCES
+
+    adapter_modules = {target.partition(":")[0] for target in SOURCES.values()}
+    calls = []
+    monkeypatch.setattr(MetaData, "create_all", lambda _self, bind=None: calls.append(bind))
+    for name in adapter_modules:
+        monkeypatch.delitem(sys.modules, name, raising=False)
+
+    load_fetch_and_store(monkeypatch)
+
+    assert calls == []
+    assert not adapter_modules & set(sys.modules)
+
+
+def patch_run_side_effects(fetch_and_store, monkeypatch, summaries):
+    monkeypatch.setattr(fetch_and_store, "load_circuit_breakers", lambda: None)
+    monkeypatch.setattr(fetch_and_store, "store_circuit_breakers", lambda breakers: None)
+    monkeypatch.setattr(fetch_and_store, "update_source_schedules", lambda stats: None)
+    monkeypatch.setattr(fetch_and_store, "record_scrape_run", summaries.append)
+    monkeypatch.setattr(fetch_and_store, "deduplicate", lambda new: new)
+    monkeypatch.setattr(fetch_and_store, "start_enrichment", lambda: None)
+
+
+def test_run_uses_registered_sources(monkeypatch):
+    fetch_and_store = load_fetch_and_store(monkeypatch)
+    hack = SimpleNamespace(id="1")
+    processed = []
+    summaries = []
+
+    def fake_process_source(name, fetch_func, stats, deadline):
+        processed.append(name)
+        stats.update(status="ok", ok=True, new=1, activity=1, duration=0.5)
+        return fetch_func()
+
+    monkeypatch.setattr(
+        fetch_and_store, "registered_sources", lambda: {"Fake": "fake:fetch", "Quiet": "q:f"}
+    )
+    monkeypatch.setattr(fetch_and_store, "due_sources", lambda names: ["Fake"])
+    monkeypatch.setattr(fetch_and_store, "lazy_fetcher", lambda target: lambda: [hack])
+    monkeypatch.setattr(fetch_and_store, "process_source", fake_process_source)
+    patch_run_side_effects(fetch_and_store, monkeypatch, summaries)
+
+    assert fetch_and_store.run(due_only=True) == [hack]
+    assert processed == ["Fake"]
+    assert summaries[0]["sources"] == {
+        "Fake": {"status": "ok", "ok": True, "new": 1, "activity": 1, "duration": 0.5}
+    }
+
+
+def test_run_skips_sources_with_an_open_circuit_breaker(monkeypatch):
+    fetch_and_store = load_fetch_and_store(monkeypatch)
+    processed = []
+    summaries = []
+    breaker = fetch_and_store.http.CircuitBreaker(failure_threshold=1)
+    breaker.record_failure()
+
+    def fake_process_source(name, fetch_func, stats, deadline):
+        processed.append(name)
+        stats.update(status="ok", ok=True, new=0, activity=0, duration=0.1)
+        return []
+
+    monkeypatch.setattr(
+        fetch_and_store, "registered_sources", lambda: {"Unstop": "u:f", "MLH": "m:f"}
+    )
+    monkeypatch.setitem(fetch_and_store.http._breakers, "unstop.com", breaker)
+    monkeypatch.setattr(fetch_and_store, "process_source", fake_process_source)
+    patch_run_side_effects(fetch_and_store, monkeypatch, summaries)
+
+    assert fetch_and_store.run() == []
+    assert processed == ["MLH"]
+    assert summaries[0]["sources"]["Unstop"]["status"] == "circuit_open"
+    assert summaries[0]["breakers"]["unstop.com"]["state"] == "open"
+    assert fetch_and_store.last_run_summary is summaries[0]
+
+
+def test_run_returns_finished_sources_when_the_deadline_passes(monkeypatch):
+    fetch_and_store = load_fetch_and_store(monkeypatch)
+    summaries = []
+    release = threading.Event()
+    hack = SimpleNamespace(id="1")
+
+    def fake_process_source(name, fetch_func, stats, deadline):
+        stats.update(status="failed", ok=False, new=0, activity=0, duration=0.0)
+        if name == "Stalled":
+            release.wait(5)
+            return [SimpleNamespace(id="late")]
+        stats.update(status="ok", ok=True, new=1, activity=1, duration=0.1)
+        return [hack]
+
+    monkeypatch.setattr(
+        fetch_and_store, "registered_sources", lambda: {"Fast": "f:f", "Stalled": "s:f"}
+    )
+    monkeypatch.setattr(fetch_and_store, "process_source", fake_process_source)
+    patch_run_side_effects(fetch_and_store, monkeypatch, summaries)
+
+    started = time.monotonic()
+    try:
+        assert fetch_and_store.run(deadline_seconds=0.2) == [hack]
+    finally:
+        release.set()
+
+    assert time.monotonic() - started < 2
+    sources = summaries[0]["sources"]
+    assert sources["Fast"]["status"] == "ok"
+    assert sources["Stalled"]["status"] == "timed_out"
+
+
+def test_process_source_does_not_commit_after_the_deadline(monkeypatch):
+    fetch_and_store = load_fetch_and_store(monkeypatch)
+    commits = []
+    deadline = fetch_and_store.http.Deadline(60)
+
+    def slow_fetch():
+        deadline.cancel()  # the run gave up while this source was fetching
+        return [SimpleNamespace(id="1")]
+
+    def fake_session_local():
+        session = make_session()
+        session.commit = lambda: commits.append(True)
+        return session
+
+    monkeypatch.setattr(fetch_and_store, "SessionLocal", fake_session_local)
+    monkeypatch.setattr(fetch_and_store, "upsert_hackathon", pytest.fail)
+
+    stats = {}
+    assert fetch_and_store.process_source("Slow", slow_fetch, stats, deadline) == []
+    assert commits == []
+    assert stats["status"] == "timed_out"
+
+
+def test_run_skips_everything_when_no_source_is_due(monkeypatch):
+    fetch_and_store = load_fetch_and_store(monkeypatch)
+    monkeypatch.setattr(fetch_and_store, "due_sources", lambda names: [])
+    monkeypatch.setattr(fetch_and_store, "process_source", pytest.fail)
+
+    assert fetch_and_store.run(due_only=True) == []
+
+
 def test_process_source_returns_only_new_hackathons(monkeypatch):
     fetch_and_store = load_fetch_and_store(monkeypatch)
     sessions = []
@@ -24,20 +173,43 @@ def test_process_source_returns_only_new_hackathons(monkeypatch):
     hacks = [SimpleNamespace(id="1"), SimpleNamespace(id="2"), SimpleNamespace(id="3")]
 
     def fake_session_local():
-        session = SimpleNamespace(rollback=lambda: None, close=lambda: None)
+        session = make_session()
         sessions.append(session)
         return session
 
-    def fake_upsert(_db, _hack):
+    def fake_upsert(_db, _hack, commit=True, changes=None):
+        assert commit is False
         return upsert_results.pop(0)
 
     monkeypatch.setattr(fetch_and_store, "SessionLocal", fake_session_local)
     monkeypatch.setattr(fetch_and_store, "upsert_hackathon", fake_upsert)
+    monkeypatch.setattr(fetch_and_store, "append_hackathon_changes", lambda _db, _changes: None)
 
-    result = fetch_and_store.process_source("TestSource", lambda: hacks)
+    stats = {}
+    result = fetch_and_store.process_source("TestSource", lambda: hacks, stats)
 
     assert [h.id for h in result] == ["1", "3"]
     assert len(sessions) == 1
+    assert stats["ok"] is True
+    assert stats["activity"] == 2
+
+
+def test_process_source_can_leave_the_change_log_alone(monkeypatch):
+    fetch_and_store = load_fetch_and_store(monkeypatch)
+
+    def fake_upsert(_db, hack, commit=True, changes=None):
+        changes.append({"hackathon_id": hack.id, "field": "prize_pool"})
+        return object(), False
+
+    monkeypatch.setattr(fetch_and_store, "SessionLocal", make_session)
+    monkeypatch.setattr(fetch_and_store, "upsert_hackathon", fake_upsert)
+    monkeypatch.setattr(fetch_and_store, "append_hackathon_changes", pytest.fail)
+
+    stats = {}
+    hacks = [SimpleNamespace(id="1")]
+    fetch_and_store.process_source("Reparsed", lambda: hacks, stats, record_changes=False)
+
+    assert stats["ok"] is True
 
 
 def test_process_source_retries_on_database_error(monkeypatch):
@@ -48,7 +220,7 @@ def test_process_source_retries_on_database_error(monkeypatch):
     hack = SimpleNamespace(id="10")
 
     def fake_session_local():
-        session = SimpleNamespace(rollback=lambda: None, close=lambda: None)
+        session = make_session()
         sessions.append(session)
         return session
 
@@ -59,7 +231,11 @@ def test_process_source_retries_on_database_error(monkeypatch):
         return [hack]
 
     monkeypatch.setattr(fetch_and_store, "SessionLocal", fake_session_local)
-    monkeypatch.setattr(fetch_and_store, "upsert_hackathon", lambda _db, _h: (object(), True))
+    monkeypatch.setattr(
+        fetch_and_store,
+        "upsert_hackathon",
+        lambda _db, _h, commit=True, changes=None: (object(), True),
+    )
     monkeypatch.setattr(fetch_and_store.time, "sleep", lambda seconds: sleeps.append(seconds))
 
     result = fetch_and_store.process_source("TestSource", flaky_fetch)
@@ -81,10 +257,179 @@ def test_process_source_does_not_retry_on_non_database_error(monkeypatch):
     monkeypatch.setattr(
         fetch_and_store,
         "SessionLocal",
-        lambda: SimpleNamespace(rollback=lambda: None, close=lambda: None),
+        make_session,
     )
 
     result = fetch_and_store.process_source("TestSource", fake_fetch)
 
     assert result == []
     assert attempts["count"] == 1
+
+
+def test_process_source_reports_a_source_without_credentials(monkeypatch):
+    fetch_and_store = load_fetch_and_store(monkeypatch)
+    stats = {}
+
+    def fetch():
+        raise fetch_and_store.SourceNotConfiguredError("credentials missing")
+
+    monkeypatch.setattr(fetch_and_store, "SessionLocal", make_session)
+
+    assert fetch_and_store.process_source("Kaggle", fetch, stats) == []
+    assert (stats["status"], stats["ok"]) == ("not_configured", False)
+
+
+def test_process_source_commits_once_and_isolates_bad_rows(monkeypatch):
+    fetch_and_store = load_fetch_and_store(monkeypatch)
+    commits = []
+    savepoints = []
+    executed = []
+    hacks = [SimpleNamespace(id="1"), SimpleNamespace(id="2"), SimpleNamespace(id="3")]
+
+    def fake_session_local():
+        session = make_session()
+        session.commit = lambda: commits.append(True)
+        session.execute = lambda stmt: executed.append(str(stmt))
+
+        def begin_nested():
+            savepoints.append(True)
+            return nullcontext()
+
+        session.begin_nested = begin_nested
+        return session
+
+    def fake_upsert(_db, hack, commit=True, changes=None):
+        if hack.id == "2":
+            raise SQLAlchemyError("bad row")
+        return object(), True
+
+    monkeypatch.setattr(fetch_and_store, "SessionLocal", fake_session_local)
+    monkeypatch.setattr(fetch_and_store, "upsert_hackathon", fake_upsert)
+    monkeypatch.setattr(fetch_and_store, "append_hackathon_changes", lambda _db, _changes: None)
+    monkeypatch.setattr(fetch_and_store, "INGEST_SYNCHRONOUS_COMMIT", "off")
+
+    result = fetch_and_store.process_source("TestSource", lambda: hacks)
+
+    assert [h.id for h in result] == ["1", "3"]
+    assert len(commits) == 1
+    assert len(savepoints) == 3
+    assert executed == ["SET LOCAL synchronous_commit TO OFF"]
+
+
+def test_deduplicate_links_new_listing_to_stored_event(monkeypatch):
+    fetch_and_store = load_fetch_and_store(monkeypatch)
+    marked = []
+    stored = SimpleNamespace(
+        id="dp-1",
+        title="HackMIT 2026",
+        source="Devpost",
+        url="https://hackmit.devpost.com",
+        start_date=date(2026, 5, 1),
+        end_date=date(2026, 5, 3),
+    )
+    new = [
+        SimpleNamespace(
+            id="mlh-1",
+            title="HackMIT",
+            source="MLH",
+            url="https://hackmit.org",
+            start_date=date(2026, 5, 1),
+            end_date=date(2026, 5, 2),
+        ),
+        SimpleNamespace(
+            id="df-1",
+            title="Build for Bharat",
+            source="Devfolio",
+            url="https://bharat.devfolio.co",
+            start_date=date(2026, 5, 2),
+            end_date=date(2026, 5, 4),
+        ),
+    ]
+
+    monkeypatch.setattr(fetch_and_store, "SessionLocal", make_session)
+    monkeypatch.setattr(fetch_and_store, "get_dedup_candidates", lambda _db, _start, _end: [stored])
+    monkeypatch.setattr(
+        fetch_and_store,
+        "mark_duplicates",
+        lambda _db, canonical_id, ids, commit=True: marked.append((canonical_id, ids)),
+    )
+
+    result = fetch_and_store.deduplicate(new)
+
+    assert [h.id for h in result] == ["df-1"]
+    assert marked == [("dp-1", ["mlh-1"])]
+
+
+def test_enrich_pending_stores_details_only_for_changed_pages(monkeypatch):
+    fetch_and_store = load_fetch_and_store(monkeypatch)
+    saved = []
+    monkeypatch.setattr(fetch_and_store, "SessionLocal", make_session)
+    monkeypatch.setattr(
+        fetch_and_store,
+        "get_enrichment_candidates",
+        lambda _db, _stale_before, _limit: [
+            ("changed", "https://a.devpost.com/", None, None),
+            ("unchanged", "https://b.devpost.com/", '"v1"', None),
+        ],
+    )
+    monkeypatch.setattr(
+        fetch_and_store.enrichment,
+        "enrich",
+        lambda pages: {
+            "changed": {
+                "etag": '"v2"',
+                "last_modified": None,
+                "banner_url": "https://cdn.example.com/a.png",
+                "description": "About a",
+            },
+            "unchanged": {"etag": '"v1"', "last_modified": None},
+        },
+    )
+    monkeypatch.setattr(fetch_and_store, "save_enrichments", lambda _db, rows: saved.extend(rows))
+
+    assert fetch_and_store.enrich_pending() == 2
+    changed, unchanged = saved
+    assert changed["detail_banner_url"] == "https://cdn.example.com/a.png"
+    assert changed["description"] == "About a"
+    assert set(unchanged) == {
+        "id",
+        "enriched_at",
+        "detail_etag",
+        "detail_last_modified",
+        "enrich_failures",
+        "enrich_retry_at",
+    }
+    assert unchanged["enrich_failures"] is None
+
+
+def test_enrich_pending_backs_off_from_failing_pages(monkeypatch):
+    fetch_and_store = load_fetch_and_store(monkeypatch)
+    saved = []
+    monkeypatch.setattr(fetch_and_store, "SessionLocal", make_session)
+    monkeypatch.setattr(fetch_and_store, "ENRICH_RETRY_SECONDS", 3600)
+    monkeypatch.setattr(
+        fetch_and_store,
+        "get_enrichment_candidates",
+        lambda _db, _stale_before, _limit: [
+            ("new", "https://a.devpost.com/", None, None, None),
+            ("again", "https://b.devpost.com/", None, None, 3),
+            ("for-ever", "", None, None, 20),
+        ],
+    )
+    monkeypatch.setattr(
+        fetch_and_store.enrichment,
+        "enrich",
+        lambda pages: dict.fromkeys(["new", "again", "for-ever"]),
+    )
+    monkeypatch.setattr(fetch_and_store, "save_enrichments", lambda _db, rows: saved.extend(rows))
+
+    assert fetch_and_store.enrich_pending() == 0
+
+    rows = {row["id"]: row for row in saved}
+    assert [rows[i]["enrich_failures"] for i in ("new", "again", "for-ever")] == [1, 4, 21]
+    assert all("enriched_at" not in row for row in saved)
+    retry_in = {i: row["enrich_retry_at"] - fetch_and_store.utcnow() for i, row in rows.items()}
+    assert 3500 < retry_in["new"].total_seconds() <= 3600
+    assert 8 * 3500 < retry_in["again"].total_seconds() <= 8 * 3600
+    # Never longer than the refresh interval of pages that work
+    assert retry_in["for-ever"].total_seconds() <= fetch_and_store.ENRICH_REFRESH_SECONDS
@@ -0,0 +1,163 @@
+from types import SimpleNamespace
+
+import pytest
+
+requests = pytest.importorskip("requests")
+
+from adapters import http
+
+
+class FakeSession:
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.calls = 0
+        self.timeouts = []
+
+    def request(self, method, url, timeout=None, **kwargs):
+        self.calls += 1
+        self.timeouts.append(timeout)
+        status = self.statuses.pop(0)
+        if status is None:
+            raise requests.exceptions.ConnectTimeout("timed out")
+        return SimpleNamespace(status_code=status)
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry(monkeypatch):
+    monkeypatch.setattr(http, "_breakers", {})
+    monkeypatch.setattr(http, "_limiters", {})
+
+
+def test_breaker_opens_after_consecutive_failures_and_fails_fast(monkeypatch):
+    monkeypatch.setattr(http, "BREAKER_FAILURE_THRESHOLD", 2)
+    http._breakers["unstop.com"] = http.CircuitBreaker(failure_threshold=2)
+    session = FakeSession([503, None])
+
+    assert http.get("https://unstop.com/api", session=session).status_code == 503
+    with pytest.raises(requests.exceptions.ConnectTimeout):
+        http.get("https://unstop.com/api", session=session)
+    with pytest.raises(http.CircuitOpenError):
+        http.get("https://unstop.com/api?page=2", session=session)
+
+    assert session.calls == 2
+    assert http.export_breakers()["unstop.com"]["state"] == http.OPEN
+
+
+def test_replayed_failures_leave_the_breaker_alone():
+    http._breakers["unstop.com"] = http.CircuitBreaker(failure_threshold=1)
+
+    def replay(session, method, url, **kwargs):
+        if "page=2" in url:
+            raise requests.exceptions.ConnectionError("not recorded")
+        return SimpleNamespace(status_code=503)
+
+    replay.offline = True
+    with http.use_transport(replay):
+        assert http.get("https://unstop.com/api").status_code == 503
+        with pytest.raises(requests.exceptions.ConnectionError):
+            http.get("https://unstop.com/api?page=2")
+        assert http.get("https://unstop.com/api").status_code == 503
+
+    assert http._breakers["unstop.com"].state == http.CLOSED
+    assert "unstop.com" not in http._limiters
+
+
+def test_half_open_probe_closes_or_reopens(monkeypatch):
+    now = {"t": 1000.0}
+    monkeypatch.setattr(http.time, "time", lambda: now["t"])
+    breaker = http.CircuitBreaker(failure_threshold=1, recovery_seconds=60)
+    http._breakers["dorahacks.io"] = breaker
+    breaker.record_failure()
+
+    now["t"] += 61
+    assert breaker.allow_request()
+    assert not breaker.allow_request()  # only one probe at a time
+    breaker.record_failure()
+    assert breaker.is_open()
+
+    now["t"] += 61
+    session = FakeSession([200])
+    http.get("https://dorahacks.io/api/hackathon/", session=session)
+    assert breaker.state == http.CLOSED and breaker.failures == 0
+
+
+def test_breaker_state_survives_a_restart():
+    http._breakers["mlh.io"] = http.CircuitBreaker(failure_threshold=1)
+    http._breakers["mlh.io"].record_failure()
+    exported = http.export_breakers()
+
+    http._breakers.clear()
+    http.restore_breakers(exported)
+
+    assert http.breaker_for("mlh.io").is_open()
+
+
+def test_token_bucket_spaces_requests_after_the_burst(monkeypatch):
+    now = {"t": 0.0}
+    sleeps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        now["t"] += seconds
+
+    monkeypatch.setattr(http.time, "monotonic", lambda: now["t"])
+    monkeypatch.setattr(http.time, "sleep", fake_sleep)
+    bucket = http.TokenBucket(rate=2, capacity=2)
+
+    for _ in range(4):
+        bucket.acquire()
+
+    assert sleeps == [0.5, 0.5]
+
+
+def test_requests_stop_at_the_run_deadline():
+    session = FakeSession([200])
+    deadline = http.Deadline(30)
+
+    with http.deadline_scope(deadline):
+        http.get("https://devpost.com/api/hackathons", session=session, timeout=60)
+        deadline.cancel()
+        with pytest.raises(http.RunCancelledError):
+            http.get("https://devpost.com/api/hackathons?page=2", session=session)
+
+    assert session.calls == 1
+    assert session.timeouts[0] <= 30
+    # Running out of time is not held against the host
+    assert http.breaker_for("devpost.com").failures == 0
+
+
+def test_submit_carries_the_deadline_into_worker_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    deadline = http.Deadline(30)
+    with http.deadline_scope(deadline), ThreadPoolExecutor(max_workers=1) as executor:
+        assert http.submit(executor, http._deadline.get).result() is deadline
+        assert executor.submit(http._deadline.get).result() is None
+
+
+def test_subdomains_share_a_host_key():
+    assert http.host_key("https://hackmit.devpost.com/") == "devpost.com"
+    assert http.host_key("https://api.devfolio.co/api/hackathons") == "devfolio.co"
+
+
+def test_circuit_breaker_roundtrip(pg_connection):
+    from datetime import datetime, timezone
+
+    from sqlalchemy.orm import Session
+
+    from backend import crud
+    from backend.db import Base
+
+    Base.metadata.create_all(pg_connection)
+    db = Session(bind=pg_connection)
+    opened_at = datetime(2026, 6, 1, 12, tzinfo=timezone.utc)
+
+    crud.save_circuit_breakers(
+        db, [{"host": "unstop.com", "state": http.OPEN, "failures": 5, "opened_at": opened_at}]
+    )
+    crud.save_circuit_breakers(
+        db, [{"host": "unstop.com", "state": http.CLOSED, "failures": 0, "opened_at": None}]
+    )
+
+    row = crud.get_circuit_breakers(db)["unstop.com"]
+    assert (row.state, row.failures, row.opened_at) == (http.CLOSED, 0, None)
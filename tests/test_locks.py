@@ -0,0 +1,67 @@
+import asyncio
+import uuid
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("apscheduler")
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+from backend.locks import LeaderElection, leader_only
+
+
+def run_replicas(replicas, seconds):
+    """Run one AsyncIOScheduler per replica, each ticking its leader_only job every 50 ms."""
+
+    async def main():
+        schedulers = []
+        for election, runs in replicas:
+
+            async def job(runs=runs):
+                runs.append(1)
+
+            scheduler = AsyncIOScheduler()
+            scheduler.add_job(leader_only(election)(job), "interval", seconds=0.05)
+            scheduler.start()
+            schedulers.append(scheduler)
+        await asyncio.sleep(seconds)
+        for scheduler in schedulers:
+            scheduler.shutdown(wait=False)
+
+    asyncio.run(main())
+
+
+def test_only_one_replica_runs_scheduled_jobs_and_the_other_takes_over(pg_engine):
+    name = f"test-scrape-{uuid.uuid4().hex}"
+    first, second = LeaderElection(name, pg_engine), LeaderElection(name, pg_engine)
+    first_runs, second_runs = [], []
+    assert first.acquire()
+
+    run_replicas([(first, first_runs), (second, second_runs)], seconds=0.5)
+
+    assert len(first_runs) >= 3
+    assert second_runs == []
+    assert first.is_leader and not second.is_leader
+
+    # The leader goes away: its lock is released and the other replica takes over
+    first.release()
+    first_runs.clear()
+    run_replicas([(second, second_runs)], seconds=0.3)
+
+    assert len(second_runs) >= 2
+    assert not first.acquire()
+    second.release()
+
+
+def test_dropped_leader_connection_releases_the_lock(pg_engine):
+    name = f"test-scrape-{uuid.uuid4().hex}"
+    first, second = LeaderElection(name, pg_engine), LeaderElection(name, pg_engine)
+    assert first.acquire()
+    assert not second.acquire()
+
+    # Simulates the leader process dying: PostgreSQL ends its session
+    first._conn.invalidate()
+    first._conn = None
+
+    assert second.acquire()
+    second.release()
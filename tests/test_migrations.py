@@ -0,0 +1,87 @@
+import pytest
+
+pytest.importorskip("sqlalchemy")
+from sqlalchemy import inspect, text
+
+from backend.migrations import (
+    add_missing_columns,
+    create_missing_indexes,
+    migrate_guild_config_types,
+)
+
+
+def test_guild_config_string_columns_are_converted(pg_connection):
+    pg_connection.execute(
+        text(
+            """
+            CREATE TABLE guild_configs (
+                guild_id VARCHAR PRIMARY KEY,
+                channel_id VARCHAR NOT NULL,
+                subscribed_platforms VARCHAR DEFAULT 'all',
+                subscribed_themes VARCHAR DEFAULT 'all',
+                notifications_paused VARCHAR DEFAULT 'false'
+            )
+            """
+        )
+    )
+    pg_connection.execute(
+        text(
+            """
+            INSERT INTO guild_configs VALUES
+                ('1', '1', 'all', 'all', 'false'),
+                ('2', '2', 'Devpost,mlh', 'ai, Web3 ,', 'true'),
+                ('3', '3', NULL, '', NULL)
+            """
+        )
+    )
+
+    assert migrate_guild_config_types(pg_connection) is True
+    assert migrate_guild_config_types(pg_connection) is False
+
+    rows = pg_connection.execute(
+        text(
+            "SELECT guild_id, subscribed_platforms, subscribed_themes, notifications_paused "
+            "FROM guild_configs ORDER BY guild_id"
+        )
+    ).all()
+    assert [tuple(row) for row in rows] == [
+        ("1", [], [], False),
+        ("2", ["devpost", "mlh"], ["ai", "web3"], True),
+        ("3", [], [], False),
+    ]
+
+
+def test_columns_added_to_existing_tables(pg_connection):
+    pg_connection.execute(
+        text(
+            """
+            CREATE TABLE hackathons (
+                id VARCHAR PRIMARY KEY, title VARCHAR NOT NULL, start_date DATE NOT NULL,
+                end_date DATE NOT NULL, location VARCHAR NOT NULL, url VARCHAR NOT NULL,
+                mode VARCHAR NOT NULL, status VARCHAR NOT NULL, source VARCHAR NOT NULL,
+                tags TEXT, banner_url VARCHAR, prize_pool VARCHAR, team_size VARCHAR,
+                eligibility VARCHAR
+            )
+            """
+        )
+    )
+
+    assert add_missing_columns(pg_connection) is True
+    assert add_missing_columns(pg_connection) is False
+
+    columns = {column["name"] for column in inspect(pg_connection).get_columns("hackathons")}
+    assert "duplicate_of" in columns
+
+
+def test_indexes_added_to_existing_tables(pg_connection):
+    from backend.db import Base
+    from backend.models import GuildConfig
+
+    Base.metadata.create_all(pg_connection, tables=[GuildConfig.__table__])
+    pg_connection.execute(text("DROP INDEX idx_guild_configs_all_platforms"))
+
+    assert create_missing_indexes(pg_connection) is True
+    assert create_missing_indexes(pg_connection) is False
+
+    indexes = {index["name"] for index in inspect(pg_connection).get_indexes("guild_configs")}
+    assert "idx_guild_configs_all_platforms" in indexes
@@ -0,0 +1,202 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("bs4")
+pytest.importorskip("cloudscraper")
+
+import requests
+from bs4 import BeautifulSoup
+
+from adapters import http, mlh
+from adapters.replay import decode_body, load_fixture
+
+FIXTURE = Path(__file__).resolve().parent / "fixtures" / "mlh.json.gz"
+
+
+@pytest.fixture
+def season_page():
+    return decode_body(load_fixture(FIXTURE)[0]).decode("utf-8")
+
+
+def parse(html, fast):
+    return [row for row in map(mlh.parse_event, mlh.find_event_divs(html, fast)) if row]
+
+
+def parse_with_finds(html):
+    """The previous implementation: full html.parser tree and a find() per field."""
+    results = []
+    for event in BeautifulSoup(html, "html.parser").find_all("div", class_="event"):
+        name_tag = event.find("h3", class_="event-name")
+        link_tag = event.find("a", class_="event-link")
+        name = name_tag.get_text(strip=True) if name_tag else ""
+        link = link_tag.get("href", "") if link_tag else ""
+        if not name or not link:
+            continue
+        start_tag = event.find("meta", itemprop="startDate")
+        end_tag = event.find("meta", itemprop="endDate")
+        location_tag = event.find("div", class_="event-location")
+        city_tag = location_tag.find("span", itemprop="city") if location_tag else None
+        state_tag = location_tag.find("span", itemprop="state") if location_tag else None
+        format_tag = event.find("div", class_="event-hybrid-notes")
+        in_person = format_tag and format_tag.get_text(strip=True) == "In-Person Only"
+        city = city_tag.get_text(strip=True) if city_tag else ""
+        state = state_tag.get_text(strip=True) if state_tag else ""
+        results.append(
+            (
+                name,
+                link,
+                start_tag["content"] if start_tag else "",
+                end_tag["content"] if end_tag else "",
+                f"{city}, {state}" if in_person else "Everywhere",
+                "Offline" if in_person else "Online",
+            )
+        )
+    return results
+
+
+@pytest.mark.parametrize("parser", ["html.parser", "lxml"])
+def test_fast_path_matches_full_html_parser(season_page, parser, monkeypatch):
+    if parser == "lxml":
+        pytest.importorskip("lxml")
+    monkeypatch.setattr(mlh, "FAST_PARSER", parser)
+
+    fast = parse(season_page, fast=True)
+
+    assert len(fast) == 40
+    assert fast == parse(season_page, fast=False)
+    assert [
+        (h["title"], h["url"], str(h["start_date"]), str(h["end_date"]), h["location"], h["mode"])
+        for h in fast
+    ] == parse_with_finds(season_page)
+
+
+def test_card_fields_are_read_from_the_right_elements():
+    html = """
+    <div class="event">
+      <span itemprop="city">Not the venue</span>
+      <a class="event-link" href="https://hack.example.com/"><h3 class="event-name">Hack</h3></a>
+      <meta class="startDate" content="2031-01-01">
+      <meta itemprop="startDate" content="2031-02-01"><meta itemprop="endDate" content="2031-02-03">
+      <div class="event-location">
+        <span class="city">Not the city</span>
+        <span itemprop="city">Boston</span><span itemprop="state">MA</span>
+      </div>
+      <div class="event-hybrid-notes">In-Person Only</div>
+    </div>"""
+
+    [hackathon] = mlh.parse_season_page(html)
+
+    # Like location_tag.find(...), the first city inside the location block counts
+    assert hackathon.location == "Boston, MA"
+    assert hackathon.mode == "Offline"
+    # A class named like an itemprop is not the itemprop
+    assert hackathon.start_date.isoformat() == "2031-02-01"
+
+
+def test_a_city_outside_the_location_block_is_ignored():
+    html = """
+    <div class="event">
+      <span itemprop="city">Not the venue</span>
+      <a class="event-link" href="https://hack.example.com/"><h3 class="event-name">Hack</h3></a>
+      <meta itemprop="startDate" content="2031-02-01"><meta itemprop="endDate" content="2031-02-03">
+      <div class="event-location"><span itemprop="state">MA</span></div>
+      <div class="event-hybrid-notes">In-Person Only</div>
+    </div>"""
+
+    [hackathon] = mlh.parse_season_page(html)
+
+    assert hackathon.location == ", MA"
+
+
+def test_falls_back_to_full_parse_when_fast_path_finds_nothing(monkeypatch):
+    calls = []
+    real_soup = mlh.BeautifulSoup
+
+    def spy(html, parser, **kwargs):
+        calls.append((parser, "parse_only" in kwargs))
+        return real_soup(html, parser, **kwargs)
+
+    monkeypatch.setattr(mlh, "BeautifulSoup", spy)
+
+    assert mlh.find_event_divs("<html><body><p>Maintenance</p></body></html>") == []
+    assert calls == [(mlh.FAST_PARSER, True), ("html.parser", False)]
+
+
+def test_seasons_cover_the_running_and_the_next_one():
+    from datetime import date
+
+    assert mlh.mlh_seasons(date(2026, 3, 1)) == [2026, 2027]
+
+
+def test_scraper_cookies_and_user_agent_survive_a_restart(tmp_path, monkeypatch):
+    path = str(tmp_path / "cookies.json")
+    monkeypatch.setattr(mlh, "MLH_COOKIE_FILE", path)
+    monkeypatch.setattr(mlh, "_scraper", None)
+
+    scraper = mlh.get_scraper()
+    assert mlh.get_scraper() is scraper
+    scraper.cookies.set("cf_clearance", "solved", domain=".mlh.io", path="/")
+    mlh.save_cookies(scraper, path)
+
+    monkeypatch.setattr(mlh, "_scraper", None)
+    restarted = mlh.get_scraper()
+
+    assert restarted is not scraper
+    assert restarted.cookies.get("cf_clearance", domain=".mlh.io") == "solved"
+    assert restarted.headers["User-Agent"] == scraper.headers["User-Agent"]
+
+
+def test_cookie_file_is_private_and_replaces_a_symlink(tmp_path, monkeypatch):
+    target = tmp_path / "elsewhere.txt"
+    target.write_text("untouched")
+    path = tmp_path / "cache" / "cookies.json"
+    path.parent.mkdir()
+    path.symlink_to(target)
+    monkeypatch.setattr(mlh, "_scraper", None)
+    scraper = mlh.get_scraper()
+    scraper.cookies.set("cf_clearance", "solved", domain=".mlh.io", path="/")
+
+    mlh.save_cookies(scraper, str(path))
+
+    assert target.read_text() == "untouched"
+    assert not path.is_symlink()
+    assert path.stat().st_mode & 0o777 == 0o600
+    assert [p.name for p in path.parent.iterdir()] == ["cookies.json"]
+
+
+def test_an_outage_of_every_season_fails_the_scrape(tmp_path, monkeypatch):
+    def transport(session, method, url, **kwargs):
+        if "2027" in url:
+            raise requests.ConnectionError("mlh.io is down")
+        return SimpleNamespace(status_code=200, text="<html></html>")
+
+    monkeypatch.setattr(mlh, "mlh_seasons", lambda: [2026, 2027])
+    monkeypatch.setattr(mlh, "MLH_COOKIE_FILE", str(tmp_path / "cookies.json"))
+    with http.use_transport(transport):
+        assert mlh.scrape_mlh_events() == []
+
+    monkeypatch.setattr(mlh, "mlh_seasons", lambda: [2027])
+    with http.use_transport(transport), pytest.raises(requests.ConnectionError):
+        mlh.scrape_mlh_events()
+
+
+def test_a_challenge_page_fails_the_season_and_threads_get_their_own_session(tmp_path, monkeypatch):
+    sessions = []
+
+    def transport(session, method, url, **kwargs):
+        sessions.append(session)
+        session.cookies.set("cf_clearance", "solved", domain=".mlh.io", path="/")
+        return SimpleNamespace(status_code=403, text="<html>Just a moment...</html>")
+
+    monkeypatch.setattr(mlh, "_scraper", None)
+    monkeypatch.setattr(mlh, "mlh_seasons", lambda: [2026, 2027])
+    monkeypatch.setattr(mlh, "MLH_COOKIE_FILE", str(tmp_path / "cookies.json"))
+    with http.use_transport(transport), pytest.raises(requests.HTTPError):
+        mlh.scrape_mlh_events()
+
+    scraper = mlh.get_scraper()
+    assert len({id(session) for session in sessions}) == 2
+    assert scraper not in sessions
+    assert scraper.cookies.get("cf_clearance", domain=".mlh.io") == "solved"
@@ -0,0 +1,69 @@
+import multiprocessing
+import os
+from concurrent.futures import Future
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("bs4")
+pytest.importorskip("pydantic")
+
+from adapters import http, parsing
+from adapters.devpost import fetch_devpost_hackathons
+from adapters.replay import Replayer
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+
+@pytest.fixture
+def process_pool(monkeypatch):
+    monkeypatch.setattr(parsing, "PARSE_PROCESSES", 2)
+    monkeypatch.setattr(parsing, "_pool", None)
+    yield
+    if parsing._pool is not None:
+        parsing._pool.shutdown()
+
+
+def crash_in_worker(payload):
+    """Kill the worker process it runs in, like the OOM killer; upper-case in the parent."""
+    if multiprocessing.parent_process() is not None:
+        os._exit(1)
+    return payload.upper()
+
+
+def fetch_devpost():
+    with http.use_transport(Replayer.load(FIXTURES / "devpost.json.gz")):
+        return fetch_devpost_hackathons()
+
+
+def test_pages_parsed_in_worker_processes_match_in_thread_parsing(process_pool):
+    pooled = fetch_devpost()
+
+    assert parsing._pool is not None
+    parsing.PARSE_PROCESSES = 0
+    assert [h.model_dump() for h in pooled] == [h.model_dump() for h in fetch_devpost()]
+
+
+def test_without_a_pool_parsing_runs_in_the_calling_thread(monkeypatch):
+    monkeypatch.setattr(parsing, "PARSE_PROCESSES", 0)
+
+    future = parsing.submit(len, "abc")
+
+    assert future.done() and parsing.result(future) == 3
+    assert parsing.parse_pool() is None
+
+
+def test_waiting_for_a_parse_stops_at_the_run_deadline():
+    with http.deadline_scope(http.Deadline(0.05)):
+        with pytest.raises(http.RunCancelledError):
+            parsing.result(Future())
+
+
+def test_a_dead_worker_falls_back_to_this_thread_and_a_new_pool(process_pool):
+    broken = parsing.parse_pool()
+
+    assert parsing.result(parsing.submit(crash_in_worker, "abc")) == "ABC"
+    assert parsing._pool is None
+    # The broken pool is gone, so later parses work in a fresh one again
+    assert parsing.result(parsing.submit(len, "abcd")) == 4
+    assert parsing._pool is not None and parsing._pool is not broken
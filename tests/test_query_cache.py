@@ -0,0 +1,107 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+from sqlalchemy.exc import SQLAlchemyError
+
+from backend.cache import QueryCache, cached_query
+
+
+class FakeSession:
+    def __contains__(self, obj):
+        return False
+
+    def rollback(self):
+        pass
+
+
+def test_cached_query_hits_on_normalized_arguments():
+    cache = QueryCache(maxsize=8, ttl=60)
+    calls = []
+
+    @cached_query(cache=cache)
+    def search(db, keyword, limit=3):
+        calls.append((keyword, limit))
+        return [SimpleNamespace(title=keyword)]
+
+    first = search(FakeSession(), "AI")
+    second = search(FakeSession(), "  ai ", limit=3)
+
+    assert first is second
+    assert calls == [("AI", 3)]
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.5
+    assert stats["approx_bytes"] > 0
+
+
+def test_bump_generation_invalidates_entries():
+    cache = QueryCache(maxsize=8, ttl=60)
+    calls = []
+
+    @cached_query(cache=cache)
+    def upcoming(db, days=7):
+        calls.append(days)
+        return []
+
+    upcoming(FakeSession(), 7)
+    cache.bump_generation()
+    upcoming(FakeSession(), 7)
+
+    assert calls == [7, 7]
+    assert cache.stats()["generation"] == 1
+
+
+def test_entry_computed_during_ingestion_is_not_stored():
+    cache = QueryCache(maxsize=8, ttl=60)
+    cache.set("key", ["stale"], generation=cache.generation - 1)
+
+    assert cache.get("key") == (False, None)
+
+
+def test_lru_eviction_and_ttl(monkeypatch):
+    now = {"t": 100.0}
+    monkeypatch.setattr("backend.cache.time.monotonic", lambda: now["t"])
+    cache = QueryCache(maxsize=2, ttl=10)
+
+    cache.set("a", [1], cache.generation)
+    cache.set("b", [2], cache.generation)
+    cache.get("a")
+    cache.set("c", [3], cache.generation)
+
+    assert cache.get("b") == (False, None)
+    assert cache.get("a") == (True, [1])
+    assert cache.stats()["evictions"] == 1
+
+    now["t"] += 11
+    assert cache.get("a") == (False, None)
+
+
+def test_database_errors_are_not_cached():
+    cache = QueryCache(maxsize=8, ttl=60)
+    attempts = {"count": 0}
+
+    @cached_query(cache=cache)
+    def flaky(db, keyword):
+        attempts["count"] += 1
+        if attempts["count"] == 1:
+            raise SQLAlchemyError("connection reset")
+        return ["ok"]
+
+    assert flaky(FakeSession(), "web3") == []
+    assert flaky(FakeSession(), "web3") == ["ok"]
+    assert flaky(FakeSession(), "web3") == ["ok"]
+    assert attempts["count"] == 2
+
+
+def test_metrics_hook_receives_stats():
+    cache = QueryCache(maxsize=8, ttl=60)
+    seen = []
+    cache.add_metrics_hook(seen.append)
+
+    cache.get("missing")
+
+    assert seen[-1]["misses"] == 1
+    assert seen[-1]["entries"] == 0
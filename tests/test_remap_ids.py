@@ -0,0 +1,69 @@
+import hashlib
+from datetime import date
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+from sqlalchemy.orm import Session
+
+from adapters.ids import hackathon_id, native_key_from_url
+from backend import crud
+from backend.db import Base
+from backend.models import HackathonDB
+from backend.remap_ids import remap_hackathon_ids
+from backend.schemas import Hackathon
+
+
+def test_native_key_from_url():
+    assert native_key_from_url("devfolio", "https://ethindia.devfolio.co/") == "ethindia"
+    assert native_key_from_url("dorahacks", "https://dorahacks.io/hackathon/bnb/detail") == "bnb"
+    assert (
+        native_key_from_url("unstop", "https://unstop.com/hackathons/code-sprint-iit-1234567")
+        == "1234567"
+    )
+    assert (
+        native_key_from_url("mlh", "https://www.HackMIT.org/?utm_source=mlh&utm_medium=referral")
+        == "hackmit.org"
+    )
+    assert native_key_from_url("unstop", "https://unstop.com/hackathons") is None
+
+
+def make_hackathon(id, title, **overrides):
+    fields = dict(
+        id=id,
+        title=title,
+        start_date=date(2026, 6, 1),
+        end_date=date(2026, 6, 3),
+        location="Everywhere",
+        url="https://ethindia.devfolio.co/",
+        mode="Online",
+        status="open",
+        source="devfolio",
+    )
+    fields.update(overrides)
+    return Hackathon(**fields)
+
+
+def test_remap_merges_title_keyed_copies(pg_connection):
+    Base.metadata.create_all(pg_connection)
+    db = Session(bind=pg_connection)
+    old_id = hashlib.sha256(b"ETHIndia").hexdigest()
+    renamed_id = hashlib.sha256(b"ETHIndia 2026").hexdigest()
+    new_id = hackathon_id("devfolio", "ethindia")
+
+    crud.upsert_hackathon(db, make_hackathon(old_id, "ETHIndia"))
+    crud.upsert_hackathon(db, make_hackathon(renamed_id, "ETHIndia 2026"))
+    crud.upsert_hackathon(db, make_hackathon(renamed_id, "ETHIndia 2026", status="ended"))
+    crud.upsert_hackathon(
+        db, make_hackathon("dp-1", "ETHIndia", source="devpost", url="https://x.devpost.com")
+    )
+    crud.mark_duplicates(db, "dp-1", [old_id])
+
+    assert remap_hackathon_ids(db) == {"remapped": 1, "merged": 1}
+
+    rows = {row.id: row for row in db.query(HackathonDB).all()}
+    assert set(rows) == {new_id, "dp-1"}
+    assert rows[new_id].status == "ended"
+    assert rows[new_id].duplicate_of == "dp-1"
+    assert [c.hackathon_id for c in crud.get_hackathon_changes(db)] == [new_id]
+    assert remap_hackathon_ids(db) == {"remapped": 0, "merged": 0}
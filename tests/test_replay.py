@@ -0,0 +1,310 @@
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+requests = pytest.importorskip("requests")
+pytest.importorskip("bs4")
+pytest.importorskip("pydantic")
+
+from adapters import http, load_adapter
+from adapters.replay import Recorder, Replayer, ReplayMissError, load_fixture
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry(monkeypatch):
+    monkeypatch.setattr(http, "_breakers", {})
+    monkeypatch.setattr(http, "_limiters", {})
+
+
+def replay(source_target, fixture):
+    with http.use_transport(Replayer.load(FIXTURES / fixture)):
+        return load_adapter(source_target)()
+
+
+def test_recorded_exchanges_replay_offline(tmp_path, monkeypatch):
+    def fake_send(session, method, url, timeout=None, **kwargs):
+        return SimpleNamespace(
+            status_code=200,
+            headers={"Content-Type": "application/json", "Set-Cookie": "secret"},
+            content=b'{"result": [1, 2]}',
+        )
+
+    monkeypatch.setattr(http, "send", fake_send)
+    recorder = Recorder()
+    with http.use_transport(recorder):
+        http.get("https://api.devfolio.co/api/hackathons", params={"page": 1})
+    recorder.save(tmp_path / "devfolio.json.gz", "Devfolio")
+
+    [exchange] = load_fixture(tmp_path / "devfolio.json.gz")
+    assert exchange["url"] == "https://api.devfolio.co/api/hackathons?page=1"
+    assert exchange["headers"] == {"Content-Type": "application/json"}
+
+    monkeypatch.setattr(http, "send", pytest.fail)
+    with http.use_transport(Replayer.load(tmp_path / "devfolio.json.gz")):
+        response = http.get("https://api.devfolio.co/api/hackathons", params={"page": 1})
+        assert response.json() == {"result": [1, 2]}
+        with pytest.raises(ReplayMissError):
+            http.get("https://api.devfolio.co/api/hackathons", params={"page": 1})
+
+
+def test_unrecorded_paths_are_never_answered_with_another_response():
+    base = "https://dorahacks.io/api/hackathon/"
+    replayer = Replayer(
+        [
+            {
+                "method": "GET",
+                "url": f"{base}?page=1&status=upcoming",
+                "status": 200,
+                "text": "LIST1",
+            },
+            {"method": "GET", "url": f"{base}a/", "status": 200, "text": "A"},
+        ]
+    )
+    with http.use_transport(replayer):
+        with pytest.raises(ReplayMissError):
+            http.get(f"{base}b/")
+        assert http.get(f"{base}a/").text == "A"
+        assert http.get(base, params={"page": 1, "status": "upcoming"}).text == "LIST1"
+
+
+@pytest.mark.parametrize(
+    "target, fixture, count",
+    [
+        ("adapters.devpost:fetch_devpost_hackathons", "devpost.json.gz", 27),
+        ("adapters.unstop:fetch_unstop_hackathons", "unstop.json.gz", 20),
+        ("adapters.devfolio:fetch_devfolio_hackathons", "devfolio.json.gz", 12),
+        ("adapters.dorahacks:fetch_dorahacks_hackathons", "dorahacks.json.gz", 40),
+        ("adapters.hack2skill:fetch_hack2skill_hackathons", "hack2skill.json.gz", 300),
+    ],
+)
+def test_adapters_parse_their_replayed_responses(target, fixture, count):
+    hackathons = replay(target, fixture)
+
+    assert len(hackathons) == count
+    assert len({h.id for h in hackathons}) == count
+    assert all(h.start_date <= h.end_date for h in hackathons)
+
+
+def test_a_different_date_window_still_gets_the_recorded_page():
+    url = "https://vision.hack2skill.com/api/v1/innovator/public/event/public-list"
+    replayer = Replayer(
+        [
+            {
+                "method": "GET",
+                "url": f"{url}?page={page}&records=50",
+                "status": 200,
+                "text": str(page),
+            }
+            for page in (1, 2, 3)
+        ]
+    )
+    with http.use_transport(replayer):
+        assert http.get(url, params={"page": 3, "records": 50, "start": "today"}).text == "3"
+        # Page 9 was not recorded; another page must not stand in for it
+        with pytest.raises(ReplayMissError):
+            http.get(url, params={"page": 9, "records": 50, "start": "today"})
+
+
+def test_hack2skill_pages_one_by_one_without_a_total():
+    exchanges = load_fixture(FIXTURES / "hack2skill.json.gz")
+    for exchange in exchanges:
+        body = json.loads(exchange["text"])
+        del body["totalCount"]
+        exchange["text"] = json.dumps(body)
+
+    with http.use_transport(Replayer(exchanges)):
+        hackathons = load_adapter("adapters.hack2skill:fetch_hack2skill_hackathons")()
+
+    assert len({h.id for h in hackathons}) == 300
+
+
+def test_hack2skill_reads_no_more_than_max_pages_whatever_the_total(monkeypatch):
+    from adapters import hack2skill
+
+    exchanges = load_fixture(FIXTURES / "hack2skill.json.gz")
+    for exchange in exchanges:
+        body = json.loads(exchange["text"])
+        body["totalCount"] = 10**9
+        exchange["text"] = json.dumps(body)
+    requested = []
+    replayer = Replayer(exchanges)
+
+    def transport(session, method, url, **kwargs):
+        requested.append(kwargs["params"]["page"])
+        return replayer(session, method, url, **kwargs)
+
+    monkeypatch.setattr(hack2skill, "MAX_PAGES", 3)
+    with http.use_transport(transport):
+        hackathons = hack2skill.fetch_hack2skill_hackathons()
+
+    assert sorted(requested) == [1, 2, 3]
+    assert len(hackathons) == 150
+
+
+def test_mlh_merges_the_running_and_next_season(tmp_path, monkeypatch):
+    pytest.importorskip("cloudscraper")
+    from adapters import mlh
+
+    monkeypatch.setattr(mlh, "_scraper", None)
+    monkeypatch.setattr(mlh, "MLH_COOKIE_FILE", str(tmp_path / "cookies.json"))
+    monkeypatch.setattr(mlh, "mlh_seasons", lambda: [2030, 2031])
+    hackathons = replay("adapters.mlh:scrape_mlh_events", "mlh.json.gz")
+
+    # 40 on the next season's page, 10 more on the running one, 5 listed on both
+    assert len(hackathons) == 50
+    first = next(h for h in hackathons if h.title == "MLH Hack 0")
+    assert (first.mode, first.location) == ("Offline", "Boston, MA")
+
+
+def test_devfolio_prizes_come_from_the_prize_calls():
+    hackathons = replay("adapters.devfolio:fetch_devfolio_hackathons", "devfolio.json.gz")
+
+    assert hackathons[0].prize_pool == "- Best Overall: $1000\n- Best Hardware Hack"
+
+
+def test_devpost_pages_until_the_first_page_without_open_hackathons(monkeypatch):
+    from adapters import devpost
+
+    recorder = Recorder(Replayer.load(FIXTURES / "devpost.json.gz"))
+    with http.use_transport(recorder):
+        hackathons = devpost.fetch_devpost_hackathons()
+
+    assert len(hackathons) == 27
+    assert all(h.status != "ended" for h in hackathons)
+    # Page 4 is the first ended one; at most 5 and 6 were requested ahead of it
+    pages = sorted(int(e["url"].rpartition("=")[2]) for e in recorder.exchanges)
+    assert pages[:4] == [1, 2, 3, 4]
+    assert max(pages) <= 6
+
+    monkeypatch.setattr(devpost, "DEVPOST_MAX_PAGES", 2)
+    with http.use_transport(Replayer.load(FIXTURES / "devpost.json.gz")):
+        assert len(devpost.fetch_devpost_hackathons()) == 18
+
+
+def test_devpost_keeps_paging_past_a_broken_or_invalid_page():
+    from adapters import devpost
+
+    exchanges = load_fixture(FIXTURES / "devpost.json.gz")
+    exchanges[0] = {**exchanges[0], "text": "<html>Bad gateway</html>"}
+    page_2 = json.loads(exchanges[1]["text"])
+    for item in page_2["hackathons"]:
+        item["title"] = None
+    exchanges[1] = {**exchanges[1], "text": json.dumps(page_2)}
+
+    with http.use_transport(Replayer(exchanges)):
+        hackathons = devpost.fetch_devpost_hackathons()
+
+    # Only page 3 is left of the 27 open hackathons; pages 1 and 2 hold 18
+    assert len(hackathons) == 9
+
+
+def test_dorahacks_looks_up_missing_prizes_once(monkeypatch):
+    from adapters import dorahacks
+
+    monkeypatch.setattr(dorahacks, "DORAHACKS_PRIZE_DETAILS", True)
+    monkeypatch.setattr(dorahacks, "_prize_cache", {})
+    # Online requests are rate limited; these only pretend to reach the site
+    monkeypatch.setattr(http, "_limiters", {"dorahacks.io": http.TokenBucket(1000, 1000)})
+    sent = []
+
+    def live_site(session, method, url, **kwargs):
+        # An online transport, as replays leave the prize cache alone
+        sent.append(url)
+        return replayer(session, method, url, **kwargs)
+
+    replayer = Replayer.load(FIXTURES / "dorahacks.json.gz")
+    with http.use_transport(live_site):
+        hackathons = dorahacks.fetch_dorahacks_hackathons()
+
+    prizes = {h.title: h.prize_pool for h in hackathons}
+    assert prizes["DoraHacks Buidl 0"] == "- Total: 5000 USDT"
+    assert prizes["DoraHacks Buidl 1"] == "- Total: 10001 USD"
+    assert sum("/dora-hack-" in url for url in sent) == 20
+
+    # A second run reuses the cached prizes, but still records their responses
+    sent.clear()
+    replayer = Replayer.load(FIXTURES / "dorahacks.json.gz")
+    recorder = Recorder(live_site)
+    with http.use_transport(recorder):
+        assert len(dorahacks.fetch_dorahacks_hackathons()) == 40
+    assert not any("/dora-hack-" in url for url in sent)
+    assert sum("/dora-hack-" in e["url"] for e in recorder.exchanges) == 20
+
+
+@pytest.fixture
+def kaggle(monkeypatch):
+    from adapters import kaggle
+
+    monkeypatch.setattr(kaggle, "_auth", None)
+    monkeypatch.setattr(kaggle, "_cache", None)
+    monkeypatch.setenv("KAGGLE_USERNAME", "someone")
+    monkeypatch.setenv("KAGGLE_KEY", "secret")
+    return kaggle
+
+
+def test_kaggle_pages_until_the_first_page_without_open_competitions(kaggle):
+    recorder = Recorder(Replayer.load(FIXTURES / "kaggle.json.gz"))
+    with http.use_transport(recorder):
+        hackathons = kaggle.fetch_kaggle_competitions()
+
+    assert len({h.id for h in hackathons}) == 50
+    assert hackathons[0].tags == ["AI", "Web3"]
+    pages = sorted(int(e["url"].rpartition("=")[2]) for e in recorder.exchanges)
+    assert pages[:4] == [1, 2, 3, 4]
+    assert max(pages) <= 6
+
+
+def test_kaggle_reuses_its_result_within_the_cache_ttl(kaggle, monkeypatch):
+    replayer = Replayer.load(FIXTURES / "kaggle.json.gz")
+    # Online requests are rate limited; these only pretend to reach the site
+    monkeypatch.setattr(http, "_limiters", {"kaggle.com": http.TokenBucket(1000, 1000)})
+
+    def live_site(session, method, url, **kwargs):
+        return replayer(session, method, url, **kwargs)
+
+    with http.use_transport(live_site):
+        first = kaggle.fetch_kaggle_competitions()
+
+    monkeypatch.setattr(http, "send", pytest.fail)
+    assert kaggle.fetch_kaggle_competitions() == first
+
+    # A replay, as in a reparse, reads the archived pages instead of the cache
+    recorder = Recorder(Replayer.load(FIXTURES / "kaggle.json.gz"))
+    with http.use_transport(recorder):
+        assert len(kaggle.fetch_kaggle_competitions()) == 50
+    assert recorder.exchanges
+
+    monkeypatch.setattr(kaggle, "KAGGLE_CACHE_SECONDS", 0)
+    replayer = Replayer.load(FIXTURES / "kaggle.json.gz")
+    with http.use_transport(live_site):
+        assert len(kaggle.fetch_kaggle_competitions()) == 50
+
+
+def test_kaggle_without_credentials_is_not_configured(kaggle, monkeypatch, tmp_path):
+    from adapters import SourceNotConfiguredError
+
+    monkeypatch.delenv("KAGGLE_USERNAME")
+    monkeypatch.delenv("KAGGLE_API_TOKEN", raising=False)
+    monkeypatch.setenv("KAGGLE_CONFIG_DIR", str(tmp_path))
+    monkeypatch.setattr(http, "send", pytest.fail)
+
+    with pytest.raises(SourceNotConfiguredError):
+        kaggle.fetch_kaggle_competitions()
+
+
+def test_kaggle_stops_when_the_credentials_are_rejected(kaggle):
+    requested = []
+
+    def transport(session, method, url, **kwargs):
+        requested.append(url)
+        return SimpleNamespace(status_code=401, text="", json=lambda: {})
+
+    with http.use_transport(transport), pytest.raises(kaggle.KaggleAuthError):
+        kaggle.fetch_kaggle_competitions()
+
+    # Only the lookahead pages already on their way were requested
+    assert len(requested) <= kaggle.LOOKAHEAD
@@ -0,0 +1,94 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+from sqlalchemy.orm import Session
+
+from backend import crud, scheduling
+from backend.db import Base
+
+NOW = datetime(2026, 6, 1, 12, tzinfo=timezone.utc)
+HOUR = 3600
+
+
+def make_schedule(interval=6 * HOUR, rate=1.0, next_run_at=NOW):
+    return SimpleNamespace(interval_seconds=interval, activity_rate=rate, next_run_at=next_run_at)
+
+
+def test_busy_source_is_polled_more_often_down_to_the_minimum():
+    schedule = make_schedule()
+    for _ in range(10):
+        interval, rate, next_run_at = scheduling.next_schedule(schedule, 8, 2.0, True, NOW)
+        schedule = make_schedule(interval, rate)
+
+    assert interval == scheduling.SOURCE_INTERVAL_MIN
+    assert next_run_at == NOW + timedelta(seconds=interval)
+
+
+def test_quiet_source_backs_off_up_to_the_maximum():
+    schedule = make_schedule(rate=0.0)
+    intervals = []
+    for _ in range(10):
+        interval, rate, _ = scheduling.next_schedule(schedule, 0, 2.0, True, NOW)
+        intervals.append(interval)
+        schedule = make_schedule(interval, rate)
+
+    assert intervals[0] == 9 * HOUR
+    assert intervals == sorted(intervals)
+    assert intervals[-1] == scheduling.SOURCE_INTERVAL_MAX
+
+
+def test_slow_source_gets_a_higher_floor():
+    assert scheduling.adapt_interval(HOUR, rate=50.0, duration=120.0) == 120 * 60
+
+
+def test_failed_run_keeps_interval_and_rate():
+    schedule = make_schedule(interval=2 * HOUR, rate=3.0)
+
+    assert scheduling.next_schedule(schedule, 0, 0.0, False, NOW) == (
+        2 * HOUR,
+        3.0,
+        NOW + timedelta(hours=2),
+    )
+
+
+def test_unknown_or_elapsed_sources_are_due():
+    assert scheduling.is_due(None, NOW)
+    assert scheduling.is_due(make_schedule(next_run_at=NOW), NOW)
+    assert not scheduling.is_due(make_schedule(next_run_at=NOW + timedelta(minutes=1)), NOW)
+
+
+def test_source_schedule_roundtrip(pg_connection):
+    Base.metadata.create_all(pg_connection)
+    db = Session(bind=pg_connection)
+
+    crud.save_source_schedule(db, "Unstop", interval_seconds=HOUR, next_run_at=NOW)
+    crud.save_source_schedule(db, "Unstop", interval_seconds=2 * HOUR, activity_rate=0.5)
+
+    schedule = crud.get_source_schedules(db)["Unstop"]
+    assert (schedule.interval_seconds, schedule.activity_rate) == (2 * HOUR, 0.5)
+    assert schedule.next_run_at == NOW
+
+
+def test_restart_waits_for_the_next_tick_after_a_recent_scrape():
+    tick = timedelta(minutes=scheduling.SCRAPE_TICK_MINUTES)
+
+    assert scheduling.first_tick_at(None, NOW) == NOW
+    assert scheduling.first_tick_at(NOW - 2 * tick, NOW) == NOW
+    assert scheduling.first_tick_at(NOW - tick / 3, NOW) == NOW + tick * 2 / 3
+
+
+def test_last_successful_scrape_ignores_failed_runs(pg_connection):
+    Base.metadata.create_all(pg_connection)
+    db = Session(bind=pg_connection)
+    assert crud.get_last_successful_scrape(db) is None
+
+    for minutes_ago, ok in ((30, True), (10, False)):
+        finished_at = NOW - timedelta(minutes=minutes_ago)
+        crud.add_scrape_run(
+            db, started_at=finished_at, finished_at=finished_at, sources=["MLH"], ok=ok
+        )
+
+    assert crud.get_last_successful_scrape(db) == NOW - timedelta(minutes=30)
@@ -3,7 +3,7 @@ from datetime import date
 import pytest
 
 pytest.importorskip("pydantic")
-from backend.schemas import Hackathon
+from backend.schemas import Hackathon, construct_hackathons, validate_hackathons
 
 
 def test_hackathon_splits_and_normalizes_tags_from_string():
@@ -38,3 +38,48 @@ def test_hackathon_keeps_tags_list_as_is():
     )
 
     assert hack.tags == ["ml", "iot"]
+
+
+def make_row(i, **overrides):
+    return {
+        "id": f"row-{i}",
+        "title": f"Hack {i}",
+        "start_date": "2026-04-01",
+        "end_date": date(2026, 4, 3),
+        "location": "Everywhere",
+        "url": f"https://example.com/{i}",
+        "mode": "Online",
+        "status": "Open",
+        "source": "devpost",
+        "tags": "AI, Web3",
+        **overrides,
+    }
+
+
+def test_batch_validation_reports_bad_rows_without_dropping_the_others():
+    rows = [make_row(0), make_row(1, start_date=None), make_row(2), make_row(3, title=None)]
+
+    hackathons, errors = validate_hackathons(rows)
+
+    assert [h.id for h in hackathons] == ["row-0", "row-2"]
+    assert hackathons[0].start_date == date(2026, 4, 1)
+    assert hackathons[0].tags == ["ai", "web3"]
+    assert [index for index, _ in errors] == [1, 3]
+    assert errors[0][1].errors()[0]["loc"] == ("start_date",)
+
+
+def test_batch_validation_matches_one_by_one_construction():
+    rows = [make_row(i) for i in range(5)]
+
+    assert validate_hackathons(rows) == ([Hackathon(**row) for row in rows], [])
+
+
+def test_trusted_construction_skips_validation_but_fills_defaults():
+    row = make_row(0, start_date=date(2026, 4, 1), tags=["ai"])
+    del row["tags"]
+
+    [hackathon] = construct_hackathons([row])
+
+    assert hackathon.start_date == date(2026, 4, 1)
+    assert hackathon.tags == [] and hackathon.banner_url is None
+    assert construct_hackathons([make_row(1)])[0].tags == "AI, Web3"  # not normalized
@@ -0,0 +1,97 @@
+import asyncio
+import importlib.util
+from datetime import date
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("telegram")
+
+
+def load_bot_module():
+    # Loaded by path because of the hyphenated file name. Importing it must not need a
+    # database: schema creation happens in main().
+    module_path = Path(__file__).resolve().parents[1] / "telegram-bot.py"
+    spec = importlib.util.spec_from_file_location("telegram_bot", module_path)
+    module = importlib.util.module_from_spec(spec)
+    assert spec and spec.loader
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_row(index):
+    return SimpleNamespace(
+        id=f"id-{index}",
+        title=f"Hack <{index}>",
+        start_date=date(2026, 5, index),
+        end_date=date(2026, 5, index + 2),
+        source="devpost",
+        mode="Online",
+        url=f"https://example.com/{index}",
+    )
+
+
+def test_format_hackathon_page_numbers_entries_and_shows_navigation():
+    module = load_bot_module()
+    state = {"token": "abc", "header": "Results", "page": 1, "page_size": 2}
+    page = SimpleNamespace(items=[make_row(3), make_row(4)], has_prev=True, has_next=False)
+
+    text, reply_markup = module.format_hackathon_page(state, page)
+
+    assert "(page 2)" in text
+    assert "<b>3. Hack &lt;3&gt;</b>" in text
+    assert "<b>4. Hack &lt;4&gt;</b>" in text
+    buttons = reply_markup.inline_keyboard[0]
+    assert [b.callback_data for b in buttons] == ["browse:abc:prev"]
+
+
+def test_browse_callback_edits_message_with_next_page(monkeypatch):
+    module = load_bot_module()
+    calls = []
+
+    def fake_page(_db, arg, cursor=None, backwards=False, page_size=5):
+        calls.append((arg, cursor, backwards, page_size))
+        return SimpleNamespace(items=[make_row(5)], has_prev=True, has_next=False)
+
+    monkeypatch.setattr(module, "SessionLocal", lambda: SimpleNamespace(close=lambda: None))
+    monkeypatch.setitem(module.BROWSE_QUERIES, "upcoming", fake_page)
+    state = {
+        "token": "abc",
+        "kind": "upcoming",
+        "arg": 30,
+        "header": "Upcoming",
+        "page_size": 1,
+        "page": 0,
+        "first": (date(2026, 5, 4), "id-4"),
+        "last": (date(2026, 5, 4), "id-4"),
+    }
+    context = SimpleNamespace(chat_data={"browse": {"abc": state}})
+    query = SimpleNamespace(data="browse:abc:next", edit_message_text=AsyncMock())
+
+    asyncio.run(module.browse_callback(query, context))
+
+    assert calls == [(30, (date(2026, 5, 4), "id-4"), False, 1)]
+    assert state["page"] == 1
+    assert state["last"] == (date(2026, 5, 5), "id-5")
+    query.edit_message_text.assert_awaited_once()
+    assert "<b>2. Hack &lt;5&gt;</b>" in query.edit_message_text.await_args.args[0]
+
+
+def test_format_change_notice_reports_deadline_extension_and_latest_prize():
+    module = load_bot_module()
+    hackathon = SimpleNamespace(title="Hack & Ship", url="https://example.com/h")
+    changes = [
+        SimpleNamespace(field="end_date", old_value="2026-06-03", new_value="2026-06-10"),
+        SimpleNamespace(field="prize_pool", old_value="$1", new_value="$2"),
+        SimpleNamespace(field="prize_pool", old_value="$2", new_value="$3"),
+    ]
+
+    text, reply_markup = module.format_change_notice(hackathon, changes)
+
+    assert text.startswith("📢 <b>Update: Hack &amp; Ship</b>")
+    assert "Deadline extended:</b> June 03, 2026 → June 10, 2026" in text
+    assert "$3" in text and "$2" not in text
+    assert reply_markup.inline_keyboard[0][0].url == "https://example.com/h"
@@ -1,6 +1,5 @@
 import asyncio
 import importlib.util
-import sys
 from datetime import date
 from pathlib import Path
 from types import SimpleNamespace
@@ -9,31 +8,18 @@ from unittest.mock import AsyncMock
 import pytest
 
 pytest.importorskip("sqlalchemy")
-from sqlalchemy.sql.schema import MetaData
-
 pytest.importorskip("telegram")
 
 
 def load_channel_bot_module():
-    # telegram-channel-bot imports fetch_and_store, which runs create_all at import time.
-    # Patch it so tests do not require a live database server.
-    sys.modules.pop("fetch_and_store", None)
-
-    def monkeypatched_create_all(_self, bind=None):
-        return None
-
-    original_create_all = MetaData.create_all
-    MetaData.create_all = monkeypatched_create_all
-
+    # Loaded by path because of the hyphenated file name. Importing it must not need a
+    # database: schema creation happens in main().
     module_path = Path(__file__).resolve().parents[1] / "telegram-channel-bot.py"
     spec = importlib.util.spec_from_file_location("telegram_channel_bot", module_path)
     module = importlib.util.module_from_spec(spec)
     assert spec and spec.loader
-    try:
-        spec.loader.exec_module(module)
-        return module
-    finally:
-        MetaData.create_all = original_create_all
+    spec.loader.exec_module(module)
+    return module
 
 
 def make_hackathon(